@@ -17,10 +17,22 @@
 from importlib import metadata
 
 from .calendar_registry import get_calendar, get_calendar_names
-from .calendar_utils import convert_freq, date_range, mark_session, merge_schedules
+from .calendar_utils import (
+    SessionMarker,
+    convert_freq,
+    date_range,
+    date_range_iter,
+    mark_session,
+    mark_session_codes,
+    merge_schedules,
+    merge_sessions,
+)
 
 # TODO: is the below needed? Can I replace all the imports on the calendars with ".market_calendar"
 from .market_calendar import MarketCalendar
+from .market_clock import MarketClock
+from .schedule_cache import disable_schedule_cache, enable_schedule_cache
+from .trading_day_matrix import TradingDayMatrix, trading_day_matrix
 
 
 # if running in development there may not be a package
@@ -31,10 +43,19 @@ except metadata.PackageNotFoundError:
 
 __all__ = [
     "MarketCalendar",
+    "MarketClock",
+    "SessionMarker",
+    "TradingDayMatrix",
     "convert_freq",
     "date_range",
+    "date_range_iter",
+    "disable_schedule_cache",
+    "enable_schedule_cache",
     "get_calendar",
     "get_calendar_names",
     "mark_session",
+    "mark_session_codes",
     "merge_schedules",
+    "merge_sessions",
+    "trading_day_matrix",
 ]
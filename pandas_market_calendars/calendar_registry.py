@@ -1,48 +1,218 @@
-# ruff: noqa: F401, I001
-# Calendar imports register calendars via metaclass side-effect
+# Calendars register themselves via metaclass side-effect when their module is imported. Only the module
+# of a requested calendar is imported, so that the package starts fast and exchange_calendars, which is
+# needed for the mirrored calendars only, is not imported unless one of them is used or all names are listed.
 import datetime
+from functools import partial
+from importlib import import_module
 
 from .market_calendar import MarketCalendar
-from .calendars.asx import ASXExchangeCalendar
-from .calendars.bmf import BMFExchangeCalendar
-from .calendars.bse import BSEExchangeCalendar
-from .calendars.cboe import CFEExchangeCalendar
-from .calendars.cme import (
-    CMEEquityExchangeCalendar, CMEBondExchangeCalendar, CMETradeDateCalendar
-)
-from .calendars.cme_globex_base import CMEGlobexBaseExchangeCalendar
-from .calendars.cme_globex_agriculture import (
-    CMEGlobexAgricultureExchangeCalendar,
-    CMEGlobexLivestockExchangeCalendar,
-    CMEGlobexGrainsAndOilseedsExchangeCalendar,
-)
-from .calendars.cme_globex_crypto import CMEGlobexCryptoExchangeCalendar
-from .calendars.cme_globex_energy_and_metals import (
-    CMEGlobexEnergyAndMetalsExchangeCalendar,
-)
-from .calendars.cme_globex_equities import CMEGlobexEquitiesExchangeCalendar
-from .calendars.cme_globex_fx import CMEGlobexFXExchangeCalendar
-from .calendars.cme_globex_fixed_income import CMEGlobexFixedIncomeCalendar
-from .calendars.eurex import EUREXExchangeCalendar
-from .calendars.eurex_fixed_income import EUREXFixedIncomeCalendar
-from .calendars.forex import ForexExchangeCalendar
-from .calendars.hkex import HKEXExchangeCalendar
-from .calendars.ice import ICEExchangeCalendar
-from .calendars.iex import IEXExchangeCalendar
-from .calendars.jpx import JPXExchangeCalendar
-from .calendars.lse import LSEExchangeCalendar
-from .calendars.nyse import NYSEExchangeCalendar
-from .calendars.ose import OSEExchangeCalendar
-from .calendars.sifma import (
-    SIFMAUSExchangeCalendar,
-    SIFMAUKExchangeCalendar,
-    SIFMAJPExchangeCalendar,
-)
-from .calendars.six import SIXExchangeCalendar
-from .calendars.sse import SSEExchangeCalendar
-from .calendars.tase import TASEExchangeCalendar
-from .calendars.tsx import TSXExchangeCalendar
-from .calendars.mirror import *
+
+
+# Module in pandas_market_calendars.calendars: names (aliases) of the calendars it defines.
+# A new calendar needs to be added here to be found by get_calendar and get_calendar_names.
+# Any other name is looked up in the installed exchange_calendars, whose classes mirror.py creates.
+_CALENDAR_MODULES = {
+    "asx": ("ASX",),
+    "bmf": ("BMF", "B3"),
+    "bse": ("BSE", "NSE", "XNSE"),
+    "cboe": ("CFE", "CBOE_Futures", "CBOE_Equity_Options", "CBOE_Index_Options"),
+    "cme": (
+        "CME_TradeDate",
+        "CME_Equity",
+        "CBOT_Equity",
+        "CME_Agriculture",
+        "CBOT_Agriculture",
+        "COMEX_Agriculture",
+        "NYMEX_Agriculture",
+        "CME_Rate",
+        "CBOT_Rate",
+        "CME_InterestRate",
+        "CBOT_InterestRate",
+        "CME_Bond",
+        "CBOT_Bond",
+    ),
+    "cme_globex_base": (),
+    "cme_globex_agriculture": (
+        "CMEGlobex_Livestock",
+        "CMEGlobex_Live_Cattle",
+        "CMEGlobex_Feeder_Cattle",
+        "CMEGlobex_Lean_Hog",
+        "CMEGlobex_Port_Cutout",
+        "CMEGlobex_Grains",
+        "CMEGlobex_Oilseeds",
+    ),
+    "cme_globex_crypto": ("CME Globex Cryptocurrencies", "CME Globex Crypto"),
+    "cme_globex_energy_and_metals": (
+        "CMEGlobex_EnergyAndMetals",
+        "CMEGlobex_Energy",
+        "CMEGlobex_CrudeAndRefined",
+        "CMEGlobex_NYHarbor",
+        "CMEGlobex_HO",
+        "HO",
+        "CMEGlobex_Crude",
+        "CMEGlobex_CL",
+        "CL",
+        "CMEGlobex_Gas",
+        "CMEGlobex_RB",
+        "RB",
+        "CMEGlobex_MicroCrude",
+        "CMEGlobex_MCL",
+        "MCL",
+        "CMEGlobex_NatGas",
+        "CMEGlobex_NG",
+        "NG",
+        "CMEGlobex_Dutch_NatGas",
+        "CMEGlobex_TTF",
+        "TTF",
+        "CMEGlobex_LastDay_NatGas",
+        "CMEGlobex_NN",
+        "NN",
+        "CMEGlobex_CarbonOffset",
+        "CMEGlobex_CGO",
+        "CGO",
+        "C-GEO",
+        "CMEGlobex_NGO",
+        "NGO",
+        "CMEGlobex_GEO",
+        "GEO",
+        "CMEGlobex_Metals",
+        "CMEGlobex_PreciousMetals",
+        "CMEGlobex_Gold",
+        "CMEGlobex_GC",
+        "GC",
+        "CMEGlobex_Silver",
+        "CMEGlobex_SI",
+        "SI",
+        "CMEGlobex_Platinum",
+        "CMEGlobex_PL",
+        "PL",
+        "CMEGlobex_BaseMetals",
+        "CMEGlobex_Copper",
+        "CMEGlobex_HG",
+        "HG",
+        "CMEGlobex_Aluminum",
+        "CMEGlobex_ALI",
+        "ALI",
+        "CMEGlobex_QC",
+        "QC",
+        "CMEGlobex_FerrousMetals",
+        "CMEGlobex_HRC",
+        "HRC",
+        "CMEGlobex_BUS",
+        "BUS",
+        "CMEGlobex_TIO",
+        "TIO",
+    ),
+    "cme_globex_equities": ("CME Globex Equity",),
+    "cme_globex_fx": ("CMEGlobex_FX", "CME_FX", "CME_Currency"),
+    "cme_globex_fixed_income": ("CME Globex Fixed Income", "CME Globex Interest Rate Products"),
+    "eurex": ("EUREX",),
+    "eurex_fixed_income": ("EUREX_Bond",),
+    "forex": ("FOREX", "FX", "Forex"),
+    "hkex": ("HKEX",),
+    "ice": ("ICE", "ICEUS", "NYFE"),
+    "nyse": ("NYSE", "stock", "NASDAQ", "BATS", "DJIA", "DOW"),
+    "iex": ("IEX", "Investors_Exchange"),
+    "jpx": ("JPX", "XJPX"),
+    "lse": ("LSE",),
+    "ose": ("OSE",),
+    "sifma": (
+        "SIFMAUS",
+        "SIFMA_US",
+        "Capital_Markets_US",
+        "Financial_Markets_US",
+        "Bond_Markets_US",
+        "SIFMAUK",
+        "SIFMA_UK",
+        "Capital_Markets_UK",
+        "Financial_Markets_UK",
+        "Bond_Markets_UK",
+        "SIFMAJP",
+        "SIFMA_JP",
+        "Capital_Markets_JP",
+        "Financial_Markets_JP",
+        "Bond_Markets_JP",
+    ),
+    "six": ("SIX",),
+    "sse": ("SSE",),
+    "tase": ("TASE",),
+    "tsx": ("TSX", "TSXV"),
+}
+
+_CALENDAR_NAMES = {name: module for module, names in _CALENDAR_MODULES.items() for name in names}
+
+# Calendar classes that are accessible as attributes of this module: module in pandas_market_calendars.calendars.
+_CALENDAR_CLASSES = {
+    "ASXExchangeCalendar": "asx",
+    "BMFExchangeCalendar": "bmf",
+    "BSEExchangeCalendar": "bse",
+    "CFEExchangeCalendar": "cboe",
+    "CBOEEquityOptionsExchangeCalendar": "cboe",
+    "CBOEIndexOptionsExchangeCalendar": "cboe",
+    "CMETradeDateCalendar": "cme",
+    "CMEEquityExchangeCalendar": "cme",
+    "CMEAgricultureExchangeCalendar": "cme",
+    "CMEBondExchangeCalendar": "cme",
+    "CMEGlobexBaseExchangeCalendar": "cme_globex_base",
+    "CMEGlobexAgricultureExchangeCalendar": "cme_globex_agriculture",
+    "CMEGlobexLivestockExchangeCalendar": "cme_globex_agriculture",
+    "CMEGlobexGrainsAndOilseedsExchangeCalendar": "cme_globex_agriculture",
+    "CMEGlobexCryptoExchangeCalendar": "cme_globex_crypto",
+    "CMEGlobexEnergyAndMetalsExchangeCalendar": "cme_globex_energy_and_metals",
+    "CMEGlobexEquitiesExchangeCalendar": "cme_globex_equities",
+    "CMEGlobexFXExchangeCalendar": "cme_globex_fx",
+    "CMEGlobexFixedIncomeCalendar": "cme_globex_fixed_income",
+    "EUREXExchangeCalendar": "eurex",
+    "EUREXFixedIncomeCalendar": "eurex_fixed_income",
+    "ForexExchangeCalendar": "forex",
+    "HKEXExchangeCalendar": "hkex",
+    "ICEExchangeCalendar": "ice",
+    "NYSEExchangeCalendar": "nyse",
+    "IEXExchangeCalendar": "iex",
+    "JPXExchangeCalendar": "jpx",
+    "LSEExchangeCalendar": "lse",
+    "OSEExchangeCalendar": "ose",
+    "SIFMAUSExchangeCalendar": "sifma",
+    "SIFMAUKExchangeCalendar": "sifma",
+    "SIFMAJPExchangeCalendar": "sifma",
+    "SIXExchangeCalendar": "six",
+    "SSEExchangeCalendar": "sse",
+    "TASEExchangeCalendar": "tase",
+    "TSXExchangeCalendar": "tsx",
+    "TradingCalendar": "mirror",
+}
+
+
+def _import_calendars(module: str):
+    return import_module(f".calendars.{module}", __package__)
+
+
+def _load_calendar(name: str) -> None:
+    """
+    Loader of the class registry for the names in the table, imports the module that registers the calendar.
+    """
+    _import_calendars(_CALENDAR_NAMES[name])
+
+
+# factory and calendar_names resolve all the names in the table, without importing their modules beforehand
+for _name in _CALENDAR_NAMES:
+    if _name not in MarketCalendar._regmeta_class_registry:
+        MarketCalendar._regmeta_class_registry.add_loader(_name, _load_calendar)
+
+# The names of the installed exchange_calendars are registered by mirror.py. It is only imported, and with it
+# exchange_calendars, when a name outside the table is looked up or all the names are listed.
+MarketCalendar._regmeta_class_registry.add_finder(partial(_import_calendars, "mirror"))
+
+
+def __getattr__(name: str):
+    # The calendar classes used to be imported here, keep them accessible as attributes of this module
+    if name in _CALENDAR_CLASSES:
+        return getattr(_import_calendars(_CALENDAR_CLASSES[name]), name)
+    if name.endswith("ExchangeCalendar"):
+        mirror = _import_calendars("mirror")
+        if hasattr(mirror, name):
+            return getattr(mirror, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_calendar(
@@ -63,4 +233,5 @@ def get_calendar_names() -> list[str]:
     """All Market Calendar names and aliases that can be used in "factory"
     :return: list(str)
     """
-    return MarketCalendar.calendar_names()
+    registered = MarketCalendar.calendar_names()
+    return list(_CALENDAR_NAMES) + [name for name in registered if name not in _CALENDAR_NAMES]
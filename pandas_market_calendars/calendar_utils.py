@@ -6,16 +6,20 @@ import itertools
 import warnings
 from math import ceil, floor
 from re import finditer, split
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Literal, Optional, Set, Tuple, Type, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Literal, Optional, Set, Tuple, Type, Union, cast
 
 import numpy as np
 import pandas as pd
+from pandas.errors import OutOfBoundsDatetime
 
 
 if TYPE_CHECKING:
     from pandas.tseries.holiday import AbstractHolidayCalendar, Holiday
     from pandas.tseries.offsets import CustomBusinessDay
 
+# dtype of the dates returned by pd.date_range, "datetime64[ns]" before pandas 3.0 and "datetime64[us]" after
+DATE_RANGE_DTYPE = pd.date_range("2000-01-01", periods=1).dtype
+
 DEFAULT_LABEL_MAP = {
     "pre": "pre",
     "rth_pre_break": "rth",
@@ -27,12 +31,81 @@ DEFAULT_LABEL_MAP = {
 }
 
 
+def _unit(dtype) -> str:
+    """
+    :param dtype: datetime64 dtype, with or without time zone
+    :return: resolution of the dtype, which is always "ns" before pandas 2.0
+    """
+    return dtype.unit if isinstance(dtype, pd.DatetimeTZDtype) else np.datetime_data(dtype)[0]
+
+
+def _asi8(values, unit: str = "ns") -> np.ndarray:
+    """
+    :param values: datetime-like values, those with a time zone are taken in UTC
+    :param unit: resolution of the result
+    :return: int64 array of the values as multiples of unit since the epoch, NaT as the minimum int64
+    """
+    return pd.DatetimeIndex(values).values.astype(f"datetime64[{unit}]").view(np.int64)
+
+
+def _n_days(n) -> np.ndarray:
+    """
+    :param n: int, bool or array of them
+    :return: n as timedelta64[D], for arithmetic on datetime64[D] values, which numpy deprecated for bare ints
+    """
+    return np.asarray(n, dtype=np.int64).astype("timedelta64[D]")
+
+
+def _to_days(dates, tz=None) -> np.ndarray:
+    """
+    :param dates: a single date or an array-like of dates
+    :param tz: time zone that tz-aware dates are converted to before their time is dropped, None to keep their own
+    :return: datetime64[D] array of the days of the dates, of length 1 for a single date. NaT stays NaT.
+    """
+    dates = pd.DatetimeIndex([pd.Timestamp(dates)] if np.ndim(dates) == 0 else dates)
+    if dates.tz is not None:
+        dates = dates.tz_localize(None) if tz is None else dates.tz_convert(tz).tz_localize(None)
+    return dates.values.astype("datetime64[D]")
+
+
+def _days_index(days: np.ndarray, dtype) -> pd.DatetimeIndex:
+    """
+    :param days: datetime64[D] array
+    :param dtype: datetime64 dtype of the result
+    :return: DatetimeIndex of the days
+    :raises OutOfBoundsDatetime: when a day can't be represented in dtype, e.g. after 2262-04-11 in nanoseconds.
+        The day numbers are checked before casting, numpy's astype either wraps them around or raises OverflowError.
+    """
+    days = np.asarray(days, dtype="datetime64[D]")
+    per_day = np.timedelta64(1, "D") // np.timedelta64(1, _unit(np.dtype(dtype)))
+    bound = np.iinfo(np.int64).max // per_day
+    numbers = days.view(np.int64)
+    outside = ((numbers > bound) | (numbers < -bound)) & ~np.isnat(days)
+    if outside.any():
+        raise OutOfBoundsDatetime(f"Out of bounds {dtype} timestamp: {days[outside][0]}")
+    return pd.DatetimeIndex(days.astype(dtype))
+
+
+def _datetime_index(values: np.ndarray, unit: str = "ns", tz=None, as_unit: Optional[str] = None) -> pd.DatetimeIndex:
+    """
+    :param values: int64 array of UTC multiples of unit since the epoch
+    :param unit: resolution of values
+    :param tz: time zone of the result, None for naive UTC times
+    :param as_unit: resolution of the result, default unit. Before pandas 2.0 it is always "ns".
+    :return: DatetimeIndex of the values
+    """
+    values = np.asarray(values, dtype=np.int64).view(f"datetime64[{unit}]")
+    index = pd.DatetimeIndex(values.astype(f"datetime64[{as_unit or unit}]"))
+    return index if tz is None else index.tz_localize("UTC").tz_convert(tz)
+
+
 def mark_session(
     schedule: pd.DataFrame,
     timestamps: pd.DatetimeIndex,
     label_map: Dict[str, Any] | None = None,
     *,
     closed: Literal["left", "right"] = "right",
+    engine: Literal["pandas", "numpy"] = "pandas",
 ) -> pd.Series:
     """
     Return a Series that denotes the trading session of each timestamp in a DatetimeIndex.
@@ -66,10 +139,72 @@ def mark_session(
     :param closed: Which side of each interval should be closed (inclusive)
         left: == [start, end)
         right: == (start, end]
+
+    :param engine: How the sessions are looked up, both return the same Series.
+        pandas: pd.cut of the timestamps
+        numpy: np.searchsorted on int64 times, see mark_session_codes(). The Categorical is built
+            from the codes directly, no label is materialized per timestamp.
+    """
+    if engine == "numpy":
+        codes, categories = mark_session_codes(schedule, timestamps, label_map, closed=closed)
+        return pd.Series(
+            pd.Categorical.from_codes(codes, dtype=pd.CategoricalDtype(categories, ordered=False)),
+            index=timestamps,
+        )
+    if engine != "pandas":
+        raise ValueError(f"engine must be 'pandas' or 'numpy', not {engine!r}")
+
+    bins, labels = _session_bins(schedule, timestamps, label_map)
+    return pd.Series(
+        pd.cut(timestamps, bins, closed != "left", labels=labels, ordered=False),
+        index=timestamps,
+    )
+
+
+def mark_session_codes(
+    schedule: pd.DataFrame,
+    timestamps: pd.DatetimeIndex,
+    label_map: Dict[str, Any] | None = None,
+    *,
+    closed: Literal["left", "right"] = "right",
+) -> Tuple[np.ndarray, pd.Index]:
+    """
+    Compact version of mark_session() for large sets of timestamps. The sessions are returned as
+    an int8 code per timestamp, which indexes into a small table of labels.
+
+    The parameters are the same as in mark_session().
+
+    :return: (codes, labels): np.ndarray of int8 with the same length as timestamps, -1 where a timestamp
+        falls outside of all sessions, and a pd.Index of the labels the codes refer to.
+        labels[codes] gives the labels that mark_session() returns.
+    """
+    timestamps = pd.DatetimeIndex(timestamps)
+    # compare in the finer of the two units, so that the timestamps are only converted when needed
+    unit = min(_unit(timestamps.dtype), _unit(schedule.iloc[:, 0].dtype), key=lambda u: pd.Timedelta(1, u))
+    bins, labels = _session_bins(schedule, timestamps, label_map, unit=unit)
+
+    # The same categories that pd.cut() gives these labels
+    categorical = pd.Categorical(labels, categories=labels if len(set(labels)) == len(labels) else None)
+    interval_codes = categorical.codes.astype(np.int8)
+
+    # Bin i is (bins[i], bins[i+1]] when closed='right', [bins[i], bins[i+1]) when closed='left'
+    ix = np.searchsorted(bins, _asi8(timestamps, unit), "right" if closed == "left" else "left")
+    ix -= 1
+    inside = (ix >= 0) & (ix < len(interval_codes))
+    codes = np.full(len(ix), -1, dtype=np.int8)
+    codes[inside] = interval_codes[ix[inside]]
+    return codes, categorical.categories
+
+
+def _session_bins(schedule, timestamps, label_map, unit: Optional[str] = None) -> Tuple[np.ndarray, pd.Series]:
+    """
+    Flatten the schedule into the sorted bin edges between sessions and the label of each bin.
+
+    :param unit: if given, return the edges as int64 UTC times in this unit instead of Timestamps
+    :return: (bins, labels) with len(labels) == len(bins) - 1
     """
     if label_map is None:
         label_map = {}
-
     # ---- ---- ---- Determine which columns need to be dropped ---- ---- ----
     session_labels = ["closed"]
     columns = set(schedule.columns)
@@ -126,9 +261,15 @@ def mark_session(
     labels = pd.concat([labels, pd.Series([backfilled_map["closed"]])])
 
     # Append on additional Edge-Case Bins so result doesn't include NaNs
-    bins = schedule.to_numpy().flatten()
-    bins = np.insert(bins, 0, bins[0].normalize())
-    bins = np.append(bins, bins[-1].normalize() + pd.Timedelta("1D"))
+    if unit is not None:
+        first, last = _asi8(pd.DatetimeIndex([schedule.iloc[0, 0], schedule.iloc[-1, -1]]).normalize(), unit)
+        last += pd.Timedelta("1D") // pd.Timedelta(1, unit)
+        bins = np.column_stack([_asi8(schedule[col], unit) for col in schedule.columns])
+        bins = np.concatenate([[first], bins.ravel(), [last]])
+    else:
+        bins = schedule.to_numpy().flatten()
+        bins = np.insert(bins, 0, bins[0].normalize())
+        bins = np.append(bins, bins[-1].normalize() + pd.Timedelta("1D"))
 
     bins, _ind, _counts = np.unique(bins, return_index=True, return_counts=True)
 
@@ -137,10 +278,138 @@ def mark_session(
         label_inds = (_ind + _counts - 1)[:-1]
         labels = labels.iloc[label_inds]
 
-    return pd.Series(
-        pd.cut(timestamps, bins, closed != "left", labels=labels, ordered=False),
-        index=timestamps,
-    )
+    return bins, labels
+
+
+class SessionMarker:
+    """
+    Labels batches of timestamps from a live feed with their trading session, like mark_session() does
+    for a whole index at once.
+
+    The schedule is flattened into the sorted edges between sessions once per window and a cursor points at
+    the session of the last timestamp that was labeled, so each batch is only compared with the sessions
+    that are still ahead. When a batch leaves the window, the next window is computed with
+    MarketCalendar.schedule().
+    """
+
+    def __init__(
+        self,
+        calendar,
+        schedule: Optional[pd.DataFrame] = None,
+        label_map: Dict[str, Any] | None = None,
+        *,
+        closed: Literal["left", "right"] = "right",
+        market_times=None,
+        days=30,
+    ):
+        """
+        :param calendar: MarketCalendar that the windows are computed from
+        :param schedule: optional schedule DataFrame to start from. Its columns replace market_times
+            when windows are computed later on.
+        :param label_map: optional mapping to change the labels, see mark_session()
+        :param closed: which side of each session is closed (inclusive), see mark_session()
+        :param market_times: market_times of the schedules computed by the marker, see MarketCalendar.schedule.
+            Use "all" to label the pre and post sessions.
+        :param days: number of days after the first timestamp of a batch that each window covers
+        """
+        self.calendar = calendar
+        self.label_map = label_map
+        self.closed = closed
+        self.days = days
+
+        if schedule is not None:
+            market_times = list(schedule.columns[~schedule.columns.str.startswith("interruption_")])
+            schedule = schedule[market_times]
+        self.market_times = market_times
+
+        self._bins = self._codes = self._labels = None
+        self._start = self._end = 0
+        self._cursor = 0
+        if schedule is not None and not schedule.empty:
+            self._set_window(schedule)
+
+    @property
+    def labels(self) -> Optional[pd.Index]:
+        """
+        :return: the labels that the codes returned by .mark_codes() refer to, None before the first window
+        """
+        return self._labels
+
+    def _set_window(self, schedule: pd.DataFrame) -> None:
+        edges = pd.DatetimeIndex([schedule.iloc[0, 0], schedule.iloc[-1, -1]])
+        bins, labels = _session_bins(schedule, edges, self.label_map, unit="ns")
+
+        # a fixed table of labels, in the order that pd.cut() gives them, so that codes are the same in every window
+        self._labels = pd.Categorical(labels).categories
+        self._codes = self._labels.get_indexer(labels).astype(np.int8)
+        self._bins = bins
+        self._cursor = 0
+
+        # before the first session of the window, the day before could still be in session, and after the start
+        # of the last day, the day after could already be, so those parts are left to other windows
+        self._start = _asi8(edges[:1])[0]
+        self._end = _asi8(schedule.iloc[-1:, 0])[0]
+
+    def _load(self, first: int, last: int) -> None:
+        # the window starts with the session before the batch, which can be further back than usual during long
+        # closures, so that timestamps in a closure are labeled as closed
+        previous = self.calendar.previous_open(pd.Timestamp(first, tz="UTC"))
+        days = pd.DatetimeIndex([first, last], tz="UTC").tz_convert(self.calendar.tz)
+        first, last = days.tz_localize(None).normalize()
+        start = first - pd.Timedelta(days=7)
+        if previous is not pd.NaT:
+            start = min(start, previous.tz_convert(self.calendar.tz).tz_localize(None).normalize())
+
+        schedule = self.calendar.schedule(
+            start,
+            max(last, first + pd.Timedelta(days=self.days)) + pd.Timedelta(days=7),
+            market_times=self.market_times,
+        )
+        if schedule.empty:
+            raise ValueError(f"{self.calendar.name} has no trading days around {first.date()}")
+        self._set_window(schedule)
+
+    def mark_codes(self, timestamps: pd.DatetimeIndex) -> np.ndarray:
+        """
+        :param timestamps: DatetimeIndex of the batch, sorted in ascending order. Timestamps without
+            tz information are assumed to be UTC. Batches can come in any order, but it is fastest when each
+            batch starts after the previous one.
+        :return: np.ndarray of int8 codes into .labels, -1 where a timestamp is not in any session
+        """
+        times = _asi8(timestamps)
+        if not len(times):
+            return np.zeros(0, dtype=np.int8)
+
+        first, last = times[0], times[-1]
+        if self._bins is None or first < self._start or last >= self._end:
+            self._load(first, last)
+            if first < self._start or last >= self._end:
+                raise ValueError("The provided timestamps are not covered by the schedule")
+
+        side = "right" if self.closed == "left" else "left"
+        i = self._cursor
+        if first < self._bins[i]:
+            i = 0  # the batch goes back in time
+        ix = np.searchsorted(self._bins[i:], times, side)
+        ix += i - 1
+        self._cursor = max(int(ix[-1]), 0)  # the sessions before the last timestamp are finished
+
+        inside = (ix >= 0) & (ix < len(self._codes))
+        codes = np.full(len(ix), -1, dtype=np.int8)
+        codes[inside] = self._codes[ix[inside]]
+        return codes
+
+    def mark(self, timestamps: pd.DatetimeIndex) -> pd.Series:
+        """
+        :param timestamps: DatetimeIndex of the batch, see .mark_codes()
+        :return: categorical Series of the session of each timestamp with the timestamps as index,
+            like mark_session() returns
+        """
+        codes = self.mark_codes(timestamps)
+        return pd.Series(
+            pd.Categorical.from_codes(codes, dtype=pd.CategoricalDtype(self._labels, ordered=False)),
+            index=timestamps,
+        )
 
 
 def merge_schedules(schedules: List[pd.DataFrame], how: Literal["outer", "inner"] = "outer") -> pd.DataFrame:
@@ -151,6 +420,7 @@ def merge_schedules(schedules: List[pd.DataFrame], how: Literal["outer", "inner"
     CAVEATS:
         * This does not work for schedules with breaks, the break information will be lost.
         * Only "market_open" and "market_close" are considered, other market times are not yet supported.
+        Use merge_sessions to merge schedules with breaks, interruptions and pre/post sessions as time intervals.
 
     :param schedules: list of schedules
     :param how: outer or inner
@@ -176,6 +446,193 @@ def merge_schedules(schedules: List[pd.DataFrame], how: Literal["outer", "inner"
     return result
 
 
+def merge_sessions(
+    schedules: List[pd.DataFrame], how: Literal["union", "intersection", "difference"] = "union"
+) -> Tuple[pd.DataFrame, np.ndarray]:
+    """
+    Merge any number of schedules as sets of time intervals, unlike merge_schedules, which merges them day by day.
+
+    A schedule is open from market_open to market_close, except during its break and interruptions.
+    All the intervals are flattened into one array of opening and closing events, which is sorted once
+    and swept to find when the merged market is open:
+        union: when any of the schedules is open
+        intersection: when all of the schedules are open
+        difference: when the first schedule is open and none of the others is
+
+    The intervals of each schedule are expected to not overlap with each other, which is the case for schedules
+    returned by MarketCalendar.schedule.
+
+    Other market times (e.g. an added auction column) are carried through per session date. Those before
+    market_open in the column order of a schedule are taken like pre, the others like post: the earliest
+    respectively the latest for union, the other way around for intersection, and the times of the first
+    schedule for difference.
+
+    :param schedules: list of schedules, with breaks, interruptions, pre, post and other columns or not
+    :param how: union, intersection or difference
+    :return: (schedule, intervals)
+        schedule: DataFrame with one row per session date, the date of the schedule row that opened the interval.
+            When a session date has more than one interval, the first gap is the break and the others are
+            interruptions. When any of the schedules has pre or post columns, the pre and post columns hold the
+            extent of the same merge with pre and post included. Other market times are NaT on the dates that
+            none of the schedules they come from has.
+        intervals: np.ndarray of datetime64[ns] of shape (n, 2) with the UTC start and end of each interval
+    """
+    if how not in ("union", "intersection", "difference"):
+        raise ValueError('how argument must be "union", "intersection" or "difference"')
+
+    extended = any({"pre", "post"} & set(schedule.columns) for schedule in schedules)
+    starts, ends, labels = _merge_intervals(schedules, how, extended=False)
+
+    # ---- ---- ---- Group the intervals by session date ---- ---- ----
+    order = np.argsort(labels, kind="stable")
+    starts, ends, labels = starts[order], ends[order], labels[order]
+    first, last = np.ones(len(labels), dtype=bool), np.ones(len(labels), dtype=bool)
+    first[1:] = last[:-1] = labels[1:] != labels[:-1]
+    group = np.cumsum(first) - 1
+    position = np.arange(len(labels)) - np.flatnonzero(first)[group]
+
+    columns = {"market_open": starts[first], "market_close": ends[last]}
+    # the gap after each interval that isn't the last of its date
+    gap = ~last
+    for n in range(int(position[gap].max()) + 1 if gap.any() else 0):
+        in_gap = gap & (position == n)
+        gap_start = np.full(first.sum(), np.iinfo(np.int64).min)  # NaT
+        gap_end = gap_start.copy()
+        gap_start[group[in_gap]] = ends[in_gap]
+        gap_end[group[in_gap]] = starts[np.flatnonzero(in_gap) + 1]
+        if n == 0:
+            columns["break_start"], columns["break_end"] = gap_start, gap_end
+        else:
+            columns[f"interruption_start_{n}"], columns[f"interruption_end_{n}"] = gap_start, gap_end
+
+    if extended:
+        ext_starts, ext_ends, ext_labels = _merge_intervals(schedules, how, extended=True)
+        order = np.argsort(ext_labels, kind="stable")
+        ext_starts, ext_ends, ext_labels = ext_starts[order], ext_ends[order], ext_labels[order]
+        ext_first, ext_last = np.ones(len(ext_labels), dtype=bool), np.ones(len(ext_labels), dtype=bool)
+        ext_first[1:] = ext_last[:-1] = ext_labels[1:] != ext_labels[:-1]
+
+        # the extent of the extended intervals of the same date, the regular intervals when there are none
+        ix = np.searchsorted(ext_labels[ext_first], labels[first]).clip(max=max(ext_first.sum() - 1, 0))
+        found = ext_labels[ext_first][ix] == labels[first] if len(ext_labels) else np.zeros(len(ix), dtype=bool)
+        pre = np.where(found, ext_starts[ext_first][ix] if len(ext_labels) else 0, columns["market_open"])
+        post = np.where(found, ext_ends[ext_last][ix] if len(ext_labels) else 0, columns["market_close"])
+        columns["pre"] = np.minimum(pre, columns["market_open"])
+        columns["post"] = np.maximum(post, columns["market_close"])
+
+    opening, closing = _merge_other_times(schedules, how, labels[first], columns)
+    unit = _unit(schedules[0]["market_open"].dtype)
+    col_order = ["pre", *opening, "market_open", "break_start", "break_end", "market_close", *closing, "post"]
+    col_order = [c for c in col_order if c in columns] + [c for c in columns if c.startswith("interruption_")]
+    schedule = pd.DataFrame(
+        {col: _datetime_index(columns[col], tz="UTC", as_unit=unit) for col in col_order},
+        index=_datetime_index(labels[first], as_unit=_unit(schedules[0].index.dtype)),
+    )
+
+    order = np.argsort(starts, kind="stable")
+    intervals = np.column_stack([starts[order], ends[order]]).view("datetime64[ns]")
+    return schedule, intervals
+
+
+def _merge_other_times(schedules, how, labels, columns) -> Tuple[List[str], List[str]]:
+    """
+    Add the market times of the schedules other than the sessions, breaks and interruptions to columns,
+    as int64 arrays of UTC nanoseconds aligned with labels, the int64 session dates of the merged schedule.
+
+    :return: (opening, closing) names of the added columns that come before market_open and after it
+    """
+    known = {"pre", "market_open", "break_start", "break_end", "market_close", "post"}
+    opening, closing = [], []
+    for schedule in schedules[:1] if how == "difference" else schedules:
+        cols = list(schedule.columns)
+        for col in cols:
+            if col in known or col.startswith("interruption_") or col in opening or col in closing:
+                continue
+            is_opening = "market_open" in cols and cols.index(col) < cols.index("market_open")
+            (opening if is_opening else closing).append(col)
+
+    dates, nat = labels, np.iinfo(np.int64).min
+    for col in opening + closing:
+        values = np.full(len(dates), nat)
+        for schedule in schedules[:1] if how == "difference" else schedules:
+            if col not in schedule.columns:
+                continue
+            times, index = _asi8(pd.DatetimeIndex(schedule[col]).tz_convert("UTC")), _asi8(schedule.index)
+            ix = np.searchsorted(index, dates).clip(max=max(len(index) - 1, 0))
+            found = index[ix] == dates if len(index) else np.zeros(len(dates), dtype=bool)
+            other = np.where(found, times[ix] if len(index) else nat, nat)
+            # the earliest opening and latest closing times widen the sessions, for union
+            earliest = (col in opening) == (how == "union")
+            pick = (values == nat) | ((other != nat) & ((other < values) if earliest else (other > values)))
+            values = np.where(pick, other, values)
+        columns[col] = values
+    return opening, closing
+
+
+def _merge_intervals(schedules, how, extended) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sweep over the flattened opening and closing events of all the schedules.
+
+    :param extended: include the pre and post sessions in the intervals
+    :return: (starts, ends, labels) int64 arrays with the UTC nanoseconds of the start and end of each merged
+        interval and the session date of the schedule row that opened it
+    """
+    times, weights, sources, dates = [], [], [], []
+
+    def _add(values, weight, source, index):
+        values = _asi8(pd.DatetimeIndex(values).tz_convert("UTC"))
+        valid = values != np.iinfo(np.int64).min  # NaT
+        times.append(values[valid])
+        weights.append(np.full(valid.sum(), weight, dtype=np.int64))
+        sources.append(np.full(valid.sum(), source, dtype=np.int64))
+        dates.append(_asi8(index)[valid])
+
+    for source, schedule in enumerate(schedules):
+        cols = schedule.columns
+        opens = schedule["pre"] if extended and "pre" in cols else schedule["market_open"]
+        closes = schedule["post"] if extended and "post" in cols else schedule["market_close"]
+        valid = opens.notna() & closes.notna()
+        schedule, opens, closes = schedule[valid], opens[valid], closes[valid]
+
+        _add(opens, 1, source, schedule.index)
+        _add(closes, -1, source, schedule.index)
+        gaps = [("break_start", "break_end")] if {"break_start", "break_end"}.issubset(cols) else []
+        gaps += [(col, col.replace("start", "end")) for col in cols if col.startswith("interruption_start_")]
+        for start, end in gaps:
+            in_gap = schedule[start].notna() & schedule[end].notna()
+            _add(schedule.loc[in_gap, start], -1, source, schedule.index[in_gap])
+            _add(schedule.loc[in_gap, end], 1, source, schedule.index[in_gap])
+
+    times, weights, sources, dates = (np.concatenate(x) for x in (times, weights, sources, dates))
+    order = np.argsort(times, kind="stable")
+    times, weights, sources, dates = times[order], weights[order], sources[order], dates[order]
+
+    # the number of open intervals after each event, of all the schedules and of the first one
+    count = np.cumsum(weights)
+    count_first = np.cumsum(np.where(sources == 0, weights, 0))
+    if how == "union":
+        is_open = count > 0
+    elif how == "intersection":
+        is_open = count == len(schedules)
+    else:
+        is_open = (count_first > 0) & (count == count_first)
+
+    # the state after the last event at each time, when it differs from the state before
+    last = np.ones(len(times), dtype=bool)
+    last[:-1] = times[1:] != times[:-1]
+    positions = np.flatnonzero(last)
+    is_open = is_open[last]
+    change = is_open != np.append(False, is_open)[:-1]
+    positions, is_open = positions[change], is_open[change]
+
+    # the session date of the latest opening event, of the first schedule for the difference
+    labeled = (weights > 0) & (sources == 0 if how == "difference" else True)
+    latest = np.maximum.accumulate(np.where(labeled, np.arange(len(times)), 0))
+
+    opened, closed = positions[is_open], positions[~is_open]
+    return times[opened], times[closed], dates[latest[opened]]
+
+
 def is_single_observance(holiday: "Holiday") -> Union[pd.Timestamp, None]:
     "Returns the Date of the Holiday if it is only observed once, None otherwise."
     return holiday.start_date if holiday.start_date == holiday.end_date else None
@@ -449,6 +906,93 @@ def date_range(
 
     :return: pd.DatetimeIndex of datetime64[ns, TZ-Aware]
     """
+    prepared = _prepare_date_range(
+        schedule, frequency, closed, force_close, session, merge_adjacent, start, end, periods
+    )
+    if prepared is None:
+        return pd.DatetimeIndex([], dtype="datetime64[ns, UTC]")
+    session_times, frequency, tz, dtype, start, end, periods = prepared
+
+    time_series = _calc_time_series(session_times, frequency, closed, force_close, start, end, periods)
+    return _to_datetime_index(time_series, tz, dtype)
+
+
+def date_range_iter(
+    schedule: pd.DataFrame,
+    frequency: Union[str, pd.Timedelta, int, float],
+    closed: Union[Literal["left", "right", "both"], None] = "right",
+    force_close: Union[bool, None] = True,
+    session: Union[SESSIONS, Iterable[SESSIONS], None] = None,
+    merge_adjacent: bool = True,
+    start: Union[str, pd.Timestamp, int, float, None] = None,
+    end: Union[str, pd.Timestamp, int, float, None] = None,
+    periods: Union[int, None] = None,
+    *,
+    chunk: Union[str, pd.Timedelta] = "1D",
+    rows: Union[int, None] = None,
+) -> Iterator[pd.DatetimeIndex]:
+    """
+    Same as date_range(), but yields the result in consecutive DatetimeIndex chunks instead of building it
+    in one piece, so that the memory used stays bounded no matter how long the schedule is.
+    Concatenating the chunks gives the same DatetimeIndex as date_range() with the same parameters.
+
+    The parameters from schedule to periods are the same as in date_range().
+
+    :param chunk: String or pd.Timedelta, the span of trading days whose sessions are generated together,
+        based on the date on which each session starts. Default '1D', one chunk per trading day.
+
+    :param rows: Optional Integer, when given the chunks hold exactly this many timestamps (except for the last one)
+        regardless of the trading days they belong to.
+
+    :return: Iterator of pd.DatetimeIndex of datetime64[ns, TZ-Aware]
+    """
+    if rows is not None and (not isinstance(rows, int) or rows <= 0):
+        raise ValueError("rows must be a positive integer or None.")
+    chunk = pd.Timedelta(chunk)
+    if chunk <= pd.Timedelta("0s"):
+        raise ValueError("chunk must be positive.")
+
+    prepared = _prepare_date_range(
+        schedule, frequency, closed, force_close, session, merge_adjacent, start, end, periods
+    )
+    if prepared is None:
+        return iter(())
+    # the parameters are checked above, when date_range_iter() is called, and not on the first next()
+    return _date_range_chunks(prepared, closed, force_close, chunk, rows)
+
+
+def _date_range_chunks(prepared, closed, force_close, chunk, rows) -> Iterator[pd.DatetimeIndex]:
+    "Generator of the chunks of date_range_iter(), from the output of _prepare_date_range()"
+    session_times, frequency, tz, dtype, start, end, periods = prepared
+
+    chunks = _iter_time_series(session_times, frequency, closed, force_close, start, end, periods, chunk)
+    chunks = (_to_datetime_index(time_series, tz, dtype) for time_series in chunks)
+    if rows is None:
+        yield from chunks
+        return
+
+    buffer = []
+    buffered = 0
+    for index in chunks:
+        buffer.append(index)
+        buffered += len(index)
+        if buffered < rows:
+            continue
+        index = buffer[0].append(buffer[1:]) if len(buffer) > 1 else buffer[0]
+        full = len(index) - len(index) % rows
+        for i in range(0, full, rows):
+            yield index[i : i + rows]
+        buffer, buffered = [index[full:]], len(index) - full
+    if buffered:
+        yield buffer[0].append(buffer[1:]) if len(buffer) > 1 else buffer[0]
+
+
+def _prepare_date_range(schedule, frequency, closed, force_close, session, merge_adjacent, start, end, periods):
+    """
+    Error check the parameters of date_range() and reconfigure the schedule into sessions.
+
+    :return: (session_times, frequency, tz, dtype, start, end, periods) or None if no session was requested
+    """
     # ---- ---- Error Check Inputs ---- ----
     if closed not in ("left", "right", "both", None):
         raise ValueError("closed must be 'left', 'right', 'both' or None.")
@@ -474,7 +1018,7 @@ def date_range(
 
     session_list, mask = _make_session_list(set(schedule.columns), session, merge_adjacent)
     if len(session_list) == 0:
-        return pd.DatetimeIndex([], dtype="datetime64[ns, UTC]")
+        return None
 
     session_times = _reconfigure_schedule(schedule, session_list, mask)
     # Trim off all 0 length sessions
@@ -485,10 +1029,7 @@ def date_range(
     dtype = schedule[session_list[0][0]].dtype  # copy dtype info from schedule
     start, end, periods = _standardize_times(schedule, start, end, periods, tz)
 
-    time_series = _calc_time_series(session_times, frequency, closed, force_close, start, end, periods)
-    time_series.name = None
-
-    return pd.DatetimeIndex(time_series, tz=tz, dtype=dtype)
+    return session_times, frequency, tz, dtype, start, end, periods
 
 
 # region ------------------ Date Range LTF Subroutines ------------------
@@ -767,8 +1308,73 @@ def _course_trim_to_period_count(num_bars: pd.Series, periods: int, reverse: boo
     return sessions_to_keep
 
 
-def _calc_time_series(session_times, timestep, closed, force_close, start, end, periods) -> pd.Series:
-    "Interpolate each session into a datetime series at the desired frequency."
+def _calc_time_series(session_times, timestep, closed, force_close, start, end, periods) -> np.ndarray:
+    "Interpolate each session into an int64 array of UTC nanoseconds at the desired frequency."
+    session_times, num_bars = _trim_sessions(session_times, timestep, closed, start, end, periods)
+    if len(session_times) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    time_series = _interpolate_sessions(session_times, num_bars, timestep, closed, force_close)
+
+    if periods is not None and len(time_series) > 0:
+        # Although likely redundant, Fine Trim to desired period count.
+        if end is not None:
+            s_len = len(time_series)
+            time_series = time_series[max(s_len - periods, 0) : s_len]
+        else:
+            time_series = time_series[0:periods]
+
+    return time_series
+
+
+def _iter_time_series(session_times, timestep, closed, force_close, start, end, periods, chunk) -> Iterator[np.ndarray]:
+    """
+    Same as _calc_time_series(), but interpolates the sessions that start within each span of 'chunk' days
+    separately and yields the results one after the other.
+    """
+    session_times, num_bars = _trim_sessions(session_times, timestep, closed, start, end, periods)
+    if len(session_times) == 0:
+        return
+
+    days = session_times.start.dt.tz_localize(None).dt.normalize()
+    groups = ((days - days.iloc[0]) // chunk).values
+    bounds = np.flatnonzero(np.diff(groups)) + 1
+
+    def _chunks() -> Iterator[np.ndarray]:
+        previous = None
+        for first, last in zip(np.append(0, bounds), np.append(bounds, len(groups))):
+            time_series = _interpolate_sessions(
+                session_times.iloc[first:last], num_bars.iloc[first:last], timestep, closed, force_close
+            )
+            if previous is not None and len(time_series):
+                # adjacent sessions can produce the same timestamp, which date_range() only returns once
+                time_series = time_series[~np.isin(time_series, previous[previous >= time_series.min()])]
+            if len(time_series):
+                previous = time_series
+                yield time_series
+
+    if periods is None:
+        yield from _chunks()
+
+    elif end is None:
+        for time_series in _chunks():
+            yield time_series[:periods]
+            periods -= len(time_series)
+            if periods <= 0:
+                return
+
+    else:
+        # The periods are counted back from the end, so the excess at the start is only known once all of it
+        # is generated. It is counted in a first pass, the chunks are generated again to be trimmed and yielded.
+        excess = sum(len(time_series) for time_series in _chunks()) - periods
+        for time_series in _chunks():
+            if excess < len(time_series):
+                yield time_series[max(excess, 0) :]
+            excess -= len(time_series)
+
+
+def _trim_sessions(session_times, timestep, closed, start, end, periods) -> Tuple[pd.DataFrame, pd.Series]:
+    "Trim the sessions to the start, end and period count, returning the sessions and the number of bars in each."
     # region ---- ---- ---- Trim the Sessions ---- ---- ----
     # Compare 'start' to the session end times so that if 'start' is in the middle of a session
     # that session remains in session_times. Vise-vera for End
@@ -777,7 +1383,7 @@ def _calc_time_series(session_times, timestep, closed, force_close, start, end,
     if end is not None:
         session_times = session_times[session_times.start < end]
     if len(session_times) == 0:
-        return pd.Series([])
+        return session_times, pd.Series([])
 
     # Override the First Session's Start and Last Session's End times if needed
     if start is not None and start > session_times.loc[session_times.index[0], "start"]:
@@ -800,41 +1406,51 @@ def _calc_time_series(session_times, timestep, closed, force_close, start, end,
 
     # endregion
 
-    starts = session_times.start.repeat(num_bars)
+    return session_times, num_bars
+
+
+def _interpolate_sessions(session_times, num_bars, timestep, closed, force_close) -> np.ndarray:
+    """
+    Interpolate the trimmed sessions at the desired frequency.
 
-    # Optimized: Replace groupby().cumcount() with vectorized range generation
-    # This is significantly faster than pandas groupby operations
-    num_bars_arr = num_bars.astype(int).values
-    cumcount = np.concatenate([np.arange(n) for n in num_bars_arr])
+    :return: sorted, unique int64 array of UTC nanoseconds (in session order if force_close is not True)
+    """
+    starts = _asi8(session_times.start)
+    ends = _asi8(session_times.end)
+    num_bars = num_bars.to_numpy().astype(np.int64)
 
+    # Position of every bar within its session, in one pass: a running count that restarts at each session
+    first_bar = np.repeat(np.cumsum(num_bars) - num_bars, num_bars)
+    steps = np.arange(len(first_bar), dtype=np.int64) - first_bar
     if closed == "right":
         # Right side of addition is cumulative time since session start in multiples of timestep
-        time_series = starts + (cumcount + 1) * timestep
-    else:
-        time_series = starts + cumcount * timestep
+        steps += 1
+    time_series = np.repeat(starts, num_bars) + steps * timestep.value
 
     if force_close is not None:
         # Trim off all timestamps that stretched beyond their intended session
-        time_series = time_series[time_series.le(session_times.end.repeat(num_bars))]
+        time_series = time_series[time_series <= np.repeat(ends, num_bars)]
 
-        if force_close:
-            time_series = pd.concat([time_series, session_times.end])
-
-    # Optimized: use sort_values first only if force_close appended values, otherwise data is already sorted
+    in_order = len(time_series) < 2 or bool((time_series[1:] >= time_series[:-1]).all())
     if force_close:
-        time_series = time_series.sort_values().drop_duplicates()
-    else:
-        time_series = time_series.drop_duplicates()
-
-    if periods is not None and len(time_series) > 0:
-        # Although likely redundant, Fine Trim to desired period count.
-        if end is not None:
-            s_len = len(time_series)
-            time_series = time_series[max(s_len - periods, 0) : s_len]
+        if in_order:
+            # Merge the closes into the already sorted bars
+            ends = np.sort(ends)
+            time_series = np.insert(time_series, np.searchsorted(time_series, ends), ends)
         else:
-            time_series = time_series[0:periods]
+            time_series = np.sort(np.concatenate([time_series, ends]))
+        in_order = True
 
-    return time_series
+    if in_order:
+        return time_series[np.append(True, time_series[1:] != time_series[:-1])] if len(time_series) else time_series
+    # drop duplicates, keeping the first occurrence of each timestamp
+    _, first = np.unique(time_series, return_index=True)
+    return time_series[np.sort(first)]
+
+
+def _to_datetime_index(time_series: np.ndarray, tz, dtype) -> pd.DatetimeIndex:
+    "Convert the int64 UTC nanoseconds of _calc_time_series() into a DatetimeIndex of the schedule's dtype"
+    return _datetime_index(time_series, tz=tz, as_unit=dtype.unit if hasattr(dtype, "unit") else None)
 
 
 # endregion
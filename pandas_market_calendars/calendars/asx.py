@@ -7,9 +7,6 @@ from pandas_market_calendars.holidays.oz import *
 from pandas_market_calendars.market_calendar import MarketCalendar
 
 
-AbstractHolidayCalendar.start_date = "2011-01-01"
-
-
 class ASXExchangeCalendar(MarketCalendar):
     """
     Open Time: 10:00 AM, Australia/Sydney
@@ -4,421 +4,424 @@ Bombay Stock Exchnage
 
 from datetime import time
 
-from pandas import Timestamp
 from zoneinfo import ZoneInfo
 
+from pandas_market_calendars.holidays.adhoc import adhoc_dates
 from pandas_market_calendars.market_calendar import MarketCalendar
 
 
-BSEClosedDay = [
-    Timestamp("1997-01-23", tz="UTC"),
-    Timestamp("1997-03-07", tz="UTC"),
-    Timestamp("1997-03-24", tz="UTC"),
-    Timestamp("1997-04-08", tz="UTC"),
-    Timestamp("1997-04-14", tz="UTC"),
-    Timestamp("1997-04-16", tz="UTC"),
-    Timestamp("1997-04-18", tz="UTC"),
-    Timestamp("1997-05-01", tz="UTC"),
-    Timestamp("1997-05-08", tz="UTC"),
-    Timestamp("1997-08-15", tz="UTC"),
-    Timestamp("1997-08-18", tz="UTC"),
-    Timestamp("1997-08-25", tz="UTC"),
-    Timestamp("1997-10-02", tz="UTC"),
-    Timestamp("1997-10-28", tz="UTC"),
-    Timestamp("1997-10-29", tz="UTC"),
-    Timestamp("1997-10-31", tz="UTC"),
-    Timestamp("1997-12-25", tz="UTC"),
-    Timestamp("1998-04-09", tz="UTC"),
-    Timestamp("1998-04-14", tz="UTC"),
-    Timestamp("1998-04-28", tz="UTC"),
-    Timestamp("1998-12-25", tz="UTC"),
-    Timestamp("1999-01-01", tz="UTC"),
-    Timestamp("1999-01-20", tz="UTC"),
-    Timestamp("1999-01-26", tz="UTC"),
-    Timestamp("1999-03-02", tz="UTC"),
-    Timestamp("1999-03-18", tz="UTC"),
-    Timestamp("1999-03-25", tz="UTC"),
-    Timestamp("1999-03-29", tz="UTC"),
-    Timestamp("1999-04-02", tz="UTC"),
-    Timestamp("1999-04-14", tz="UTC"),
-    Timestamp("1999-04-27", tz="UTC"),
-    Timestamp("1999-04-30", tz="UTC"),
-    Timestamp("1999-09-13", tz="UTC"),
-    Timestamp("1999-10-19", tz="UTC"),
-    Timestamp("1999-11-08", tz="UTC"),
-    Timestamp("1999-11-10", tz="UTC"),
-    Timestamp("1999-11-23", tz="UTC"),
-    Timestamp("1999-12-31", tz="UTC"),
-    Timestamp("2000-01-26", tz="UTC"),
-    Timestamp("2000-03-17", tz="UTC"),
-    Timestamp("2000-03-20", tz="UTC"),
-    Timestamp("2000-04-14", tz="UTC"),
-    Timestamp("2000-04-21", tz="UTC"),
-    Timestamp("2000-05-01", tz="UTC"),
-    Timestamp("2000-08-15", tz="UTC"),
-    Timestamp("2000-09-01", tz="UTC"),
-    Timestamp("2000-10-02", tz="UTC"),
-    Timestamp("2000-12-25", tz="UTC"),
-    Timestamp("2001-01-01", tz="UTC"),
-    Timestamp("2001-01-26", tz="UTC"),
-    Timestamp("2001-03-06", tz="UTC"),
-    Timestamp("2001-04-05", tz="UTC"),
-    Timestamp("2001-04-13", tz="UTC"),
-    Timestamp("2001-05-01", tz="UTC"),
-    Timestamp("2001-08-15", tz="UTC"),
-    Timestamp("2001-08-22", tz="UTC"),
-    Timestamp("2001-10-02", tz="UTC"),
-    Timestamp("2001-10-26", tz="UTC"),
-    Timestamp("2001-11-16", tz="UTC"),
-    Timestamp("2001-11-30", tz="UTC"),
-    Timestamp("2001-12-17", tz="UTC"),
-    Timestamp("2001-12-25", tz="UTC"),
-    Timestamp("2002-03-25", tz="UTC"),
-    Timestamp("2002-03-29", tz="UTC"),
-    Timestamp("2002-05-01", tz="UTC"),
-    Timestamp("2002-08-15", tz="UTC"),
-    Timestamp("2002-09-10", tz="UTC"),
-    Timestamp("2002-10-02", tz="UTC"),
-    Timestamp("2002-10-15", tz="UTC"),
-    Timestamp("2002-11-06", tz="UTC"),
-    Timestamp("2002-11-19", tz="UTC"),
-    Timestamp("2002-12-25", tz="UTC"),
-    Timestamp("2003-02-13", tz="UTC"),
-    Timestamp("2003-03-14", tz="UTC"),
-    Timestamp("2003-03-18", tz="UTC"),
-    Timestamp("2003-04-14", tz="UTC"),
-    Timestamp("2003-04-18", tz="UTC"),
-    Timestamp("2003-05-01", tz="UTC"),
-    Timestamp("2003-08-15", tz="UTC"),
-    Timestamp("2003-10-02", tz="UTC"),
-    Timestamp("2003-11-26", tz="UTC"),
-    Timestamp("2003-12-25", tz="UTC"),
-    Timestamp("2004-01-01", tz="UTC"),
-    Timestamp("2004-01-26", tz="UTC"),
-    Timestamp("2004-02-02", tz="UTC"),
-    Timestamp("2004-03-02", tz="UTC"),
-    Timestamp("2004-04-09", tz="UTC"),
-    Timestamp("2004-04-14", tz="UTC"),
-    Timestamp("2004-04-26", tz="UTC"),
-    Timestamp("2004-10-13", tz="UTC"),
-    Timestamp("2004-10-22", tz="UTC"),
-    Timestamp("2004-11-15", tz="UTC"),
-    Timestamp("2004-11-26", tz="UTC"),
-    Timestamp("2005-01-21", tz="UTC"),
-    Timestamp("2005-01-26", tz="UTC"),
-    Timestamp("2005-03-25", tz="UTC"),
-    Timestamp("2005-04-14", tz="UTC"),
-    Timestamp("2005-07-28", tz="UTC"),
-    Timestamp("2005-08-15", tz="UTC"),
-    Timestamp("2005-09-07", tz="UTC"),
-    Timestamp("2005-10-12", tz="UTC"),
-    Timestamp("2005-11-03", tz="UTC"),
-    Timestamp("2005-11-04", tz="UTC"),
-    Timestamp("2005-11-15", tz="UTC"),
-    Timestamp("2006-01-11", tz="UTC"),
-    Timestamp("2006-01-26", tz="UTC"),
-    Timestamp("2006-02-09", tz="UTC"),
-    Timestamp("2006-03-15", tz="UTC"),
-    Timestamp("2006-04-06", tz="UTC"),
-    Timestamp("2006-04-11", tz="UTC"),
-    Timestamp("2006-04-14", tz="UTC"),
-    Timestamp("2006-05-01", tz="UTC"),
-    Timestamp("2006-08-15", tz="UTC"),
-    Timestamp("2006-10-02", tz="UTC"),
-    Timestamp("2006-10-24", tz="UTC"),
-    Timestamp("2006-10-25", tz="UTC"),
-    Timestamp("2006-12-25", tz="UTC"),
-    Timestamp("2007-01-01", tz="UTC"),
-    Timestamp("2007-01-26", tz="UTC"),
-    Timestamp("2007-01-30", tz="UTC"),
-    Timestamp("2007-02-16", tz="UTC"),
-    Timestamp("2007-03-27", tz="UTC"),
-    Timestamp("2007-04-06", tz="UTC"),
-    Timestamp("2007-05-01", tz="UTC"),
-    Timestamp("2007-05-02", tz="UTC"),
-    Timestamp("2007-08-15", tz="UTC"),
-    Timestamp("2007-10-02", tz="UTC"),
-    Timestamp("2007-12-21", tz="UTC"),
-    Timestamp("2007-12-25", tz="UTC"),
-    Timestamp("2008-03-06", tz="UTC"),
-    Timestamp("2008-03-20", tz="UTC"),
-    Timestamp("2008-03-21", tz="UTC"),
-    Timestamp("2008-04-14", tz="UTC"),
-    Timestamp("2008-04-18", tz="UTC"),
-    Timestamp("2008-05-01", tz="UTC"),
-    Timestamp("2008-05-19", tz="UTC"),
-    Timestamp("2008-08-15", tz="UTC"),
-    Timestamp("2008-09-03", tz="UTC"),
-    Timestamp("2008-10-02", tz="UTC"),
-    Timestamp("2008-10-09", tz="UTC"),
-    Timestamp("2008-10-30", tz="UTC"),
-    Timestamp("2008-11-13", tz="UTC"),
-    Timestamp("2008-11-27", tz="UTC"),
-    Timestamp("2008-12-09", tz="UTC"),
-    Timestamp("2008-12-25", tz="UTC"),
-    Timestamp("2009-01-08", tz="UTC"),
-    Timestamp("2009-01-26", tz="UTC"),
-    Timestamp("2009-02-23", tz="UTC"),
-    Timestamp("2009-03-10", tz="UTC"),
-    Timestamp("2009-03-11", tz="UTC"),
-    Timestamp("2009-04-03", tz="UTC"),
-    Timestamp("2009-04-07", tz="UTC"),
-    Timestamp("2009-04-10", tz="UTC"),
-    Timestamp("2009-04-14", tz="UTC"),
-    Timestamp("2009-04-30", tz="UTC"),
-    Timestamp("2009-05-01", tz="UTC"),
-    Timestamp("2009-09-21", tz="UTC"),
-    Timestamp("2009-09-28", tz="UTC"),
-    Timestamp("2009-10-02", tz="UTC"),
-    Timestamp("2009-10-13", tz="UTC"),
-    Timestamp("2009-10-19", tz="UTC"),
-    Timestamp("2009-11-02", tz="UTC"),
-    Timestamp("2009-12-25", tz="UTC"),
-    Timestamp("2009-12-28", tz="UTC"),
-    Timestamp("2010-01-01", tz="UTC"),
-    Timestamp("2010-01-26", tz="UTC"),
-    Timestamp("2010-02-12", tz="UTC"),
-    Timestamp("2010-03-01", tz="UTC"),
-    Timestamp("2010-03-24", tz="UTC"),
-    Timestamp("2010-04-02", tz="UTC"),
-    Timestamp("2010-04-14", tz="UTC"),
-    Timestamp("2010-09-10", tz="UTC"),
-    Timestamp("2010-11-17", tz="UTC"),
-    Timestamp("2010-12-17", tz="UTC"),
-    Timestamp("2011-01-26", tz="UTC"),
-    Timestamp("2011-03-02", tz="UTC"),
-    Timestamp("2011-04-12", tz="UTC"),
-    Timestamp("2011-04-14", tz="UTC"),
-    Timestamp("2011-04-22", tz="UTC"),
-    Timestamp("2011-08-15", tz="UTC"),
-    Timestamp("2011-08-31", tz="UTC"),
-    Timestamp("2011-09-01", tz="UTC"),
-    Timestamp("2011-10-06", tz="UTC"),
-    Timestamp("2011-10-27", tz="UTC"),
-    Timestamp("2011-11-07", tz="UTC"),
-    Timestamp("2011-11-10", tz="UTC"),
-    Timestamp("2011-12-06", tz="UTC"),
-    Timestamp("2012-01-26", tz="UTC"),
-    Timestamp("2012-02-20", tz="UTC"),
-    Timestamp("2012-03-08", tz="UTC"),
-    Timestamp("2012-04-05", tz="UTC"),
-    Timestamp("2012-04-06", tz="UTC"),
-    Timestamp("2012-05-01", tz="UTC"),
-    Timestamp("2012-08-15", tz="UTC"),
-    Timestamp("2012-08-20", tz="UTC"),
-    Timestamp("2012-09-19", tz="UTC"),
-    Timestamp("2012-10-02", tz="UTC"),
-    Timestamp("2012-10-24", tz="UTC"),
-    Timestamp("2012-11-14", tz="UTC"),
-    Timestamp("2012-11-28", tz="UTC"),
-    Timestamp("2012-12-25", tz="UTC"),
-    Timestamp("2013-03-27", tz="UTC"),
-    Timestamp("2013-03-29", tz="UTC"),
-    Timestamp("2013-04-19", tz="UTC"),
-    Timestamp("2013-04-24", tz="UTC"),
-    Timestamp("2013-05-01", tz="UTC"),
-    Timestamp("2013-08-09", tz="UTC"),
-    Timestamp("2013-08-15", tz="UTC"),
-    Timestamp("2013-09-09", tz="UTC"),
-    Timestamp("2013-10-02", tz="UTC"),
-    Timestamp("2013-10-16", tz="UTC"),
-    Timestamp("2013-11-04", tz="UTC"),
-    Timestamp("2013-11-15", tz="UTC"),
-    Timestamp("2013-12-25", tz="UTC"),
-    Timestamp("2014-02-27", tz="UTC"),
-    Timestamp("2014-03-17", tz="UTC"),
-    Timestamp("2014-04-08", tz="UTC"),
-    Timestamp("2014-04-14", tz="UTC"),
-    Timestamp("2014-04-18", tz="UTC"),
-    Timestamp("2014-04-24", tz="UTC"),
-    Timestamp("2014-05-01", tz="UTC"),
-    Timestamp("2014-07-29", tz="UTC"),
-    Timestamp("2014-08-15", tz="UTC"),
-    Timestamp("2014-08-29", tz="UTC"),
-    Timestamp("2014-10-02", tz="UTC"),
-    Timestamp("2014-10-03", tz="UTC"),
-    Timestamp("2014-10-06", tz="UTC"),
-    Timestamp("2014-10-15", tz="UTC"),
-    Timestamp("2014-10-24", tz="UTC"),
-    Timestamp("2014-11-04", tz="UTC"),
-    Timestamp("2014-11-06", tz="UTC"),
-    Timestamp("2014-12-25", tz="UTC"),
-    Timestamp("2015-01-26", tz="UTC"),
-    Timestamp("2015-02-17", tz="UTC"),
-    Timestamp("2015-03-06", tz="UTC"),
-    Timestamp("2015-04-02", tz="UTC"),
-    Timestamp("2015-04-03", tz="UTC"),
-    Timestamp("2015-04-14", tz="UTC"),
-    Timestamp("2015-05-01", tz="UTC"),
-    Timestamp("2015-09-17", tz="UTC"),
-    Timestamp("2015-09-25", tz="UTC"),
-    Timestamp("2015-10-02", tz="UTC"),
-    Timestamp("2015-10-22", tz="UTC"),
-    Timestamp("2015-11-12", tz="UTC"),
-    Timestamp("2015-11-25", tz="UTC"),
-    Timestamp("2015-12-25", tz="UTC"),
-    Timestamp("2016-01-26", tz="UTC"),
-    Timestamp("2016-03-07", tz="UTC"),
-    Timestamp("2016-03-24", tz="UTC"),
-    Timestamp("2016-03-25", tz="UTC"),
-    Timestamp("2016-04-14", tz="UTC"),
-    Timestamp("2016-04-15", tz="UTC"),
-    Timestamp("2016-04-19", tz="UTC"),
-    Timestamp("2016-07-06", tz="UTC"),
-    Timestamp("2016-08-15", tz="UTC"),
-    Timestamp("2016-09-05", tz="UTC"),
-    Timestamp("2016-09-13", tz="UTC"),
-    Timestamp("2016-10-11", tz="UTC"),
-    Timestamp("2016-10-12", tz="UTC"),
-    Timestamp("2016-10-31", tz="UTC"),
-    Timestamp("2016-11-14", tz="UTC"),
-    Timestamp("2017-01-26", tz="UTC"),
-    Timestamp("2017-02-24", tz="UTC"),
-    Timestamp("2017-03-13", tz="UTC"),
-    Timestamp("2017-04-04", tz="UTC"),
-    Timestamp("2017-04-14", tz="UTC"),
-    Timestamp("2017-05-01", tz="UTC"),
-    Timestamp("2017-06-26", tz="UTC"),
-    Timestamp("2017-08-15", tz="UTC"),
-    Timestamp("2017-08-25", tz="UTC"),
-    Timestamp("2017-10-02", tz="UTC"),
-    Timestamp("2017-10-20", tz="UTC"),
-    Timestamp("2017-12-25", tz="UTC"),
-    Timestamp("2018-01-26", tz="UTC"),
-    Timestamp("2018-02-13", tz="UTC"),
-    Timestamp("2018-03-02", tz="UTC"),
-    Timestamp("2018-03-29", tz="UTC"),
-    Timestamp("2018-03-30", tz="UTC"),
-    Timestamp("2018-05-01", tz="UTC"),
-    Timestamp("2018-08-15", tz="UTC"),
-    Timestamp("2018-08-22", tz="UTC"),
-    Timestamp("2018-09-13", tz="UTC"),
-    Timestamp("2018-09-20", tz="UTC"),
-    Timestamp("2018-10-02", tz="UTC"),
-    Timestamp("2018-10-18", tz="UTC"),
-    Timestamp("2018-11-08", tz="UTC"),
-    Timestamp("2018-11-23", tz="UTC"),
-    Timestamp("2018-12-25", tz="UTC"),
-    Timestamp("2019-01-26", tz="UTC"),
-    Timestamp("2019-03-02", tz="UTC"),
-    Timestamp("2019-03-04", tz="UTC"),
-    Timestamp("2019-03-21", tz="UTC"),
-    Timestamp("2019-04-17", tz="UTC"),
-    Timestamp("2019-04-19", tz="UTC"),
-    Timestamp("2019-04-29", tz="UTC"),
-    Timestamp("2019-05-01", tz="UTC"),
-    Timestamp("2019-06-05", tz="UTC"),
-    Timestamp("2019-08-12", tz="UTC"),
-    Timestamp("2019-08-15", tz="UTC"),
-    Timestamp("2019-09-02", tz="UTC"),
-    Timestamp("2019-09-10", tz="UTC"),
-    Timestamp("2019-10-02", tz="UTC"),
-    Timestamp("2019-10-08", tz="UTC"),
-    Timestamp("2019-10-21", tz="UTC"),
-    Timestamp("2019-10-28", tz="UTC"),
-    Timestamp("2019-11-12", tz="UTC"),
-    Timestamp("2019-12-25", tz="UTC"),
-    Timestamp("2020-02-21", tz="UTC"),
-    Timestamp("2020-03-10", tz="UTC"),
-    Timestamp("2020-04-02", tz="UTC"),
-    Timestamp("2020-04-06", tz="UTC"),
-    Timestamp("2020-04-10", tz="UTC"),
-    Timestamp("2020-04-14", tz="UTC"),
-    Timestamp("2020-05-01", tz="UTC"),
-    Timestamp("2020-07-31", tz="UTC"),
-    Timestamp("2020-10-02", tz="UTC"),
-    Timestamp("2020-11-16", tz="UTC"),
-    Timestamp("2020-11-30", tz="UTC"),
-    Timestamp("2020-12-25", tz="UTC"),
-    Timestamp("2021-01-26", tz="UTC"),  # Republic Day
-    Timestamp("2021-03-11", tz="UTC"),  # Maha Shivaratri
-    Timestamp("2021-03-29", tz="UTC"),  # Holi
-    Timestamp("2021-04-02", tz="UTC"),  # Good Friday
-    Timestamp("2021-04-14", tz="UTC"),  # Dr.Baba Saheb Ambedkar Jayanti
-    Timestamp("2021-04-21", tz="UTC"),  # Ram Navami
-    Timestamp("2021-05-13", tz="UTC"),  # Id-ul-Fitr
-    Timestamp("2021-07-21", tz="UTC"),  # Id-al-Adha
-    Timestamp("2021-08-19", tz="UTC"),  # Ashura
-    Timestamp("2021-09-10", tz="UTC"),  # Ganesh Chaturthi
-    Timestamp("2021-10-15", tz="UTC"),  # Vijaya Dashami
-    Timestamp("2021-11-04", tz="UTC"),  # Diwali/Laxmi Puja. muhurat trading day
-    Timestamp("2021-11-05", tz="UTC"),  # Diwali/Laxmi Puja
-    Timestamp("2021-11-19", tz="UTC"),  # Guru Nanak Jayanti
-    Timestamp("2022-01-26", tz="UTC"),  # Republic Day
-    Timestamp("2022-03-01", tz="UTC"),  # Maha Shivaratri
-    Timestamp("2022-03-18", tz="UTC"),  # Holi
-    Timestamp("2022-04-14", tz="UTC"),  # Dr.Baba Saheb Ambedkar Jayanti
-    Timestamp("2022-04-15", tz="UTC"),  # Good Friday
-    Timestamp("2022-05-03", tz="UTC"),  # Id-ul-Fitr
-    Timestamp("2022-08-09", tz="UTC"),  # Moharram
-    Timestamp("2022-08-15", tz="UTC"),  # Independence Day
-    Timestamp("2022-08-31", tz="UTC"),  # Ganesh Chaturthi
-    Timestamp("2022-10-05", tz="UTC"),  # Vijaya Dashami
-    Timestamp("2022-10-24", tz="UTC"),  # Diwali/Laxmi Puja. muhurat trading day
-    Timestamp("2022-10-26", tz="UTC"),  # Diwali-Balipratipada
-    Timestamp("2022-11-08", tz="UTC"),  # Guru Nanak Jayanti
-    Timestamp("2023-01-26", tz="UTC"),  # Thu, Republic Day
-    Timestamp("2023-03-07", tz="UTC"),  # Wed, Holi
-    Timestamp("2023-03-18", tz="UTC"),  # Sat, Maha Shivaratri
-    Timestamp("2023-03-30", tz="UTC"),  # Thu, Ramanavami
-    Timestamp("2023-04-04", tz="UTC"),  # Tue, Mahavir Jayanthi
-    Timestamp("2023-04-07", tz="UTC"),  # Fri, Good Friday
-    Timestamp("2023-04-14", tz="UTC"),  # Fri, Ambedkar Jayanti
-    Timestamp("2023-04-22", tz="UTC"),  # Sat, EID AL FITR
-    Timestamp("2023-05-01", tz="UTC"),  # Mon, Maharashtra Din
-    Timestamp("2023-06-29", tz="UTC"),  # Wed, Bakri Id / Eid ul-Adha
-    Timestamp("2023-08-15", tz="UTC"),  # Tue, Independence Day
-    Timestamp("2023-09-19", tz="UTC"),  # Tue, Ganesh Chaturthi
-    Timestamp("2023-10-02", tz="UTC"),  # Mon, Gandhi Jayanti
-    Timestamp("2023-10-24", tz="UTC"),  # Tue, Dussehra
-    Timestamp("2023-11-12", tz="UTC"),  # Sun, Diwali
-    Timestamp("2023-11-14", tz="UTC"),  # Tue, Diwali
-    Timestamp("2023-11-27", tz="UTC"),  # Mon, Guru Nanak's Birthday
-    Timestamp("2023-12-25", tz="UTC"),  # Mon, Christmas
-    Timestamp("2024-01-26", tz="UTC"),  # Fri, Republic Day
-    Timestamp("2024-03-08", tz="UTC"),  # Fri, Mahashivratri
-    Timestamp("2024-03-25", tz="UTC"),  # Mon, Holi
-    Timestamp("2024-03-29", tz="UTC"),  # Fri, Good Friday
-    Timestamp("2024-04-11", tz="UTC"),  # Thu, Id-Ul-Fitr (Ramadan Eid)
-    Timestamp("2024-04-17", tz="UTC"),  # Wed, Shri Ram Navmi
-    Timestamp("2024-05-01", tz="UTC"),  # Wed, Maharashtra Din
-    Timestamp("2024-06-17", tz="UTC"),  # Mon, Bakri Id / Eid ul-Adha
-    Timestamp("2024-07-17", tz="UTC"),  # Wed, Moharram
-    Timestamp("2024-08-15", tz="UTC"),  # Thu, Independence Day
-    Timestamp("2024-10-02", tz="UTC"),  # Wed, Mahatma Gandhi Jayanti
-    Timestamp("2024-11-01", tz="UTC"),  # Fri, Diwali
-    Timestamp("2024-11-15", tz="UTC"),  # Fri, Guru Nanak's Birthday
-    Timestamp("2024-12-25", tz="UTC"),  # Wed, Christmas
-    Timestamp("2025-02-26", tz="UTC"),  # Wed, Mahashivratri
-    Timestamp("2025-03-14", tz="UTC"),  # Fri, Holi
-    Timestamp("2025-03-31", tz="UTC"),  # Mon, Id-Ul-Fitr (Ramadan Eid)
-    Timestamp("2025-04-10", tz="UTC"),  # Thu, Shri Mahavir Jayanti
-    Timestamp("2025-04-14", tz="UTC"),  # Mon, Dr. Baba Saheb Ambedkar Jayanti
-    Timestamp("2025-04-18", tz="UTC"),  # Fri, Good Friday
-    Timestamp("2025-05-01", tz="UTC"),  # Thu, Maharashtra Day
-    Timestamp("2025-08-15", tz="UTC"),  # Fri, Independence Day / Parsi New Year
-    Timestamp("2025-08-27", tz="UTC"),  # Wed, Shri Ganesh Chaturthi
-    Timestamp("2025-10-02", tz="UTC"),  # Thu, Mahatma Gandhi Jayanti / Dussehra
-    Timestamp("2025-10-21", tz="UTC"),  # Tue, Diwali Laxmi Pujan
-    Timestamp("2025-10-22", tz="UTC"),  # Wed, Balipratipada
-    Timestamp("2025-11-05", tz="UTC"),  # Wed, Prakash Gurpurb Sri Guru Nanak Dev
-    Timestamp("2025-12-25", tz="UTC"),  # Thu, Christmas
-    Timestamp("2026-01-26", tz="UTC"),  # Mon, Republic Day
-    Timestamp("2026-03-03", tz="UTC"),  # Tue, Holi
-    Timestamp("2026-03-26", tz="UTC"),  # Thu, Shri Ram Navami
-    Timestamp("2026-03-31", tz="UTC"),  # Tue, Shri Mahavir Jayanti
-    Timestamp("2026-04-03", tz="UTC"),  # Fri, Good Friday
-    Timestamp("2026-04-14", tz="UTC"),  # Tue, Dr. Baba Saheb Ambedkar Jayanti
-    Timestamp("2026-05-01", tz="UTC"),  # Fri, Maharashtra Day
-    Timestamp("2026-05-28", tz="UTC"),  # Thu, Bakri Id
-    Timestamp("2026-06-26", tz="UTC"),  # Fri, Muharram
-    Timestamp("2026-09-14", tz="UTC"),  # Mon, Ganesh Chaturthi
-    Timestamp("2026-10-02", tz="UTC"),  # Fri, Mahatma Gandhi Jayanti
-    Timestamp("2026-10-20", tz="UTC"),  # Tue, Dussehra
-    Timestamp("2026-11-10", tz="UTC"),  # Tue, Diwali-Balipratipada
-    Timestamp("2026-11-24", tz="UTC"),  # Tue, Prakash Gurpurb Sri Guru Nanak Dev
-    Timestamp("2026-12-25", tz="UTC"),  # Fri, Christmas
-]
+BSEClosedDay = adhoc_dates(
+    [
+        "1997-01-23",
+        "1997-03-07",
+        "1997-03-24",
+        "1997-04-08",
+        "1997-04-14",
+        "1997-04-16",
+        "1997-04-18",
+        "1997-05-01",
+        "1997-05-08",
+        "1997-08-15",
+        "1997-08-18",
+        "1997-08-25",
+        "1997-10-02",
+        "1997-10-28",
+        "1997-10-29",
+        "1997-10-31",
+        "1997-12-25",
+        "1998-04-09",
+        "1998-04-14",
+        "1998-04-28",
+        "1998-12-25",
+        "1999-01-01",
+        "1999-01-20",
+        "1999-01-26",
+        "1999-03-02",
+        "1999-03-18",
+        "1999-03-25",
+        "1999-03-29",
+        "1999-04-02",
+        "1999-04-14",
+        "1999-04-27",
+        "1999-04-30",
+        "1999-09-13",
+        "1999-10-19",
+        "1999-11-08",
+        "1999-11-10",
+        "1999-11-23",
+        "1999-12-31",
+        "2000-01-26",
+        "2000-03-17",
+        "2000-03-20",
+        "2000-04-14",
+        "2000-04-21",
+        "2000-05-01",
+        "2000-08-15",
+        "2000-09-01",
+        "2000-10-02",
+        "2000-12-25",
+        "2001-01-01",
+        "2001-01-26",
+        "2001-03-06",
+        "2001-04-05",
+        "2001-04-13",
+        "2001-05-01",
+        "2001-08-15",
+        "2001-08-22",
+        "2001-10-02",
+        "2001-10-26",
+        "2001-11-16",
+        "2001-11-30",
+        "2001-12-17",
+        "2001-12-25",
+        "2002-03-25",
+        "2002-03-29",
+        "2002-05-01",
+        "2002-08-15",
+        "2002-09-10",
+        "2002-10-02",
+        "2002-10-15",
+        "2002-11-06",
+        "2002-11-19",
+        "2002-12-25",
+        "2003-02-13",
+        "2003-03-14",
+        "2003-03-18",
+        "2003-04-14",
+        "2003-04-18",
+        "2003-05-01",
+        "2003-08-15",
+        "2003-10-02",
+        "2003-11-26",
+        "2003-12-25",
+        "2004-01-01",
+        "2004-01-26",
+        "2004-02-02",
+        "2004-03-02",
+        "2004-04-09",
+        "2004-04-14",
+        "2004-04-26",
+        "2004-10-13",
+        "2004-10-22",
+        "2004-11-15",
+        "2004-11-26",
+        "2005-01-21",
+        "2005-01-26",
+        "2005-03-25",
+        "2005-04-14",
+        "2005-07-28",
+        "2005-08-15",
+        "2005-09-07",
+        "2005-10-12",
+        "2005-11-03",
+        "2005-11-04",
+        "2005-11-15",
+        "2006-01-11",
+        "2006-01-26",
+        "2006-02-09",
+        "2006-03-15",
+        "2006-04-06",
+        "2006-04-11",
+        "2006-04-14",
+        "2006-05-01",
+        "2006-08-15",
+        "2006-10-02",
+        "2006-10-24",
+        "2006-10-25",
+        "2006-12-25",
+        "2007-01-01",
+        "2007-01-26",
+        "2007-01-30",
+        "2007-02-16",
+        "2007-03-27",
+        "2007-04-06",
+        "2007-05-01",
+        "2007-05-02",
+        "2007-08-15",
+        "2007-10-02",
+        "2007-12-21",
+        "2007-12-25",
+        "2008-03-06",
+        "2008-03-20",
+        "2008-03-21",
+        "2008-04-14",
+        "2008-04-18",
+        "2008-05-01",
+        "2008-05-19",
+        "2008-08-15",
+        "2008-09-03",
+        "2008-10-02",
+        "2008-10-09",
+        "2008-10-30",
+        "2008-11-13",
+        "2008-11-27",
+        "2008-12-09",
+        "2008-12-25",
+        "2009-01-08",
+        "2009-01-26",
+        "2009-02-23",
+        "2009-03-10",
+        "2009-03-11",
+        "2009-04-03",
+        "2009-04-07",
+        "2009-04-10",
+        "2009-04-14",
+        "2009-04-30",
+        "2009-05-01",
+        "2009-09-21",
+        "2009-09-28",
+        "2009-10-02",
+        "2009-10-13",
+        "2009-10-19",
+        "2009-11-02",
+        "2009-12-25",
+        "2009-12-28",
+        "2010-01-01",
+        "2010-01-26",
+        "2010-02-12",
+        "2010-03-01",
+        "2010-03-24",
+        "2010-04-02",
+        "2010-04-14",
+        "2010-09-10",
+        "2010-11-17",
+        "2010-12-17",
+        "2011-01-26",
+        "2011-03-02",
+        "2011-04-12",
+        "2011-04-14",
+        "2011-04-22",
+        "2011-08-15",
+        "2011-08-31",
+        "2011-09-01",
+        "2011-10-06",
+        "2011-10-27",
+        "2011-11-07",
+        "2011-11-10",
+        "2011-12-06",
+        "2012-01-26",
+        "2012-02-20",
+        "2012-03-08",
+        "2012-04-05",
+        "2012-04-06",
+        "2012-05-01",
+        "2012-08-15",
+        "2012-08-20",
+        "2012-09-19",
+        "2012-10-02",
+        "2012-10-24",
+        "2012-11-14",
+        "2012-11-28",
+        "2012-12-25",
+        "2013-03-27",
+        "2013-03-29",
+        "2013-04-19",
+        "2013-04-24",
+        "2013-05-01",
+        "2013-08-09",
+        "2013-08-15",
+        "2013-09-09",
+        "2013-10-02",
+        "2013-10-16",
+        "2013-11-04",
+        "2013-11-15",
+        "2013-12-25",
+        "2014-02-27",
+        "2014-03-17",
+        "2014-04-08",
+        "2014-04-14",
+        "2014-04-18",
+        "2014-04-24",
+        "2014-05-01",
+        "2014-07-29",
+        "2014-08-15",
+        "2014-08-29",
+        "2014-10-02",
+        "2014-10-03",
+        "2014-10-06",
+        "2014-10-15",
+        "2014-10-24",
+        "2014-11-04",
+        "2014-11-06",
+        "2014-12-25",
+        "2015-01-26",
+        "2015-02-17",
+        "2015-03-06",
+        "2015-04-02",
+        "2015-04-03",
+        "2015-04-14",
+        "2015-05-01",
+        "2015-09-17",
+        "2015-09-25",
+        "2015-10-02",
+        "2015-10-22",
+        "2015-11-12",
+        "2015-11-25",
+        "2015-12-25",
+        "2016-01-26",
+        "2016-03-07",
+        "2016-03-24",
+        "2016-03-25",
+        "2016-04-14",
+        "2016-04-15",
+        "2016-04-19",
+        "2016-07-06",
+        "2016-08-15",
+        "2016-09-05",
+        "2016-09-13",
+        "2016-10-11",
+        "2016-10-12",
+        "2016-10-31",
+        "2016-11-14",
+        "2017-01-26",
+        "2017-02-24",
+        "2017-03-13",
+        "2017-04-04",
+        "2017-04-14",
+        "2017-05-01",
+        "2017-06-26",
+        "2017-08-15",
+        "2017-08-25",
+        "2017-10-02",
+        "2017-10-20",
+        "2017-12-25",
+        "2018-01-26",
+        "2018-02-13",
+        "2018-03-02",
+        "2018-03-29",
+        "2018-03-30",
+        "2018-05-01",
+        "2018-08-15",
+        "2018-08-22",
+        "2018-09-13",
+        "2018-09-20",
+        "2018-10-02",
+        "2018-10-18",
+        "2018-11-08",
+        "2018-11-23",
+        "2018-12-25",
+        "2019-01-26",
+        "2019-03-02",
+        "2019-03-04",
+        "2019-03-21",
+        "2019-04-17",
+        "2019-04-19",
+        "2019-04-29",
+        "2019-05-01",
+        "2019-06-05",
+        "2019-08-12",
+        "2019-08-15",
+        "2019-09-02",
+        "2019-09-10",
+        "2019-10-02",
+        "2019-10-08",
+        "2019-10-21",
+        "2019-10-28",
+        "2019-11-12",
+        "2019-12-25",
+        "2020-02-21",
+        "2020-03-10",
+        "2020-04-02",
+        "2020-04-06",
+        "2020-04-10",
+        "2020-04-14",
+        "2020-05-01",
+        "2020-07-31",
+        "2020-10-02",
+        "2020-11-16",
+        "2020-11-30",
+        "2020-12-25",
+        "2021-01-26",  # Republic Day
+        "2021-03-11",  # Maha Shivaratri
+        "2021-03-29",  # Holi
+        "2021-04-02",  # Good Friday
+        "2021-04-14",  # Dr.Baba Saheb Ambedkar Jayanti
+        "2021-04-21",  # Ram Navami
+        "2021-05-13",  # Id-ul-Fitr
+        "2021-07-21",  # Id-al-Adha
+        "2021-08-19",  # Ashura
+        "2021-09-10",  # Ganesh Chaturthi
+        "2021-10-15",  # Vijaya Dashami
+        "2021-11-04",  # Diwali/Laxmi Puja. muhurat trading day
+        "2021-11-05",  # Diwali/Laxmi Puja
+        "2021-11-19",  # Guru Nanak Jayanti
+        "2022-01-26",  # Republic Day
+        "2022-03-01",  # Maha Shivaratri
+        "2022-03-18",  # Holi
+        "2022-04-14",  # Dr.Baba Saheb Ambedkar Jayanti
+        "2022-04-15",  # Good Friday
+        "2022-05-03",  # Id-ul-Fitr
+        "2022-08-09",  # Moharram
+        "2022-08-15",  # Independence Day
+        "2022-08-31",  # Ganesh Chaturthi
+        "2022-10-05",  # Vijaya Dashami
+        "2022-10-24",  # Diwali/Laxmi Puja. muhurat trading day
+        "2022-10-26",  # Diwali-Balipratipada
+        "2022-11-08",  # Guru Nanak Jayanti
+        "2023-01-26",  # Thu, Republic Day
+        "2023-03-07",  # Wed, Holi
+        "2023-03-18",  # Sat, Maha Shivaratri
+        "2023-03-30",  # Thu, Ramanavami
+        "2023-04-04",  # Tue, Mahavir Jayanthi
+        "2023-04-07",  # Fri, Good Friday
+        "2023-04-14",  # Fri, Ambedkar Jayanti
+        "2023-04-22",  # Sat, EID AL FITR
+        "2023-05-01",  # Mon, Maharashtra Din
+        "2023-06-29",  # Wed, Bakri Id / Eid ul-Adha
+        "2023-08-15",  # Tue, Independence Day
+        "2023-09-19",  # Tue, Ganesh Chaturthi
+        "2023-10-02",  # Mon, Gandhi Jayanti
+        "2023-10-24",  # Tue, Dussehra
+        "2023-11-12",  # Sun, Diwali
+        "2023-11-14",  # Tue, Diwali
+        "2023-11-27",  # Mon, Guru Nanak's Birthday
+        "2023-12-25",  # Mon, Christmas
+        "2024-01-26",  # Fri, Republic Day
+        "2024-03-08",  # Fri, Mahashivratri
+        "2024-03-25",  # Mon, Holi
+        "2024-03-29",  # Fri, Good Friday
+        "2024-04-11",  # Thu, Id-Ul-Fitr (Ramadan Eid)
+        "2024-04-17",  # Wed, Shri Ram Navmi
+        "2024-05-01",  # Wed, Maharashtra Din
+        "2024-06-17",  # Mon, Bakri Id / Eid ul-Adha
+        "2024-07-17",  # Wed, Moharram
+        "2024-08-15",  # Thu, Independence Day
+        "2024-10-02",  # Wed, Mahatma Gandhi Jayanti
+        "2024-11-01",  # Fri, Diwali
+        "2024-11-15",  # Fri, Guru Nanak's Birthday
+        "2024-12-25",  # Wed, Christmas
+        "2025-02-26",  # Wed, Mahashivratri
+        "2025-03-14",  # Fri, Holi
+        "2025-03-31",  # Mon, Id-Ul-Fitr (Ramadan Eid)
+        "2025-04-10",  # Thu, Shri Mahavir Jayanti
+        "2025-04-14",  # Mon, Dr. Baba Saheb Ambedkar Jayanti
+        "2025-04-18",  # Fri, Good Friday
+        "2025-05-01",  # Thu, Maharashtra Day
+        "2025-08-15",  # Fri, Independence Day / Parsi New Year
+        "2025-08-27",  # Wed, Shri Ganesh Chaturthi
+        "2025-10-02",  # Thu, Mahatma Gandhi Jayanti / Dussehra
+        "2025-10-21",  # Tue, Diwali Laxmi Pujan
+        "2025-10-22",  # Wed, Balipratipada
+        "2025-11-05",  # Wed, Prakash Gurpurb Sri Guru Nanak Dev
+        "2025-12-25",  # Thu, Christmas
+        "2026-01-26",  # Mon, Republic Day
+        "2026-03-03",  # Tue, Holi
+        "2026-03-26",  # Thu, Shri Ram Navami
+        "2026-03-31",  # Tue, Shri Mahavir Jayanti
+        "2026-04-03",  # Fri, Good Friday
+        "2026-04-14",  # Tue, Dr. Baba Saheb Ambedkar Jayanti
+        "2026-05-01",  # Fri, Maharashtra Day
+        "2026-05-28",  # Thu, Bakri Id
+        "2026-06-26",  # Fri, Muharram
+        "2026-09-14",  # Mon, Ganesh Chaturthi
+        "2026-10-02",  # Fri, Mahatma Gandhi Jayanti
+        "2026-10-20",  # Tue, Dussehra
+        "2026-11-10",  # Tue, Diwali-Balipratipada
+        "2026-11-24",  # Tue, Prakash Gurpurb Sri Guru Nanak Dev
+        "2026-12-25",  # Fri, Christmas
+    ],
+    tz="UTC",
+)
 
 
 class BSEExchangeCalendar(MarketCalendar):
@@ -1,6 +1,7 @@
 from datetime import time, timedelta
 from functools import partial
 
+import numpy as np
 from pandas import DateOffset, Timestamp
 from pandas.tseries.holiday import (
     AbstractHolidayCalendar,
@@ -12,18 +13,33 @@ from pandas.tseries.holiday import (
 from pandas.tseries.offsets import LastWeekOfMonth, WeekOfMonth
 from zoneinfo import ZoneInfo
 
+from pandas_market_calendars.calendar_utils import _n_days
+from pandas_market_calendars.holidays.adhoc import adhoc_dates
 from pandas_market_calendars.holidays.cn import (
     bsd_mapping,
     dbf_mapping,
     dnf_mapping,
+    lunisolar_days,
     maf_mapping,
     sf_mapping,
     tsd_mapping,
 )
+from pandas_market_calendars.holidays.compiler import observance_kernel, vectorized_observance, weekday_of, years_of
 from pandas_market_calendars.holidays.us import USNewYearsDay
 from pandas_market_calendars.market_calendar import MarketCalendar
 
 
+def _process_date(days, mapping=None, func=None, delta=None, offset=None):
+    if mapping:
+        days = lunisolar_days(mapping, days)
+    if delta:
+        days = days + _n_days(delta)
+    if offset:
+        days = days + _n_days(np.where(weekday_of(days) == 6, offset, 0))
+    return observance_kernel(func)(days) if func else days
+
+
+@vectorized_observance(_process_date)
 def process_date(dt, mapping=None, func=None, delta=None, offset=None):
     if mapping and (dt.year in mapping):
         new_dt = mapping[dt.year]
@@ -39,6 +55,25 @@ def process_date(dt, mapping=None, func=None, delta=None, offset=None):
     return new_dt
 
 
+def _nth_monday(months, week):
+    first = months.astype("datetime64[D]")
+    return first + _n_days((0 - weekday_of(first)) % 7 + 7 * week)
+
+
+def _process_queen_birthday(days):
+    years = years_of(days)
+    # WeekOfMonth(week=week, weekday=0) moves to the Monday of this month, or of the next one once it is past
+    week = np.select([np.isin(years, [1983, 1988, 1993, 1994]), years == 1985], [1, 3], 2)
+    month = days.astype("datetime64[M]")
+    monday = _nth_monday(month, week)
+    after_1983 = np.where(days < monday, monday, _nth_monday(month + np.timedelta64(1, "M"), week))
+
+    sunday_after = days + _n_days((6 - weekday_of(days)) % 7)
+    before_1983 = days + _n_days(weekday_of(days) == 6)
+    return np.select([np.isin(years, [1974, 1981]), years < 1983], [sunday_after, before_1983], after_1983)
+
+
+@vectorized_observance(_process_queen_birthday)
 def process_queen_birthday(dt):
     # before 1983
     if dt.year in [1974, 1981]:
@@ -268,92 +303,95 @@ IDontKnow = Holiday(
     end_date=Timestamp("1983-01-01"),
 )
 
-HKClosedDay = [
-    # I dont know these days
-    Timestamp("1970-07-01", tz="UTC"),
-    Timestamp("1971-07-01", tz="UTC"),
-    Timestamp("1973-07-02", tz="UTC"),
-    Timestamp("1974-07-01", tz="UTC"),
-    Timestamp("1975-07-01", tz="UTC"),
-    Timestamp("1976-07-01", tz="UTC"),
-    Timestamp("1977-07-01", tz="UTC"),
-    Timestamp("1979-07-02", tz="UTC"),
-    Timestamp("1980-07-01", tz="UTC"),
-    Timestamp("1981-07-01", tz="UTC"),
-    Timestamp("1982-07-01", tz="UTC"),
-    Timestamp("1971-03-22", tz="UTC"),
-    Timestamp("1971-12-06", tz="UTC"),
-    Timestamp("1971-12-20", tz="UTC"),
-    Timestamp("1975-07-28", tz="UTC"),
-    Timestamp("1985-07-29", tz="UTC"),
-    Timestamp("1970-07-16", tz="UTC"),  # 台风Ruby7003
-    Timestamp("1970-09-14", tz="UTC"),  # 台风Georgia7011
-    Timestamp("1971-07-22", tz="UTC"),  # 台风Lucy7114
-    Timestamp("1971-08-31", tz="UTC"),  # 重光纪念日?
-    Timestamp("1973-04-16", tz="UTC"),  # 股灾休市?
-    Timestamp("1973-07-17", tz="UTC"),  # 台风Dot7304
-    Timestamp("1974-04-25", tz="UTC"),  # 英国女王生日
-    Timestamp("1975-10-14", tz="UTC"),  # 台风Elsie7514
-    Timestamp("1978-07-26", tz="UTC"),  # 台风Agnes7807
-    Timestamp("1978-07-27", tz="UTC"),
-    Timestamp("1979-01-26", tz="UTC"),  # 春节补假
-    Timestamp("1979-08-02", tz="UTC"),  # 台风Hope7908
-    Timestamp("1980-05-21", tz="UTC"),  # 台风Georgia8004
-    Timestamp("1980-07-22", tz="UTC"),  # 台风Joy8007
-    Timestamp("1981-04-27", tz="UTC"),  # 英国女王生日
-    Timestamp("1981-07-06", tz="UTC"),  # 台风Lynn8106
-    Timestamp("1981-07-07", tz="UTC"),
-    Timestamp("1981-07-29", tz="UTC"),  # 查理斯王子与戴安娜婚礼
-    Timestamp("1983-09-09", tz="UTC"),  # 台风Ellen8309
-    Timestamp("1985-06-24", tz="UTC"),  # 台风Hal8504
-    Timestamp("1986-04-01", tz="UTC"),  # 复活节星期一翌日
-    Timestamp("1986-10-22", tz="UTC"),  # 英女王伊丽莎白二世访港
-    Timestamp("1987-10-20", tz="UTC"),  # 黑色星期一后,休市4天
-    Timestamp("1987-10-21", tz="UTC"),
-    Timestamp("1987-10-22", tz="UTC"),
-    Timestamp("1987-10-23", tz="UTC"),
-    Timestamp("1988-04-05", tz="UTC"),  # 清明节翌日
-    # Timestamp('1988-06-13', tz='UTC'),  # 英国女王生日
-    Timestamp("1991-06-18", tz="UTC"),  # 英国女王生日翌日
-    Timestamp("1992-07-22", tz="UTC"),  # 台风Cary9207
-    # Timestamp('1993-06-14', tz='UTC'),  # 英国女王生日
-    Timestamp("1993-09-17", tz="UTC"),  # 台风Becky9316
-    Timestamp("1994-06-14", tz="UTC"),  # 英国女王生日翌日,端午节翌日
-    Timestamp("1997-06-30", tz="UTC"),  # 英国女王生日
-    Timestamp("1997-07-02", tz="UTC"),  # 香港回归纪念日翌日
-    Timestamp("1997-08-18", tz="UTC"),  # 抗战胜利纪念日
-    Timestamp("1997-10-02", tz="UTC"),  # 国庆节翌日
-    Timestamp("1998-08-17", tz="UTC"),  # 抗战胜利纪念日
-    Timestamp("1998-10-02", tz="UTC"),  # 国庆节翌日
-    Timestamp("1999-04-06", tz="UTC"),  # 清明节翌日
-    Timestamp("1999-09-16", tz="UTC"),  # 台风约克
-    Timestamp("1999-12-31", tz="UTC"),  # 千年虫
-    Timestamp("2001-07-06", tz="UTC"),  # 台风尤特0104
-    Timestamp("2001-07-25", tz="UTC"),  # 台风玉兔0107
-    # Timestamp(2008-06-25', tz='UTC'),  # 台风风神0806,上午休市
-    Timestamp("2008-08-06", tz="UTC"),  # 台风北冕0809
-    Timestamp("2008-08-22", tz="UTC"),  # 台风鹦鹉0810
-    # Timestamp(2009-09-15', tz='UTC'),  # 台风巨爵0915,上午休市
-    Timestamp("2010-04-06", tz="UTC"),  # 清明节翌日
-    Timestamp("2011-09-29", tz="UTC"),  # 台风纳沙1117
-    # Timestamp(2012-07-24', tz='UTC'),  # 台风韦森特1208,上午休市
-    Timestamp("2012-10-02", tz="UTC"),  # 中秋节补假
-    # Timestamp(2013-05-22', tz='UTC'),  # 暴雨,上午休市
-    Timestamp("2013-08-14", tz="UTC"),  # 台风尤特1311
-    # Timestamp(2013-09-23', tz='UTC'),  # 台风天兔1319,上午休市
-    # Timestamp(2014-09-16', tz='UTC'),  # 台风海鸥1415,上午休市
-    Timestamp("2015-04-07", tz="UTC"),  # 复活节+清明节补假
-    # Timestamp(2015-07-09', tz='UTC'),  # 台风莲花1520,期货夜盘休市
-    Timestamp("2015-09-03", tz="UTC"),  # 抗战70周年纪念
-    # Timestamp(2016-08-01', tz='UTC'),  # 台风妮妲1604,期货夜盘20:55收市
-    Timestamp("2016-08-02", tz="UTC"),  # 台风妮妲1604
-    Timestamp("2016-10-21", tz="UTC"),  # 台风海马1622
-    # Timestamp(2017-06-12', tz='UTC'),  # 台风苗柏1702,期货夜盘17:35休市
-    Timestamp("2017-08-23", tz="UTC"),  # 台风天鸽1713
-    Timestamp("2023-07-17", tz="UTC"),  # Typhoon closure
-    Timestamp("2023-09-01", tz="UTC"),  # Typhoon closure
-    Timestamp("2023-09-08", tz="UTC"),  # Typhoon closure
-]
+HKClosedDay = adhoc_dates(
+    [
+        # I dont know these days
+        "1970-07-01",
+        "1971-07-01",
+        "1973-07-02",
+        "1974-07-01",
+        "1975-07-01",
+        "1976-07-01",
+        "1977-07-01",
+        "1979-07-02",
+        "1980-07-01",
+        "1981-07-01",
+        "1982-07-01",
+        "1971-03-22",
+        "1971-12-06",
+        "1971-12-20",
+        "1975-07-28",
+        "1985-07-29",
+        "1970-07-16",  # 台风Ruby7003
+        "1970-09-14",  # 台风Georgia7011
+        "1971-07-22",  # 台风Lucy7114
+        "1971-08-31",  # 重光纪念日?
+        "1973-04-16",  # 股灾休市?
+        "1973-07-17",  # 台风Dot7304
+        "1974-04-25",  # 英国女王生日
+        "1975-10-14",  # 台风Elsie7514
+        "1978-07-26",  # 台风Agnes7807
+        "1978-07-27",
+        "1979-01-26",  # 春节补假
+        "1979-08-02",  # 台风Hope7908
+        "1980-05-21",  # 台风Georgia8004
+        "1980-07-22",  # 台风Joy8007
+        "1981-04-27",  # 英国女王生日
+        "1981-07-06",  # 台风Lynn8106
+        "1981-07-07",
+        "1981-07-29",  # 查理斯王子与戴安娜婚礼
+        "1983-09-09",  # 台风Ellen8309
+        "1985-06-24",  # 台风Hal8504
+        "1986-04-01",  # 复活节星期一翌日
+        "1986-10-22",  # 英女王伊丽莎白二世访港
+        "1987-10-20",  # 黑色星期一后,休市4天
+        "1987-10-21",
+        "1987-10-22",
+        "1987-10-23",
+        "1988-04-05",  # 清明节翌日
+        # Timestamp('1988-06-13', tz='UTC'),  # 英国女王生日
+        "1991-06-18",  # 英国女王生日翌日
+        "1992-07-22",  # 台风Cary9207
+        # Timestamp('1993-06-14', tz='UTC'),  # 英国女王生日
+        "1993-09-17",  # 台风Becky9316
+        "1994-06-14",  # 英国女王生日翌日,端午节翌日
+        "1997-06-30",  # 英国女王生日
+        "1997-07-02",  # 香港回归纪念日翌日
+        "1997-08-18",  # 抗战胜利纪念日
+        "1997-10-02",  # 国庆节翌日
+        "1998-08-17",  # 抗战胜利纪念日
+        "1998-10-02",  # 国庆节翌日
+        "1999-04-06",  # 清明节翌日
+        "1999-09-16",  # 台风约克
+        "1999-12-31",  # 千年虫
+        "2001-07-06",  # 台风尤特0104
+        "2001-07-25",  # 台风玉兔0107
+        # Timestamp(2008-06-25', tz='UTC'),  # 台风风神0806,上午休市
+        "2008-08-06",  # 台风北冕0809
+        "2008-08-22",  # 台风鹦鹉0810
+        # Timestamp(2009-09-15', tz='UTC'),  # 台风巨爵0915,上午休市
+        "2010-04-06",  # 清明节翌日
+        "2011-09-29",  # 台风纳沙1117
+        # Timestamp(2012-07-24', tz='UTC'),  # 台风韦森特1208,上午休市
+        "2012-10-02",  # 中秋节补假
+        # Timestamp(2013-05-22', tz='UTC'),  # 暴雨,上午休市
+        "2013-08-14",  # 台风尤特1311
+        # Timestamp(2013-09-23', tz='UTC'),  # 台风天兔1319,上午休市
+        # Timestamp(2014-09-16', tz='UTC'),  # 台风海鸥1415,上午休市
+        "2015-04-07",  # 复活节+清明节补假
+        # Timestamp(2015-07-09', tz='UTC'),  # 台风莲花1520,期货夜盘休市
+        "2015-09-03",  # 抗战70周年纪念
+        # Timestamp(2016-08-01', tz='UTC'),  # 台风妮妲1604,期货夜盘20:55收市
+        "2016-08-02",  # 台风妮妲1604
+        "2016-10-21",  # 台风海马1622
+        # Timestamp(2017-06-12', tz='UTC'),  # 台风苗柏1702,期货夜盘17:35休市
+        "2017-08-23",  # 台风天鸽1713
+        "2023-07-17",  # Typhoon closure
+        "2023-09-01",  # Typhoon closure
+        "2023-09-08",  # Typhoon closure
+    ],
+    tz="UTC",
+)
 
 
 class HKEXExchangeCalendar(MarketCalendar):
@@ -2,6 +2,7 @@ from datetime import time
 from itertools import chain
 from typing import Literal, Union
 
+import numpy as np
 from pandas import DatetimeIndex, Timedelta, Timestamp
 from pandas.tseries.holiday import AbstractHolidayCalendar
 from zoneinfo import ZoneInfo
@@ -113,15 +114,10 @@ class IEXExchangeCalendar(NYSEExchangeCalendar):
     def special_opens(self):
         return []
 
-    def valid_days(self, start_date, end_date, tz="UTC"):
-        start_date = Timestamp(start_date)
-        if start_date.tz is not None:
-            # Ensure valid Comparison to "2013-08-25" is possible
-            start_date.tz_convert(self.tz).tz_localize(None)
-
-        # Limit Start_date to the Exchange's Open
-        start_date = max(start_date, Timestamp("2013-08-25"))
-        return super().valid_days(start_date, end_date, tz=tz)
+    def _day_bounds(self, start_date, end_date, tz):
+        first, last = super()._day_bounds(start_date, end_date, tz)
+        # Limit the first day to the Exchange's Open
+        return max(first, np.datetime64("2013-08-25", "D")), last
 
     def date_range_htf(
         self,
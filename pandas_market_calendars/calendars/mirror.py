@@ -4,10 +4,13 @@ Imported calendars from the exchange_calendars project
 GitHub: https://github.com/gerrymanoim/exchange_calendars
 """
 
+from functools import partial
+
 import exchange_calendars
 import pandas as pd
 from pandas.tseries.offsets import CustomBusinessDay
 
+from pandas_market_calendars.calendar_registry import _CALENDAR_NAMES
 from pandas_market_calendars.market_calendar import MarketCalendar
 
 
@@ -126,27 +129,47 @@ time_props = {
     "break_end_times": "break_end",
 }
 
-for exchange in calendars:
-    cal = calendars[exchange]
 
-    # this loop will set up the newly required regular_market_times dictionary
+def _regular_market_times(ec_class) -> dict:
+    """
+    :return: the regular_market_times dictionary of a mirrored calendar, from the times of the exchange_calendar
+    """
     regular_market_times = {}
     for prop, new in time_props.items():
-        times = getattr(cal, prop)
+        times = getattr(ec_class, prop)
         if times is None or isinstance(times, property):
             continue
         regular_market_times[new] = times
+    return regular_market_times
+
 
+def _create_mirror_class(exchange: str) -> type:
+    """
+    Creates and registers the TradingCalendar subclass that mirrors the exchange_calendar `exchange`.
+    The classes are only created when they are first requested, not for all exchanges when this module is imported.
+    """
     cal = type(
         exchange,
         (TradingCalendar,),
         {
             "_ec_class": calendars[exchange],
             "alias": [exchange],
-            "regular_market_times": regular_market_times,
+            "regular_market_times": _regular_market_times(calendars[exchange]),
         },
     )
-    locals()[f"{exchange}ExchangeCalendar"] = cal
+    globals()[f"{exchange}ExchangeCalendar"] = cal
+    return cal
+
+
+def __getattr__(name: str):
+    # Mirror classes are available as f"{exchange}ExchangeCalendar", which creates them when not yet done
+    exchange = name[: -len("ExchangeCalendar")]
+    if name.endswith("ExchangeCalendar") and exchange in calendars:
+        # looked up through the registry, so the class is created only once, under its lock, by the loader
+        MarketCalendar._regmeta_class_registry[exchange]
+        if name in globals():
+            return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class XTAEExchangeCalendar(TradingCalendar):
@@ -164,16 +187,12 @@ class XTAEExchangeCalendar(TradingCalendar):
     aliases = ["XTAE"]  # Note: must be "aliases" (plural) for registry to pick it up
 
     # Get regular_market_times from the exchange_calendars XTAE
-    regular_market_times = {}
-    for prop, new in time_props.items():
-        times = getattr(calendars["XTAE"], prop)
-        if times is not None and not isinstance(times, property):
-            regular_market_times[new] = times
+    regular_market_times = _regular_market_times(calendars["XTAE"])
 
     @property
     def weekmask(self):
         # Default to the new weekmask (Mon-Fri) for the base property
-        # The actual date-dependent logic is in valid_days
+        # The actual date-dependent logic is in _business_day_calendars
         return XTAE_WEEKMASK_NEW
 
     def _get_holidays_for_weekmask(self, weekmask: str) -> CustomBusinessDay:
@@ -184,52 +203,18 @@ class XTAEExchangeCalendar(TradingCalendar):
             weekmask=weekmask,
         )
 
-    def valid_days(self, start_date, end_date, tz="UTC") -> pd.DatetimeIndex:
+    def _business_day_calendars(self):
         """
-        Get a DatetimeIndex of valid open business days, handling the XTAE weekmask transition.
-
-        Before Jan 5, 2026: Sunday-Thursday
-        From Jan 5, 2026: Monday-Friday
-
-        :param start_date: start date
-        :param end_date: end date
-        :param tz: time zone in either string or pytz.timezone
-        :return: DatetimeIndex of valid business days
+        Open days before Jan 5, 2026 follow the Sunday-Thursday week, from then on Monday-Friday.
         """
-        start_date = pd.Timestamp(start_date).normalize()
-        end_date = pd.Timestamp(end_date).normalize()
-
-        # If entirely before transition, use old weekmask
-        if end_date < XTAE_TRANSITION_DATE:
-            holidays = self._get_holidays_for_weekmask(XTAE_WEEKMASK_OLD)
-            return pd.date_range(start_date, end_date, freq=holidays, normalize=True, tz=tz)
-
-        # If entirely after transition, use new weekmask
-        if start_date >= XTAE_TRANSITION_DATE:
-            holidays = self._get_holidays_for_weekmask(XTAE_WEEKMASK_NEW)
-            return pd.date_range(start_date, end_date, freq=holidays, normalize=True, tz=tz)
-
-        # Spans the transition - need to combine both
-        holidays_old = self._get_holidays_for_weekmask(XTAE_WEEKMASK_OLD)
-        holidays_new = self._get_holidays_for_weekmask(XTAE_WEEKMASK_NEW)
-
-        # Get days before transition (up to and including last day before transition)
-        days_before = pd.date_range(
-            start_date,
-            XTAE_TRANSITION_DATE - pd.Timedelta(days=1),
-            freq=holidays_old,
-            normalize=True,
-            tz=tz,
+        return (
+            (None, partial(self._get_holidays_for_weekmask, XTAE_WEEKMASK_OLD)),
+            (XTAE_TRANSITION_DATE, partial(self._get_holidays_for_weekmask, XTAE_WEEKMASK_NEW)),
         )
 
-        # Get days from transition onwards
-        days_after = pd.date_range(
-            XTAE_TRANSITION_DATE,
-            end_date,
-            freq=holidays_new,
-            normalize=True,
-            tz=tz,
-        )
 
-        # Combine and return
-        return days_before.union(days_after)
+# Register the names of the installed exchange_calendars that are not in the table of calendar_registry.
+# Their classes are created when first requested.
+for exchange in exchange_calendars.get_calendar_names(include_aliases=False):
+    if exchange not in MarketCalendar._regmeta_class_registry and exchange not in _CALENDAR_NAMES:
+        MarketCalendar._regmeta_class_registry.add_loader(exchange, _create_mirror_class)
@@ -13,22 +13,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 from datetime import time
 from itertools import chain
 from typing import Literal, Union
 
+import numpy as np
 import pandas as pd
 from pandas.tseries.holiday import AbstractHolidayCalendar
-from pandas.tseries.offsets import CustomBusinessDay
 from zoneinfo import ZoneInfo
 
 from pandas_market_calendars import calendar_utils as u
+from pandas_market_calendars.holidays.compiler import weekday_of
 from pandas_market_calendars.holidays.nyse import (
-    # 1899
-    AdmiralDeweyCelebration1899,
-    # 1921
-    AnnunciatorBoardFire1pmLateOpen1921,
-    ArmisticeSigned1918,
     Backlog2pmEarlyCloses1967,
     # 1968
     Backlog2pmEarlyCloses1968,
@@ -37,17 +34,6 @@ from pandas_market_calendars.holidays.nyse import (
     Backlog3pmEarlyCloses1987,
     Backlog230pmEarlyCloses1987,
     Backlog330pmEarlyCloses1987,
-    BacklogRelief1pmEarlyClose1929,
-    BacklogRelief2pmEarlyClose1928,
-    BacklogRelief12pmLateOpen1929,
-    BacklogRelief1919,
-    # 1928
-    BacklogRelief1928,
-    # 1929
-    BacklogRelief1929,
-    BankHolidays1933,
-    # 1898
-    CharterDay1898,
     Christmas54to98NYSE,
     ChristmasBefore1954,
     ChristmasEve1pmEarlyCloseAdhoc,
@@ -57,30 +43,19 @@ from pandas_market_calendars.holidays.nyse import (
     ChristmasNYSE,
     # 1997
     CircuitBreakerTriggered330pmEarlyClose1997,
-    # 1892
-    ColumbianCelebration1892,
     # 1995
     Computer1030LateOpen1995,
     ConEdPowerFail328pmEarlyClose1981,
     # 1990
     ConEdXformer931amLateOpen1990,
-    # 1933
-    CoolidgeFuneral1933,
-    CromwellFuneral1430EarlyClose1925,
     DayAfterChristmas1pmEarlyCloseAdhoc,
     DayAfterChristmasAdhoc,
     DayAfterThanksgiving1pmEarlyCloseInOrAfter1993,
     DayAfterThanksgiving2pmEarlyCloseBefore1993,
     DayBeforeDecorationAdhoc,
     DaysAfterIndependenceDayAdhoc,
-    DraftRegistrationDay1917,
-    DraftRegistrationDay1918,
-    # 1925
-    EclipseOfSunLateOpen1925,
     EisenhowerFuneral1969,
     EnduringFreedomMomentSilence931amLateOpen2001,
-    EnlargedProduceExchange1901,
-    FalseArmisticeReport1430EarlyClose1918,
     # 1989
     Fire11amLateOpen1989,
     FireDrill1015LateOpen1974,
@@ -91,32 +66,11 @@ from pandas_market_calendars.holidays.nyse import (
     # 2007
     FordMourning2007,
     FridayAfterIndependenceDayNYSEpre2013,
-    FridayAfterThanksgivingAdHoc,
-    GarretHobartFuneral1899,
-    GasFumesOnTradingFloor1230EarlyClose1933,
-    GeneralPershingReturn1919,
     # 2018
     GeorgeHWBushDeath2018,
     GoodFriday,
-    GoodFriday1899to1905,
-    GoodFridayPre1898,
-    GrantsBirthDayAdhoc,
-    # 1888
-    GreatBlizzardOf1888,
-    # 1908
-    GroverClevelandFuneral1pmClose1908,
-    # 1923
-    HardingDeath1923,
-    HardingFuneral1923,
-    HeavyVolume2pmEarlyClose1933,
-    HeavyVolume11amLateOpen1933,
-    HeavyVolume12pmLateOpen1933,
-    HeavyVolume1933,
-    Homecoming27Division1919,
     # 1964
     HooverFuneral1400EarlyClose1964,
-    # 1909
-    HudsonFultonCelebration1909,
     # 1985
     HurricaneGloriaClosings1985,
     # 2012
@@ -125,108 +79,41 @@ from pandas_market_calendars.holidays.nyse import (
     Ice11amLateOpen1973,
     # 2003
     IraqiFreedom932amLateOpen2003,
-    # 1912
-    JamesShermanFuneral1912,
     # 2025
     JimmyCarterDeath2025,
     # 1973
     JohnsonFuneral1973,
-    # 1913
-    JPMorganFuneral12pmOpen1913,
     # 1963
     KennedyAssassination1407EarlyClose,
     KennedyFuneral1963,
-    # 1910
-    KingEdwardDeath11amyClose1910,
-    KingEdwardFuneral12pmOpen1910,
-    # 1902
-    KingEdwardVIIcoronation1902,
-    # 1936
-    KingGeorgeVFuneral11amLateOpen1936,
-    LibertyDay12pmEarlyClose1917,
-    LibertyDay12pmEarlyClose1918,
     LincolnsBirthDayAdhoc,
-    # 1927
-    LindberghParade1927,
-    # 1901
-    McKinleyDeathAndFuneral1901,
     # 1974
     MerrillLynchComputer1015LateOpen1974,
     MLKdayOfMourning1968,
-    MonBeforeIndependenceDayAdhoc,
     MonTuesThursBeforeIndependenceDay,
-    MovedToProduceExchange1901,
-    NavyDay1945,
     # 1977
     NewYorkCityBlackout77,
     NixonFuneral1994,
-    NRAdemonstration12pmEarlyClose1933,
-    # 1903
-    NYSEnewBuildingOpen1903,
-    OfficeLocationChange1920,
-    # 1914
-    OnsetOfWWI1914,
     # 1969 - 1970
     PaperworkCrisis2pmEarlyCloses1969,
     PaperworkCrisis3pmEarlyCloses1969to1970,
     PaperworkCrisis230pmEarlyCloses1969,
     PaperworkCrisis1968,
-    ParadeOf77thDivision1919,
-    ParadeOfNationalGuardEarlyClose1917,
     # 1965
     PowerFail1105LateOpen,
-    QueenVictoriaFuneral1901,
-    # 1946
-    RailroadStrike1946,
     # 1981
     ReaganAssassAttempt317pmEarlyClose1981,
     # 2004
     ReaganMomentSilence932amLateOpen2004,
     ReaganMourning2004,
-    # 1945
-    RooseveltDayOfMourning1945,
-    # 1919
-    RooseveltFuneral1230EarlyClose1919,
-    SatAfterChristmasAdhoc,
-    SatAfterColumbusDayAdHoc,
-    SatAfterDecorationAdhoc,
-    SatAfterGoodFridayAdhoc,
-    SatAfterIndependenceDayAdhoc,
-    SatAfterWashingtonsBirthdayAdhoc,
-    SatBeforeAfterLincolnsBirthdayAdhoc,
-    SatBeforeChristmasAdhoc,
-    SatBeforeDecorationAdhoc,
-    SatBeforeIndependenceDayAdhoc,
-    SatBeforeLaborDayAdhoc,
-    SatBeforeNewYearsAdhoc,
-    SatBeforeWashingtonsBirthdayAdhoc,
-    # 1944
-    SatClosings1944,
-    SatClosings1945,
-    SatClosings1946,
-    # 1947
-    SatClosings1947,
-    # 1948
-    SatClosings1948,
-    # 1949
-    SatClosings1949,
-    # 1950
-    SatClosings1950,
-    # 1951
-    SatClosings1951,
-    # 1952
-    SatClosings1952,
     # 2002
     Sept11Anniversary12pmLateOpen2002,
     Sept11MomentSilence933amLateOpen2001,
     # 2001
     September11Closings2001,
-    SevereWeather1948,
     Snow2pmEarlyClose1967,
     Snow2pmEarlyClose1978,
     Snow2pmEarlyClose1996,
-    # 1924
-    Snow11amLateOpen1934,
     Snow11amLateOpen1969,
     Snow11amLateOpen1978,
     # 1996
@@ -247,27 +134,18 @@ from pandas_market_calendars.holidays.nyse import (
     Storm1115LateOpen1976,
     # 2005
     SystemProb356pmEarlyClose2005,
-    # 1930
-    TaftFuneral1230EarlyClose1930,
-    TrafficBlockLateOpen1919,
-    # 1920
-    TrafficBlockLateOpen1920,
     # 1966
     TransitStrike2pmEarlyClose1966,
     # 1991
     TroopsInGulf931LateOpens1991,
     # 1972
     TrumanFuneral1972,
-    # Adhoc Holidays
-    # 1885
-    UlyssesGrantFuneral1885,
     # DaysBeforeIndependenceDay1pmEarlyCloseAdhoc,
     USColumbusDayBefore1954,
     USElectionDay1848to1967,
     USElectionDay1968to1980Adhoc,
     USIndependenceDay,
     USIndependenceDay1952to1954,
-    USIndependenceDayPre1952,
     USJuneteenthAfter2022,
     USLaborDayStarting1887,
     USLincolnsBirthDayBefore1954,
@@ -275,33 +153,16 @@ from pandas_market_calendars.holidays.nyse import (
     USMemorialDay,
     USMemorialDay1952to1964,
     USMemorialDay1964to1969,
-    USMemorialDayBefore1952,
     # Always Celebrated Holidays
     USNewYearsDayNYSEpost1952,
-    USNewYearsDayNYSEpre1952,
     USPresidentsDay,
     USThanksgivingDay,
-    USThanksgivingDay1939to1941,
-    USThanksgivingDayBefore1939,
     USVeteransDay1934to1953,
     # Retired Holidays
     USVetransDayAdHoc,
     USWashingtonsBirthDay1952to1963,
     USWashingtonsBirthDay1964to1970,
-    USWashingtonsBirthDayBefore1952,
-    VJday1945,
-    WallStreetExplosionEarlyClose1920,
-    # 1889
-    WashingtonInaugurationCentennialCelebration1889,
-    # 1917
-    WeatherHeatClosing1917,
-    # 1918
-    WeatherNoHeatClosing1918,
     WednesdayBeforeIndependenceDayPost2013,
-    WelcomeNavalCommander1898,
-    WilliamGaynorFuneral12pmOpen1913,
-    # 1924
-    WoodrowWilsonFuneral1230EarlyClose1924,
 )
 from pandas_market_calendars.market_calendar import MarketCalendar
 
@@ -310,8 +171,284 @@ from pandas_market_calendars.market_calendar import MarketCalendar
 # http://www.nyse.com/pdfs/closings.pdf
 # http://www.stevemorse.org/jcal/whendid.html
 
-# Overwrite the default holiday calendar start_date of 1/1/70
-AbstractHolidayCalendar.start_date = "1885-01-01"
+# The holidays and special times of the NYSE are kept in two catalogs, split at Sept. 29, 1952, when Saturday trading
+# ended. _CATALOG holds those that reach that date or later. Those that all lie before it are in holidays/nyse_pre1952.py,
+# its catalog is only built by _catalog_pre_1952 when a date before then is requested. In both, the special times map
+# each time to its rules or ad-hoc DatetimeIndexes.
+_CATALOG = {
+    "regular_holidays": [
+        USNewYearsDayNYSEpost1952,
+        USMartinLutherKingJrAfter1998,
+        USPresidentsDay,
+        USWashingtonsBirthDay1952to1963,
+        USWashingtonsBirthDay1964to1970,
+        USLincolnsBirthDayBefore1954,
+        GoodFriday,
+        USMemorialDay,
+        USMemorialDay1952to1964,
+        USMemorialDay1964to1969,
+        USIndependenceDay,
+        USIndependenceDay1952to1954,
+        USLaborDayStarting1887,
+        USColumbusDayBefore1954,
+        USElectionDay1848to1967,
+        USVeteransDay1934to1953,
+        USThanksgivingDay,
+        ChristmasNYSE,
+        Christmas54to98NYSE,
+        ChristmasBefore1954,
+        USJuneteenthAfter2022,
+    ],
+    "adhoc_holidays": [
+        # Recurring Holidays
+        DaysAfterIndependenceDayAdhoc,
+        USElectionDay1968to1980Adhoc,
+        ChristmasEvesAdhoc,
+        DayAfterChristmasAdhoc,
+        # Retired
+        USVetransDayAdHoc,
+        LincolnsBirthDayAdhoc,
+        DayBeforeDecorationAdhoc,
+        # Irregularities
+        KennedyFuneral1963,
+        MLKdayOfMourning1968,
+        PaperworkCrisis1968,
+        SnowClosing1969,
+        EisenhowerFuneral1969,
+        FirstLunarLandingClosing1969,
+        TrumanFuneral1972,
+        JohnsonFuneral1973,
+        NewYorkCityBlackout77,
+        HurricaneGloriaClosings1985,
+        NixonFuneral1994,
+        ReaganMourning2004,
+        FordMourning2007,
+        September11Closings2001,
+        HurricaneSandyClosings2012,
+        GeorgeHWBushDeath2018,
+        JimmyCarterDeath2025,
+    ],
+    "special_closes": {
+        time(13, tzinfo=ZoneInfo("America/New_York")): [
+            FridayAfterIndependenceDayNYSEpre2013,
+            MonTuesThursBeforeIndependenceDay,
+            WednesdayBeforeIndependenceDayPost2013,
+            DayAfterThanksgiving1pmEarlyCloseInOrAfter1993,
+            ChristmasEvePost1999Early1pmClose,
+        ],
+        time(14, tzinfo=ZoneInfo("America/New_York")): [
+            DayAfterThanksgiving2pmEarlyCloseBefore1993,
+            HooverFuneral1400EarlyClose1964,
+            Snow2pmEarlyClose1967,
+            Snow2pmEarlyClose1978,
+            Snow2pmEarlyClose1996,
+        ],
+        time(14, 7, tzinfo=ZoneInfo("America/New_York")): [KennedyAssassination1407EarlyClose],
+        time(14, 30, tzinfo=ZoneInfo("America/New_York")): [Snow230EarlyClose1975, Snow230pmEarlyClose1994],
+        time(15, tzinfo=ZoneInfo("America/New_York")): [HurricaneWatch3pmEarlyClose1976],
+        time(15, 17, tzinfo=ZoneInfo("America/New_York")): [ReaganAssassAttempt317pmEarlyClose1981],
+        time(15, 28, tzinfo=ZoneInfo("America/New_York")): [ConEdPowerFail328pmEarlyClose1981],
+        time(15, 30, tzinfo=ZoneInfo("America/New_York")): [CircuitBreakerTriggered330pmEarlyClose1997],
+        time(15, 56, tzinfo=ZoneInfo("America/New_York")): [SystemProb356pmEarlyClose2005],
+    },
+    "special_closes_adhoc": {
+        time(13, tzinfo=ZoneInfo("America/New_York")): [
+            ChristmasEve1pmEarlyCloseAdhoc,
+            DayAfterChristmas1pmEarlyCloseAdhoc,
+        ],
+        time(14, tzinfo=ZoneInfo("America/New_York")): [
+            ChristmasEve2pmEarlyCloseAdhoc,
+            TransitStrike2pmEarlyClose1966,
+            Backlog2pmEarlyCloses1967,
+            Backlog2pmEarlyCloses1968,
+            PaperworkCrisis2pmEarlyCloses1969,
+            Backlog2pmEarlyCloses1987,
+        ],
+        time(14, 30, tzinfo=ZoneInfo("America/New_York")): [
+            PaperworkCrisis230pmEarlyCloses1969,
+            Backlog230pmEarlyCloses1987,
+        ],
+        time(15, tzinfo=ZoneInfo("America/New_York")): [
+            PaperworkCrisis3pmEarlyCloses1969to1970,
+            Backlog3pmEarlyCloses1987,
+        ],
+        time(15, 30, tzinfo=ZoneInfo("America/New_York")): [Backlog330pmEarlyCloses1987],
+    },
+    "special_opens": {
+        time(9, 31, tzinfo=ZoneInfo("America/New_York")): [
+            ConEdXformer931amLateOpen1990,
+            EnduringFreedomMomentSilence931amLateOpen2001,
+        ],
+        time(9, 32, tzinfo=ZoneInfo("America/New_York")): [
+            IraqiFreedom932amLateOpen2003,
+            ReaganMomentSilence932amLateOpen2004,
+            FordMomentSilence932amLateOpen2006,
+        ],
+        time(9, 33, tzinfo=ZoneInfo("America/New_York")): [Sept11MomentSilence933amLateOpen2001],
+        time(10, 15, tzinfo=ZoneInfo("America/New_York")): [
+            Snow1015LateOpen1967,
+            MerrillLynchComputer1015LateOpen1974,
+            FireDrill1015LateOpen1974,
+            FireDrill1015LateOpen1976,
+        ],
+        time(10, 30, tzinfo=ZoneInfo("America/New_York")): [Computer1030LateOpen1995],
+        time(10, 45, tzinfo=ZoneInfo("America/New_York")): [Storm1045LateOpen1969],
+        time(11, tzinfo=ZoneInfo("America/New_York")): [
+            Snow11amLateOpening1960,
+            Snow11amLateOpen1969,
+            Ice11amLateOpen1973,
+            Snow11amLateOpen1978,
+            Fire11amLateOpen1989,
+            Snow11amLateOpen1996,
+        ],
+        time(11, 5, tzinfo=ZoneInfo("America/New_York")): [PowerFail1105LateOpen],
+        time(11, 15, tzinfo=ZoneInfo("America/New_York")): [Storm1115LateOpen1976],
+        time(12, tzinfo=ZoneInfo("America/New_York")): [Snow12pmLateOpen1978, Sept11Anniversary12pmLateOpen2002],
+    },
+    "special_opens_adhoc": {
+        time(9, 31, tzinfo=ZoneInfo("America/New_York")): [TroopsInGulf931LateOpens1991],
+    },
+}
+
+
+@functools.lru_cache
+def _catalog_pre_1952() -> dict:
+    """
+    :return: the catalog of the holidays and special times that all lie before Sept. 29, 1952, in the layout of _CATALOG
+    """
+    from pandas_market_calendars.holidays import nyse_pre1952 as h
+
+    return {
+        "regular_holidays": [
+            h.USNewYearsDayNYSEpre1952,
+            h.USWashingtonsBirthDayBefore1952,
+            h.GoodFridayPre1898,
+            h.GoodFriday1899to1905,
+            h.USMemorialDayBefore1952,
+            h.USIndependenceDayPre1952,
+            h.USThanksgivingDayBefore1939,
+            h.USThanksgivingDay1939to1941,
+        ],
+        "adhoc_holidays": [
+            # Recurring Holidays
+            h.SatAfterGoodFridayAdhoc,
+            h.MonBeforeIndependenceDayAdhoc,
+            h.SatBeforeIndependenceDayAdhoc,
+            h.SatAfterIndependenceDayAdhoc,
+            h.SatBeforeLaborDayAdhoc,
+            h.FridayAfterThanksgivingAdHoc,
+            h.SatBeforeChristmasAdhoc,
+            h.SatAfterChristmasAdhoc,
+            # Retired
+            h.SatAfterColumbusDayAdHoc,
+            h.GrantsBirthDayAdhoc,
+            h.SatBeforeNewYearsAdhoc,
+            h.SatBeforeWashingtonsBirthdayAdhoc,
+            h.SatAfterWashingtonsBirthdayAdhoc,
+            h.SatBeforeAfterLincolnsBirthdayAdhoc,
+            h.SatBeforeDecorationAdhoc,
+            h.SatAfterDecorationAdhoc,
+            # Irregularities
+            h.UlyssesGrantFuneral1885,
+            h.ColumbianCelebration1892,
+            h.GreatBlizzardOf1888,
+            h.WashingtonInaugurationCentennialCelebration1889,
+            h.CharterDay1898,
+            h.WelcomeNavalCommander1898,
+            h.AdmiralDeweyCelebration1899,
+            h.GarretHobartFuneral1899,
+            h.QueenVictoriaFuneral1901,
+            h.MovedToProduceExchange1901,
+            h.EnlargedProduceExchange1901,
+            h.McKinleyDeathAndFuneral1901,
+            h.KingEdwardVIIcoronation1902,
+            h.NYSEnewBuildingOpen1903,
+            h.HudsonFultonCelebration1909,
+            h.JamesShermanFuneral1912,
+            h.OnsetOfWWI1914,
+            h.WeatherHeatClosing1917,
+            h.DraftRegistrationDay1917,
+            h.WeatherNoHeatClosing1918,
+            h.DraftRegistrationDay1918,
+            h.ArmisticeSigned1918,
+            h.Homecoming27Division1919,
+            h.ParadeOf77thDivision1919,
+            h.BacklogRelief1919,
+            h.GeneralPershingReturn1919,
+            h.OfficeLocationChange1920,
+            h.HardingDeath1923,
+            h.HardingFuneral1923,
+            h.LindberghParade1927,
+            h.BacklogRelief1928,
+            h.BacklogRelief1929,
+            h.CoolidgeFuneral1933,
+            h.BankHolidays1933,
+            h.HeavyVolume1933,
+            h.SatClosings1944,
+            h.RooseveltDayOfMourning1945,
+            h.SatClosings1945,
+            h.VJday1945,
+            h.NavyDay1945,
+            h.RailroadStrike1946,
+            h.SatClosings1946,
+            h.SatClosings1947,
+            h.SatClosings1948,
+            h.SevereWeather1948,
+            h.SatClosings1949,
+            h.SatClosings1950,
+            h.SatClosings1951,
+            h.SatClosings1952,
+        ],
+        "special_closes": {
+            time(11, tzinfo=ZoneInfo("America/New_York")): [h.KingEdwardDeath11amyClose1910],
+            time(12, tzinfo=ZoneInfo("America/New_York")): [
+                h.ParadeOfNationalGuardEarlyClose1917,
+                h.LibertyDay12pmEarlyClose1917,
+                h.LibertyDay12pmEarlyClose1918,
+                h.WallStreetExplosionEarlyClose1920,
+                h.NRAdemonstration12pmEarlyClose1933,
+            ],
+            time(12, 30, tzinfo=ZoneInfo("America/New_York")): [
+                h.RooseveltFuneral1230EarlyClose1919,
+                h.WoodrowWilsonFuneral1230EarlyClose1924,
+                h.TaftFuneral1230EarlyClose1930,
+                h.GasFumesOnTradingFloor1230EarlyClose1933,
+            ],
+            time(13, tzinfo=ZoneInfo("America/New_York")): [h.GroverClevelandFuneral1pmClose1908],
+            time(14, 30, tzinfo=ZoneInfo("America/New_York")): [
+                h.FalseArmisticeReport1430EarlyClose1918,
+                h.CromwellFuneral1430EarlyClose1925,
+            ],
+        },
+        "special_closes_adhoc": {
+            time(13, tzinfo=ZoneInfo("America/New_York")): [h.BacklogRelief1pmEarlyClose1929],
+            time(14, tzinfo=ZoneInfo("America/New_York")): [
+                h.HeavyVolume2pmEarlyClose1933,
+                h.BacklogRelief2pmEarlyClose1928,
+            ],
+        },
+        "special_opens": {
+            time(10, 30, tzinfo=ZoneInfo("America/New_York")): [h.TrafficBlockLateOpen1919, h.TrafficBlockLateOpen1920],
+            time(10, 45, tzinfo=ZoneInfo("America/New_York")): [h.EclipseOfSunLateOpen1925],
+            time(11, tzinfo=ZoneInfo("America/New_York")): [
+                h.Snow11amLateOpen1934,
+                h.KingGeorgeVFuneral11amLateOpen1936,
+            ],
+            time(12, tzinfo=ZoneInfo("America/New_York")): [
+                h.KingEdwardFuneral12pmOpen1910,
+                h.JPMorganFuneral12pmOpen1913,
+                h.WilliamGaynorFuneral12pmOpen1913,
+            ],
+            time(13, tzinfo=ZoneInfo("America/New_York")): [h.AnnunciatorBoardFire1pmLateOpen1921],
+        },
+        "special_opens_adhoc": {
+            time(11, tzinfo=ZoneInfo("America/New_York")): [h.HeavyVolume11amLateOpen1933],
+            time(12, tzinfo=ZoneInfo("America/New_York")): [
+                h.BacklogRelief12pmLateOpen1929,
+                h.HeavyVolume12pmLateOpen1933,
+            ],
+        },
+    }
 
 
 class NYSEExchangeCalendar(MarketCalendar):
@@ -821,6 +958,8 @@ class NYSEExchangeCalendar(MarketCalendar):
         "post": ((None, time(20)),),
     }
 
+    _open_day_attributes = MarketCalendar._open_day_attributes + ("holidays_pre_1952",)
+
     _saturday_close = time(12)
     _saturday_end = pd.Timestamp("1952-09-29", tz="UTC")
 
@@ -854,486 +993,100 @@ class NYSEExchangeCalendar(MarketCalendar):
         if hasattr(self, "_holidays_hist"):
             return self._holidays_hist
 
-        self._holidays_hist = CustomBusinessDay(
-            holidays=self.adhoc_holidays,
-            calendar=self.regular_holidays,
-            weekmask=self.weekmask_pre_1952,
-        )
+        self._holidays_hist = self._custom_business_day(self.weekmask_pre_1952)
         return self._holidays_hist
 
+    def _catalogs(self, pre_1952: bool = True) -> tuple:
+        return (_CATALOG, _catalog_pre_1952()) if pre_1952 else (_CATALOG,)
+
+    def _defines(self, name: str) -> bool:
+        # True if a subclass or the instance overrides the attribute name, its values are then used for all the dates
+        owner = next(cls for cls in type(self).__mro__ if name in vars(cls))
+        return name in vars(self) or owner not in NYSEExchangeCalendar.__mro__
+
+    def _regular_holidays(self, pre_1952: bool = True) -> AbstractHolidayCalendar:
+        return AbstractHolidayCalendar(rules=[rule for c in self._catalogs(pre_1952) for rule in c["regular_holidays"]])
+
+    def _adhoc_holidays(self, pre_1952: bool = True) -> list:
+        return list(chain.from_iterable(days for c in self._catalogs(pre_1952) for days in c["adhoc_holidays"]))
+
+    def _special_times(self, kind: str, pre_1952: bool = True) -> list:
+        """
+        :param kind: special_opens, special_closes or their _adhoc variant
+        :param pre_1952: include the special times that all lie before Sept. 29, 1952
+        :return: list of (time, AbstractHolidayCalendar) tuples, or (time, DatetimeIndex) tuples for the _adhoc kinds
+        """
+        sources = {}
+        for catalog in self._catalogs(pre_1952):
+            for time_, items in catalog[kind].items():
+                sources.setdefault(time_, []).extend(items)
+        times = sorted(sources, key=lambda t: (t.hour, t.minute))
+        if kind.endswith("_adhoc"):
+            # one sorted DatetimeIndex of unique UTC dates per time
+            return [(t, sources[t][0].append(sources[t][1:]).unique().sort_values()) for t in times]
+        return [(t, AbstractHolidayCalendar(rules=sources[t])) for t in times]
+
     @property
     def regular_holidays(self):
-        return AbstractHolidayCalendar(
-            rules=[
-                USNewYearsDayNYSEpost1952,
-                USNewYearsDayNYSEpre1952,
-                USMartinLutherKingJrAfter1998,
-                USPresidentsDay,
-                USWashingtonsBirthDayBefore1952,
-                USWashingtonsBirthDay1952to1963,
-                USWashingtonsBirthDay1964to1970,
-                USLincolnsBirthDayBefore1954,
-                GoodFriday,
-                GoodFridayPre1898,
-                GoodFriday1899to1905,
-                USMemorialDay,
-                USMemorialDayBefore1952,
-                USMemorialDay1952to1964,
-                USMemorialDay1964to1969,
-                USIndependenceDay,
-                USIndependenceDayPre1952,
-                USIndependenceDay1952to1954,
-                USLaborDayStarting1887,
-                USColumbusDayBefore1954,
-                USElectionDay1848to1967,
-                USVeteransDay1934to1953,
-                USThanksgivingDay,
-                USThanksgivingDayBefore1939,
-                USThanksgivingDay1939to1941,
-                ChristmasNYSE,
-                Christmas54to98NYSE,
-                ChristmasBefore1954,
-                USJuneteenthAfter2022,
-            ]
-        )
+        return self._regular_holidays()
 
     @property
     def adhoc_holidays(self):
-        return list(
-            chain(
-                # Recurring Holidays
-                SatAfterGoodFridayAdhoc,
-                MonBeforeIndependenceDayAdhoc,
-                SatBeforeIndependenceDayAdhoc,
-                SatAfterIndependenceDayAdhoc,
-                DaysAfterIndependenceDayAdhoc,
-                SatBeforeLaborDayAdhoc,
-                USElectionDay1968to1980Adhoc,
-                FridayAfterThanksgivingAdHoc,
-                SatBeforeChristmasAdhoc,
-                SatAfterChristmasAdhoc,
-                ChristmasEvesAdhoc,
-                DayAfterChristmasAdhoc,
-                # Retired
-                USVetransDayAdHoc,
-                SatAfterColumbusDayAdHoc,
-                LincolnsBirthDayAdhoc,
-                GrantsBirthDayAdhoc,
-                SatBeforeNewYearsAdhoc,
-                SatBeforeWashingtonsBirthdayAdhoc,
-                SatAfterWashingtonsBirthdayAdhoc,
-                SatBeforeAfterLincolnsBirthdayAdhoc,
-                SatBeforeDecorationAdhoc,
-                SatAfterDecorationAdhoc,
-                DayBeforeDecorationAdhoc,
-                # Irregularities
-                UlyssesGrantFuneral1885,
-                ColumbianCelebration1892,
-                GreatBlizzardOf1888,
-                WashingtonInaugurationCentennialCelebration1889,
-                CharterDay1898,
-                WelcomeNavalCommander1898,
-                AdmiralDeweyCelebration1899,
-                GarretHobartFuneral1899,
-                QueenVictoriaFuneral1901,
-                MovedToProduceExchange1901,
-                EnlargedProduceExchange1901,
-                McKinleyDeathAndFuneral1901,
-                KingEdwardVIIcoronation1902,
-                NYSEnewBuildingOpen1903,
-                HudsonFultonCelebration1909,
-                JamesShermanFuneral1912,
-                OnsetOfWWI1914,
-                WeatherHeatClosing1917,
-                DraftRegistrationDay1917,
-                WeatherNoHeatClosing1918,
-                DraftRegistrationDay1918,
-                ArmisticeSigned1918,
-                Homecoming27Division1919,
-                ParadeOf77thDivision1919,
-                BacklogRelief1919,
-                GeneralPershingReturn1919,
-                OfficeLocationChange1920,
-                HardingDeath1923,
-                HardingFuneral1923,
-                LindberghParade1927,
-                BacklogRelief1928,
-                BacklogRelief1929,
-                CoolidgeFuneral1933,
-                BankHolidays1933,
-                HeavyVolume1933,
-                SatClosings1944,
-                RooseveltDayOfMourning1945,
-                SatClosings1945,
-                VJday1945,
-                NavyDay1945,
-                RailroadStrike1946,
-                SatClosings1946,
-                SatClosings1947,
-                SatClosings1948,
-                SevereWeather1948,
-                SatClosings1949,
-                SatClosings1950,
-                SatClosings1951,
-                SatClosings1952,
-                KennedyFuneral1963,
-                MLKdayOfMourning1968,
-                PaperworkCrisis1968,
-                SnowClosing1969,
-                EisenhowerFuneral1969,
-                FirstLunarLandingClosing1969,
-                TrumanFuneral1972,
-                JohnsonFuneral1973,
-                NewYorkCityBlackout77,
-                HurricaneGloriaClosings1985,
-                NixonFuneral1994,
-                ReaganMourning2004,
-                FordMourning2007,
-                September11Closings2001,
-                HurricaneSandyClosings2012,
-                GeorgeHWBushDeath2018,
-                JimmyCarterDeath2025,
-            )
-        )
+        return self._adhoc_holidays()
 
     @property
     def special_closes(self):
-        return [
-            (
-                time(11, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        KingEdwardDeath11amyClose1910,
-                    ]
-                ),
-            ),
-            (
-                time(12, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        ParadeOfNationalGuardEarlyClose1917,
-                        LibertyDay12pmEarlyClose1917,
-                        LibertyDay12pmEarlyClose1918,
-                        WallStreetExplosionEarlyClose1920,
-                        NRAdemonstration12pmEarlyClose1933,
-                    ]
-                ),
-            ),
-            (
-                time(hour=12, minute=30, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        RooseveltFuneral1230EarlyClose1919,
-                        WoodrowWilsonFuneral1230EarlyClose1924,
-                        TaftFuneral1230EarlyClose1930,
-                        GasFumesOnTradingFloor1230EarlyClose1933,
-                    ]
-                ),
-            ),
-            (
-                time(13, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        FridayAfterIndependenceDayNYSEpre2013,
-                        MonTuesThursBeforeIndependenceDay,
-                        WednesdayBeforeIndependenceDayPost2013,
-                        DayAfterThanksgiving1pmEarlyCloseInOrAfter1993,
-                        ChristmasEvePost1999Early1pmClose,
-                        GroverClevelandFuneral1pmClose1908,
-                    ]
-                ),
-            ),
-            (
-                time(14, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        DayAfterThanksgiving2pmEarlyCloseBefore1993,
-                        HooverFuneral1400EarlyClose1964,
-                        Snow2pmEarlyClose1967,
-                        Snow2pmEarlyClose1978,
-                        Snow2pmEarlyClose1996,
-                    ]
-                ),
-            ),
-            (
-                time(14, 7, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        KennedyAssassination1407EarlyClose,
-                    ]
-                ),
-            ),
-            (
-                time(hour=14, minute=30, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        FalseArmisticeReport1430EarlyClose1918,
-                        CromwellFuneral1430EarlyClose1925,
-                        Snow230EarlyClose1975,
-                        Snow230pmEarlyClose1994,
-                    ]
-                ),
-            ),
-            (
-                time(15, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        HurricaneWatch3pmEarlyClose1976,
-                    ]
-                ),
-            ),
-            (
-                time(15, 17, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        ReaganAssassAttempt317pmEarlyClose1981,
-                    ]
-                ),
-            ),
-            (
-                time(15, 28, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        ConEdPowerFail328pmEarlyClose1981,
-                    ]
-                ),
-            ),
-            (
-                time(15, 30, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        CircuitBreakerTriggered330pmEarlyClose1997,
-                    ]
-                ),
-            ),
-            (
-                time(15, 56, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        SystemProb356pmEarlyClose2005,
-                    ]
-                ),
-            ),
-        ]
+        return self._special_times("special_closes")
 
     @property
     def special_closes_adhoc(self):
-        def _union_many(indexes):
-            # Merges a list of pd.DatetimeIndex objects, returns merged DatetimeIndex
-            union_index = pd.DatetimeIndex([], tz="UTC")
-            for index in indexes:
-                union_index = union_index.union(index)
-            return union_index
-
-        return [
-            (
-                time(13, tzinfo=ZoneInfo("America/New_York")),
-                # DaysBeforeIndependenceDay1pmEarlyCloseAdhoc # list
-                ChristmasEve1pmEarlyCloseAdhoc + DayAfterChristmas1pmEarlyCloseAdhoc + BacklogRelief1pmEarlyClose1929,
-            ),
-            (
-                time(14, tzinfo=ZoneInfo("America/New_York")),
-                _union_many(
-                    [pd.DatetimeIndex(ChristmasEve2pmEarlyCloseAdhoc + HeavyVolume2pmEarlyClose1933)]
-                    + [
-                        BacklogRelief2pmEarlyClose1928,
-                        TransitStrike2pmEarlyClose1966,  # index
-                        Backlog2pmEarlyCloses1967,  # index
-                        Backlog2pmEarlyCloses1968,  # index
-                        PaperworkCrisis2pmEarlyCloses1969,  # index
-                        Backlog2pmEarlyCloses1987,
-                    ]
-                ),  # index
-            ),
-            (
-                time(14, 30, tzinfo=ZoneInfo("America/New_York")),
-                _union_many([PaperworkCrisis230pmEarlyCloses1969, Backlog230pmEarlyCloses1987]),  # index
-            ),
-            (
-                time(15, tzinfo=ZoneInfo("America/New_York")),
-                _union_many([PaperworkCrisis3pmEarlyCloses1969to1970, Backlog3pmEarlyCloses1987]),  # index
-            ),
-            (
-                time(15, 30, tzinfo=ZoneInfo("America/New_York")),
-                Backlog330pmEarlyCloses1987,  # index
-            ),
-        ]
+        return self._special_times("special_closes_adhoc")
 
     @property
     def special_opens(self):
-        return [
-            (
-                time(hour=9, minute=31, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        ConEdXformer931amLateOpen1990,
-                        EnduringFreedomMomentSilence931amLateOpen2001,
-                    ]
-                ),
-            ),
-            (
-                time(hour=9, minute=32, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        IraqiFreedom932amLateOpen2003,
-                        ReaganMomentSilence932amLateOpen2004,
-                        FordMomentSilence932amLateOpen2006,
-                    ]
-                ),
-            ),
-            (
-                time(hour=9, minute=33, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        Sept11MomentSilence933amLateOpen2001,
-                    ]
-                ),
-            ),
-            (
-                time(hour=10, minute=15, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        Snow1015LateOpen1967,
-                        MerrillLynchComputer1015LateOpen1974,
-                        FireDrill1015LateOpen1974,
-                        FireDrill1015LateOpen1976,
-                    ]
-                ),
-            ),
-            (
-                time(hour=10, minute=30, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        TrafficBlockLateOpen1919,
-                        TrafficBlockLateOpen1920,
-                        Computer1030LateOpen1995,
-                    ]
-                ),
-            ),
-            (
-                time(hour=10, minute=45, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        EclipseOfSunLateOpen1925,
-                        Storm1045LateOpen1969,
-                    ]
-                ),
-            ),
-            (
-                time(11, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        Snow11amLateOpen1934,
-                        KingGeorgeVFuneral11amLateOpen1936,
-                        Snow11amLateOpening1960,
-                        Snow11amLateOpen1969,
-                        Ice11amLateOpen1973,
-                        Snow11amLateOpen1978,
-                        Fire11amLateOpen1989,
-                        Snow11amLateOpen1996,
-                    ]
-                ),
-            ),
-            (
-                time(11, 5, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        PowerFail1105LateOpen,
-                    ]
-                ),
-            ),
-            (
-                time(11, 15, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        Storm1115LateOpen1976,
-                    ]
-                ),
-            ),
-            (
-                time(12, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        KingEdwardFuneral12pmOpen1910,
-                        JPMorganFuneral12pmOpen1913,
-                        WilliamGaynorFuneral12pmOpen1913,
-                        Snow12pmLateOpen1978,
-                        Sept11Anniversary12pmLateOpen2002,
-                    ]
-                ),
-            ),
-            (
-                time(13, tzinfo=ZoneInfo("America/New_York")),
-                AbstractHolidayCalendar(
-                    rules=[
-                        AnnunciatorBoardFire1pmLateOpen1921,
-                    ]
-                ),
-            ),
-        ]
+        return self._special_times("special_opens")
 
     @property
     def special_opens_adhoc(self):
-        return [
-            (
-                time(9, 31, tzinfo=ZoneInfo("America/New_York")),
-                TroopsInGulf931LateOpens1991,
-            ),
-            (
-                time(11, tzinfo=ZoneInfo("America/New_York")),
-                HeavyVolume11amLateOpen1933,
-            ),
-            (
-                time(12, tzinfo=ZoneInfo("America/New_York")),
-                BacklogRelief12pmLateOpen1929 + HeavyVolume12pmLateOpen1933,
-            ),
-        ]
-
-    # Override market_calendar.py to split calc between pre & post 1952 Saturday Close
-    def valid_days(self, start_date, end_date, tz="UTC"):
-        """
-        Get a DatetimeIndex of valid open business days.
+        return self._special_times("special_opens_adhoc")
 
-        :param start_date: start date
-        :param end_date: end date
-        :param tz: time zone in either string or pytz.timezone
-        :return: DatetimeIndex of valid business days
+    def _holidays_post_1952(self):
         """
-        start_date = pd.Timestamp(start_date)
-        end_date = pd.Timestamp(end_date)
-        start_date = start_date.tz_convert(tz) if start_date.tz else start_date.tz_localize(tz)
-        end_date = end_date.tz_convert(tz) if end_date.tz else end_date.tz_localize(tz)
+        CustomBusinessDay of the open days from Sept. 29, 1952 on. It leaves out the holidays that all lie before,
+        so that their rules are not evaluated, unless a subclass overrides the holidays.
 
-        # Starting Monday Sept. 29, 1952, no more saturday trading days
-        if tz is None:
-            saturday_end = self._saturday_end.tz_localize(None)
-        else:
-            saturday_end = self._saturday_end
-
-        # Don't care about Saturdays. Call super.
-        if start_date > saturday_end:
-            return super().valid_days(start_date, end_date, tz=tz)
-
-        # Full Date Range is pre 1952. Augment the Super call
-        if end_date <= saturday_end:
-            return pd.date_range(
-                start_date,
-                end_date,
-                freq=self.holidays_pre_1952(),
-                normalize=True,
-                tz=tz,
+        :return: CustomBusinessDay object of holidays
+        """
+        if self._defines("holidays") or self._defines("regular_holidays") or self._defines("adhoc_holidays"):
+            return self.holidays()
+        try:
+            return self._holidays_post
+        except AttributeError:
+            self._holidays_post = self._custom_business_day(
+                self.weekmask, self._adhoc_holidays(pre_1952=False), self._regular_holidays(pre_1952=False)
             )
-
-        # Range is split across 1952. Concatenate Two different Date_Range calls
-        days_pre = pd.date_range(
-            start_date,
-            saturday_end,
-            freq=self.holidays_pre_1952(),
-            normalize=True,
-            tz=tz,
-        )
-        days_post = pd.date_range(saturday_end, end_date, freq=self.holidays(), normalize=True, tz=tz)
-        return days_pre.union(days_post)
+        return self._holidays_post
+
+    def _business_day_freq(self, first, last):
+        freq = super()._business_day_freq(first, last)
+        # the post-1952 era is evaluated without the earlier holidays, valid_days carries the complete calendar
+        return self.holidays() if freq is self._holidays_post_1952() else freq
+
+    def _special_times_from(self, market_time, start):
+        kind = {"market_open": "special_opens", "market_close": "special_closes"}.get(market_time)
+        if (
+            kind is None
+            or start < self._saturday_end.tz_localize(None)
+            or self._defines(kind)
+            or self._defines(kind + "_adhoc")
+        ):
+            return super()._special_times_from(market_time, start)
+        return self._special_times(kind, pre_1952=False), self._special_times(kind + "_adhoc", pre_1952=False)
+
+    # Override market_calendar.py to split the open days between pre & post 1952 Saturday Close
+    def _business_day_calendars(self):
+        # Starting Monday Sept. 29, 1952, no more saturday trading days
+        return ((None, self.holidays_pre_1952), (self._saturday_end, self._holidays_post_1952))
 
     def days_at_time(self, days, market_time, day_offset=0):
         days = super().days_at_time(days, market_time, day_offset=day_offset)
@@ -1347,6 +1100,16 @@ class NYSEExchangeCalendar(MarketCalendar):
             days = days.dt.tz_convert("UTC")
         return days
 
+    def _wall_times(self, days, market_time):
+        times = super()._wall_times(days, market_time)
+
+        if market_time == "market_close" and not self.is_custom(market_time):
+            unit = np.datetime_data(days.dtype)[0]
+            saturday = weekday_of(days.astype("M8[D]")) == 5
+            saturday_close = self._tdelta(self._saturday_close).to_timedelta64().astype(f"m8[{unit}]")
+            times = np.where(saturday, days + saturday_close, times)
+        return times
+
     def date_range_htf(
         self,
         frequency: Union[str, pd.Timedelta, int, float],
@@ -2,6 +2,7 @@ import functools
 from datetime import time
 from itertools import chain
 
+import numpy as np
 import pandas as pd
 from pandas.tseries.holiday import AbstractHolidayCalendar
 from zoneinfo import ZoneInfo
@@ -20,6 +21,8 @@ from zoneinfo import ZoneInfo
 # UK: 8:00 to 17:00
 # JP: 8:30 to 18:30
 ########################################################################################################################
+from pandas_market_calendars import calendar_utils as u
+from pandas_market_calendars.holidays.compiler import easter
 from pandas_market_calendars.holidays.sifma import (
     Christmas,
     ChristmasEve2pmEarlyClose,
@@ -58,8 +61,6 @@ from pandas_market_calendars.holidays.sifma import (
     USPresidentsDay,
     USThanksgivingDay,
     USVeteransDay,
-    # --- Good Friday Rules --- #
-    is_first_friday,
 )
 from pandas_market_calendars.market_calendar import MarketCalendar
 
@@ -135,14 +136,20 @@ class SIFMAUSExchangeCalendar(MarketCalendar):
         effective_gf_start = max(calc_start, gf_rule_start) if gf_rule_start else calc_start
         effective_thurs_start = max(calc_start, thurs_rule_start) if thurs_rule_start else calc_start
 
-        potential_gf_dates = GoodFridayPotentialPost2020.dates(effective_gf_start, calc_end)
-        gf_full_holidays = [d for d in potential_gf_dates if not is_first_friday(d)]
-        gf_12pm_early_closes = [d for d in potential_gf_dates if is_first_friday(d)]
+        # All the years at once: Good Friday is two days before Easter, and it is the first Friday of the
+        # month, the day of the NFP release, when it falls on or before the 7th
+        years = np.arange(min(effective_gf_start.year, effective_thurs_start.year), calc_end.year + 1)
+        good_fridays = easter(years) - np.timedelta64(2, "D")
+        first_friday = (good_fridays - good_fridays.astype("datetime64[M]")).astype(np.int64) < 7
 
-        potential_thurs_dates = DayBeforeGoodFridayPotentialPost2020.dates(effective_thurs_start, calc_end)
-        thurs_before_gf_2pm_early_closes = [
-            thurs for thurs in potential_thurs_dates if not is_first_friday(thurs + pd.Timedelta(days=1))
-        ]
+        def between(days, start):
+            days = days[(days >= u._to_days(start)[0]) & (days <= u._to_days(calc_end)[0])]
+            return list(u._days_index(days, u.DATE_RANGE_DTYPE))
+
+        gf_full_holidays = between(good_fridays[~first_friday], effective_gf_start)
+        gf_12pm_early_closes = between(good_fridays[first_friday], effective_gf_start)
+        thursdays = good_fridays[~first_friday] - np.timedelta64(1, "D")
+        thurs_before_gf_2pm_early_closes = between(thursdays, effective_thurs_start)
         return gf_full_holidays, gf_12pm_early_closes, thurs_before_gf_2pm_early_closes
 
     @property
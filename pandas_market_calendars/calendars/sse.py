@@ -4,7 +4,9 @@ from functools import partial
 from pandas.tseries.holiday import AbstractHolidayCalendar, Holiday, next_monday
 from zoneinfo import ZoneInfo
 
+from pandas_market_calendars.calendar_utils import _n_days
 from pandas_market_calendars.holidays.cn import *
+from pandas_market_calendars.holidays.compiler import observance_kernel, vectorized_observance, weekday_shifts
 from pandas_market_calendars.market_calendar import MarketCalendar
 
 
@@ -254,6 +256,7 @@ class SSEExchangeCalendar(MarketCalendar):
         return all_holidays
 
 
+@weekday_shifts((-2, -3, -3, -5, 0, 0, 0))
 def second_day_in_lieu(dt):
     dow = dt.weekday()
     if dow == 0:  # Holiday is Sunday, use Saturday
@@ -266,6 +269,7 @@ def second_day_in_lieu(dt):
     return dt
 
 
+@weekday_shifts((-1, -2, -3, -3, -5, 0, 0))
 def third_day_in_lieu(dt):
     dow = dt.weekday()
     if dow == 0:  # Holiday is Saturday, use Sunday
@@ -280,6 +284,15 @@ def third_day_in_lieu(dt):
     return dt
 
 
+def _lunisolar(days, mapping, func=None, delta=None):
+    if mapping:
+        days = lunisolar_days(mapping, days)
+    if delta:
+        days = days + _n_days(delta)
+    return observance_kernel(func)(days) if func else days
+
+
+@vectorized_observance(_lunisolar)
 def lunisolar(dt, mapping, func=None, delta=None):
     if mapping and (dt.year in mapping):
         new_dt = mapping[dt.year]
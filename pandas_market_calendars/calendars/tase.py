@@ -5,139 +5,143 @@ from pandas import DatetimeIndex, Timedelta, Timestamp
 from zoneinfo import ZoneInfo
 
 from pandas_market_calendars.calendar_utils import Day_Anchor, Month_Anchor
+from pandas_market_calendars.holidays.adhoc import adhoc_dates
 from pandas_market_calendars.market_calendar import MarketCalendar
 
 
-TASEClosedDay = [
-    # 2019
-    Timestamp("2019-03-21", tz="Asia/Jerusalem"),
-    Timestamp("2019-04-09", tz="Asia/Jerusalem"),
-    Timestamp("2019-04-25", tz="Asia/Jerusalem"),
-    Timestamp("2019-04-26", tz="Asia/Jerusalem"),
-    Timestamp("2019-05-08", tz="Asia/Jerusalem"),
-    Timestamp("2019-05-09", tz="Asia/Jerusalem"),
-    Timestamp("2019-06-09", tz="Asia/Jerusalem"),
-    Timestamp("2019-08-11", tz="Asia/Jerusalem"),
-    Timestamp("2019-09-17", tz="Asia/Jerusalem"),
-    Timestamp("2019-09-29", tz="Asia/Jerusalem"),
-    Timestamp("2019-09-30", tz="Asia/Jerusalem"),
-    Timestamp("2019-10-01", tz="Asia/Jerusalem"),
-    Timestamp("2019-10-08", tz="Asia/Jerusalem"),
-    Timestamp("2019-10-09", tz="Asia/Jerusalem"),
-    Timestamp("2019-10-13", tz="Asia/Jerusalem"),
-    Timestamp("2019-10-14", tz="Asia/Jerusalem"),
-    Timestamp("2019-10-20", tz="Asia/Jerusalem"),
-    Timestamp("2019-10-21", tz="Asia/Jerusalem"),
-    # 2020
-    Timestamp("2020-03-02", tz="Asia/Jerusalem"),
-    Timestamp("2020-03-10", tz="Asia/Jerusalem"),
-    Timestamp("2020-04-08", tz="Asia/Jerusalem"),
-    Timestamp("2020-04-09", tz="Asia/Jerusalem"),
-    Timestamp("2020-04-14", tz="Asia/Jerusalem"),
-    Timestamp("2020-04-15", tz="Asia/Jerusalem"),
-    Timestamp("2020-04-28", tz="Asia/Jerusalem"),
-    Timestamp("2020-04-29", tz="Asia/Jerusalem"),
-    Timestamp("2020-05-28", tz="Asia/Jerusalem"),
-    Timestamp("2020-05-29", tz="Asia/Jerusalem"),
-    Timestamp("2020-07-30", tz="Asia/Jerusalem"),
-    Timestamp("2020-09-20", tz="Asia/Jerusalem"),
-    Timestamp("2020-09-27", tz="Asia/Jerusalem"),
-    Timestamp("2020-09-28", tz="Asia/Jerusalem"),
-    # 2021
-    Timestamp("2021-02-26", tz="Asia/Jerusalem"),
-    Timestamp("2021-03-28", tz="Asia/Jerusalem"),
-    Timestamp("2021-04-02", tz="Asia/Jerusalem"),
-    Timestamp("2021-04-14", tz="Asia/Jerusalem"),
-    Timestamp("2021-04-15", tz="Asia/Jerusalem"),
-    Timestamp("2021-05-16", tz="Asia/Jerusalem"),
-    Timestamp("2021-05-17", tz="Asia/Jerusalem"),
-    Timestamp("2021-07-18", tz="Asia/Jerusalem"),
-    Timestamp("2021-09-06", tz="Asia/Jerusalem"),
-    Timestamp("2021-09-07", tz="Asia/Jerusalem"),
-    Timestamp("2021-09-08", tz="Asia/Jerusalem"),
-    Timestamp("2021-09-15", tz="Asia/Jerusalem"),
-    Timestamp("2021-09-16", tz="Asia/Jerusalem"),
-    Timestamp("2021-09-20", tz="Asia/Jerusalem"),
-    Timestamp("2021-09-21", tz="Asia/Jerusalem"),
-    Timestamp("2021-09-27", tz="Asia/Jerusalem"),
-    Timestamp("2021-09-28", tz="Asia/Jerusalem"),
-    # 2022
-    Timestamp("2022-03-17", tz="Asia/Jerusalem"),
-    Timestamp("2022-03-18", tz="Asia/Jerusalem"),
-    Timestamp("2022-04-15", tz="Asia/Jerusalem"),
-    Timestamp("2022-04-21", tz="Asia/Jerusalem"),
-    Timestamp("2022-04-22", tz="Asia/Jerusalem"),
-    Timestamp("2022-05-05", tz="Asia/Jerusalem"),
-    Timestamp("2022-06-05", tz="Asia/Jerusalem"),
-    Timestamp("2022-08-07", tz="Asia/Jerusalem"),
-    Timestamp("2022-09-25", tz="Asia/Jerusalem"),
-    Timestamp("2022-09-26", tz="Asia/Jerusalem"),
-    Timestamp("2022-09-27", tz="Asia/Jerusalem"),
-    Timestamp("2022-10-04", tz="Asia/Jerusalem"),
-    Timestamp("2022-10-05", tz="Asia/Jerusalem"),
-    Timestamp("2022-10-09", tz="Asia/Jerusalem"),
-    Timestamp("2022-10-10", tz="Asia/Jerusalem"),
-    Timestamp("2022-10-16", tz="Asia/Jerusalem"),
-    Timestamp("2022-10-17", tz="Asia/Jerusalem"),
-    Timestamp("2022-11-01", tz="Asia/Jerusalem"),
-    # 2023
-    Timestamp("2023-03-07", tz="Asia/Jerusalem"),
-    Timestamp("2023-03-08", tz="Asia/Jerusalem"),
-    Timestamp("2023-04-05", tz="Asia/Jerusalem"),
-    Timestamp("2023-04-06", tz="Asia/Jerusalem"),
-    Timestamp("2023-04-11", tz="Asia/Jerusalem"),
-    Timestamp("2023-04-12", tz="Asia/Jerusalem"),
-    Timestamp("2023-04-25", tz="Asia/Jerusalem"),
-    Timestamp("2023-04-26", tz="Asia/Jerusalem"),
-    Timestamp("2023-05-25", tz="Asia/Jerusalem"),
-    Timestamp("2023-05-26", tz="Asia/Jerusalem"),
-    Timestamp("2023-07-27", tz="Asia/Jerusalem"),
-    Timestamp("2023-09-15", tz="Asia/Jerusalem"),
-    Timestamp("2023-09-17", tz="Asia/Jerusalem"),
-    Timestamp("2023-09-24", tz="Asia/Jerusalem"),
-    Timestamp("2023-09-25", tz="Asia/Jerusalem"),
-    Timestamp("2023-09-29", tz="Asia/Jerusalem"),
-    Timestamp("2023-10-06", tz="Asia/Jerusalem"),
-    Timestamp("2023-10-31", tz="Asia/Jerusalem"),
-    # 2024
-    Timestamp("2024-03-24", tz="Asia/Jerusalem"),
-    Timestamp("2024-03-25", tz="Asia/Jerusalem"),
-    Timestamp("2024-04-22", tz="Asia/Jerusalem"),
-    Timestamp("2024-04-23", tz="Asia/Jerusalem"),
-    Timestamp("2024-04-28", tz="Asia/Jerusalem"),
-    Timestamp("2024-04-29", tz="Asia/Jerusalem"),
-    Timestamp("2024-05-13", tz="Asia/Jerusalem"),
-    Timestamp("2024-05-14", tz="Asia/Jerusalem"),
-    Timestamp("2024-06-11", tz="Asia/Jerusalem"),
-    Timestamp("2024-06-12", tz="Asia/Jerusalem"),
-    Timestamp("2024-08-13", tz="Asia/Jerusalem"),
-    Timestamp("2024-10-02", tz="Asia/Jerusalem"),
-    Timestamp("2024-10-03", tz="Asia/Jerusalem"),
-    Timestamp("2024-10-04", tz="Asia/Jerusalem"),
-    Timestamp("2024-10-11", tz="Asia/Jerusalem"),
-    Timestamp("2024-10-16", tz="Asia/Jerusalem"),
-    Timestamp("2024-10-17", tz="Asia/Jerusalem"),
-    Timestamp("2024-10-23", tz="Asia/Jerusalem"),
-    Timestamp("2024-10-24", tz="Asia/Jerusalem"),
-    # 2025
-    Timestamp("2025-03-14", tz="Asia/Jerusalem"),
-    Timestamp("2025-04-13", tz="Asia/Jerusalem"),
-    Timestamp("2025-04-18", tz="Asia/Jerusalem"),
-    Timestamp("2025-04-30", tz="Asia/Jerusalem"),
-    Timestamp("2025-05-01", tz="Asia/Jerusalem"),
-    Timestamp("2025-06-01", tz="Asia/Jerusalem"),
-    Timestamp("2025-06-02", tz="Asia/Jerusalem"),
-    Timestamp("2025-08-03", tz="Asia/Jerusalem"),
-    Timestamp("2025-09-22", tz="Asia/Jerusalem"),
-    Timestamp("2025-09-23", tz="Asia/Jerusalem"),
-    Timestamp("2025-09-24", tz="Asia/Jerusalem"),
-    Timestamp("2025-10-01", tz="Asia/Jerusalem"),
-    Timestamp("2025-10-02", tz="Asia/Jerusalem"),
-    Timestamp("2025-10-06", tz="Asia/Jerusalem"),
-    Timestamp("2025-10-07", tz="Asia/Jerusalem"),
-    Timestamp("2025-10-13", tz="Asia/Jerusalem"),
-    Timestamp("2025-10-14", tz="Asia/Jerusalem"),
-]
+TASEClosedDay = adhoc_dates(
+    [
+        # 2019
+        "2019-03-21",
+        "2019-04-09",
+        "2019-04-25",
+        "2019-04-26",
+        "2019-05-08",
+        "2019-05-09",
+        "2019-06-09",
+        "2019-08-11",
+        "2019-09-17",
+        "2019-09-29",
+        "2019-09-30",
+        "2019-10-01",
+        "2019-10-08",
+        "2019-10-09",
+        "2019-10-13",
+        "2019-10-14",
+        "2019-10-20",
+        "2019-10-21",
+        # 2020
+        "2020-03-02",
+        "2020-03-10",
+        "2020-04-08",
+        "2020-04-09",
+        "2020-04-14",
+        "2020-04-15",
+        "2020-04-28",
+        "2020-04-29",
+        "2020-05-28",
+        "2020-05-29",
+        "2020-07-30",
+        "2020-09-20",
+        "2020-09-27",
+        "2020-09-28",
+        # 2021
+        "2021-02-26",
+        "2021-03-28",
+        "2021-04-02",
+        "2021-04-14",
+        "2021-04-15",
+        "2021-05-16",
+        "2021-05-17",
+        "2021-07-18",
+        "2021-09-06",
+        "2021-09-07",
+        "2021-09-08",
+        "2021-09-15",
+        "2021-09-16",
+        "2021-09-20",
+        "2021-09-21",
+        "2021-09-27",
+        "2021-09-28",
+        # 2022
+        "2022-03-17",
+        "2022-03-18",
+        "2022-04-15",
+        "2022-04-21",
+        "2022-04-22",
+        "2022-05-05",
+        "2022-06-05",
+        "2022-08-07",
+        "2022-09-25",
+        "2022-09-26",
+        "2022-09-27",
+        "2022-10-04",
+        "2022-10-05",
+        "2022-10-09",
+        "2022-10-10",
+        "2022-10-16",
+        "2022-10-17",
+        "2022-11-01",
+        # 2023
+        "2023-03-07",
+        "2023-03-08",
+        "2023-04-05",
+        "2023-04-06",
+        "2023-04-11",
+        "2023-04-12",
+        "2023-04-25",
+        "2023-04-26",
+        "2023-05-25",
+        "2023-05-26",
+        "2023-07-27",
+        "2023-09-15",
+        "2023-09-17",
+        "2023-09-24",
+        "2023-09-25",
+        "2023-09-29",
+        "2023-10-06",
+        "2023-10-31",
+        # 2024
+        "2024-03-24",
+        "2024-03-25",
+        "2024-04-22",
+        "2024-04-23",
+        "2024-04-28",
+        "2024-04-29",
+        "2024-05-13",
+        "2024-05-14",
+        "2024-06-11",
+        "2024-06-12",
+        "2024-08-13",
+        "2024-10-02",
+        "2024-10-03",
+        "2024-10-04",
+        "2024-10-11",
+        "2024-10-16",
+        "2024-10-17",
+        "2024-10-23",
+        "2024-10-24",
+        # 2025
+        "2025-03-14",
+        "2025-04-13",
+        "2025-04-18",
+        "2025-04-30",
+        "2025-05-01",
+        "2025-06-01",
+        "2025-06-02",
+        "2025-08-03",
+        "2025-09-22",
+        "2025-09-23",
+        "2025-09-24",
+        "2025-10-01",
+        "2025-10-02",
+        "2025-10-06",
+        "2025-10-07",
+        "2025-10-13",
+        "2025-10-14",
+    ],
+    tz="Asia/Jerusalem",
+)
 
 
 class TASEExchangeCalendar(MarketCalendar):
@@ -1,4 +1,5 @@
 import inspect
+import threading
 from pprint import pformat
 
 
@@ -13,7 +14,7 @@ def _regmeta_instance_factory(cls, name: str, *args, **kwargs):
     try:
         class_ = cls._regmeta_class_registry[name]
     except KeyError:
-        raise RuntimeError(f"Class {name} is not one of the registered classes: {cls._regmeta_class_registry.keys()}")
+        raise RuntimeError(f"Class {name} is not one of the registered classes: {cls._regmeta_class_registry.names()}")
     return class_(*args, **kwargs)
 
 
@@ -33,6 +34,57 @@ def _regmeta_register_class(cls, regcls, name: str):
         cls._regmeta_class_registry[name] = regcls
 
 
+class ClassRegistry(dict):
+    """
+    Maps names to registered classes. Classes that are expensive to create can be added as loaders instead,
+    which are called the first time their name is looked up and need to create (and so register) the class.
+    Names that are expensive to list can be added by finders, which add their loaders when first needed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.loaders = {}
+        self.finders = []
+        self._lock = threading.RLock()
+
+    def add_loader(self, name: str, loader) -> None:
+        """
+        :param name: name under which the class will be registered
+        :param loader: callable that receives the name and creates the class
+        """
+        self.loaders[name] = loader
+
+    def add_finder(self, finder) -> None:
+        """
+        :param finder: callable without arguments that adds loaders, it is called once, the first time that
+            a name without class or loader is looked up or that the names are listed
+        """
+        self.finders.append(finder)
+
+    def _find(self) -> None:
+        with self._lock:
+            while self.finders:
+                self.finders[0]()
+                self.finders.pop(0)
+
+    def __missing__(self, name):
+        with self._lock:
+            if name not in self:  # may have been created by another thread in the meantime
+                if name not in self.loaders:
+                    self._find()
+                self.loaders[name](name)
+                # only dropped once the class exists, a loader that raises is tried again by the next lookup
+                self.loaders.pop(name)
+            return self[name]
+
+    def names(self) -> list:
+        """
+        :return: names of the registered classes, followed by those of the classes that are not yet created
+        """
+        self._find()
+        return list(self) + [name for name in self.loaders if name not in self]
+
+
 class RegisteryMeta(type):
     """
     Metaclass used to register all classes inheriting from RegisteryMeta
@@ -42,7 +94,7 @@ class RegisteryMeta(type):
         cls = super().__new__(mcs, name, bases, attr)
         if not hasattr(cls, "_regmeta_class_registry"):
             # Metaclass dynamically adds class registry and factory method
-            cls._regmeta_class_registry = {}  # type: ignore[assignment]
+            cls._regmeta_class_registry = ClassRegistry()  # type: ignore[assignment]
             cls.factory = classmethod(_regmeta_instance_factory)  # type: ignore[assignment]
 
         return cls
@@ -0,0 +1,37 @@
+"""
+Compact storage of long lists of ad-hoc holidays.
+
+A list of pd.Timestamp objects costs a Python object per date, created when the module is imported. The dates
+are kept as strings instead, which are constants of the compiled module, and parsed at once by numpy into a
+DatetimeIndex, which holds them as a single array of int64.
+"""
+
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+
+def adhoc_dates(dates: Sequence[str], tz=None) -> pd.DatetimeIndex:
+    """
+    :param dates: dates in the ISO format, YYYY-MM-DD
+    :param tz: time zone of the dates, None for naive dates
+    :return: DatetimeIndex of the dates at midnight, in the given time zone
+    """
+    days = pd.DatetimeIndex(np.array(dates, dtype="datetime64[D]").astype("datetime64[us]"))
+    return days if tz is None else days.tz_localize(tz)
+
+
+def adhoc_range(start: str, end: str, weekmask: str = "Mon Tue Wed Thu Fri", tz=None) -> pd.DatetimeIndex:
+    """
+    Same dates as pd.date_range(start, end, freq=CustomBusinessDay(weekmask=weekmask), tz=tz), without building
+    the CustomBusinessDay.
+
+    :param start: first date in the ISO format, YYYY-MM-DD
+    :param end: last date in the ISO format, YYYY-MM-DD
+    :param weekmask: weekmask of the days of the week in the range
+    :param tz: time zone of the dates, None for naive dates
+    :return: DatetimeIndex of the dates at midnight, in the given time zone
+    """
+    days = np.arange(np.datetime64(start, "D"), np.datetime64(end, "D") + np.timedelta64(1, "D"))
+    return adhoc_dates(days[np.is_busday(days, weekmask=weekmask)], tz=tz)
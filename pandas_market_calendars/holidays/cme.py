@@ -1,10 +1,15 @@
 import datetime
 
+import numpy as np
 from dateutil.relativedelta import FR, MO, TH
 from pandas import DateOffset, Timestamp
 from pandas.tseries.holiday import Easter, Holiday, nearest_workday
 from pandas.tseries.offsets import Day
 
+from pandas_market_calendars.calendar_utils import _n_days
+from pandas_market_calendars.holidays.compiler import easter as easter_of
+from pandas_market_calendars.holidays.compiler import vectorized_observance, weekday_of, years_of
+
 
 #########
 # Martin Luther King
@@ -103,6 +108,13 @@ easter = Easter()
 daymin2 = Day(-2)
 
 
+def _not_0815_close(days):
+    years = years_of(days)
+    good_fridays = easter_of(years) - np.timedelta64(2, "D")
+    return np.where(np.isin(years, (2010, 2012, 2015)), np.datetime64("NaT", "D"), good_fridays)
+
+
+@vectorized_observance(_not_0815_close)
 def not_0815_close(dt):
     if dt.year in (2010, 2012, 2015):
         return None
@@ -356,6 +368,12 @@ USThanksgivingAfter2014 = Holiday(
 # )
 
 
+def _fri_after_4th_thu(days):
+    # the same steps as fri_after_4th_thu from each date, so rules anchored at any date get the dates of pandas
+    return days + _n_days((3 - weekday_of(days)) % 7 + 22)
+
+
+@vectorized_observance(_fri_after_4th_thu)
 def fri_after_4th_thu(dt):
     # dt will just be Nov 1st
     diff_to_thu = 3 - dt.weekday()
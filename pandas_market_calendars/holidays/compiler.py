@@ -0,0 +1,379 @@
+"""
+Vectorized evaluation of pandas Holiday rules.
+
+pandas evaluates a Holiday by applying its offsets or its observance function to every reference date
+(one per year) in Python. Most of the rules of the calendars are built from a few kinds of steps though:
+a fixed month and day, an nth weekday (DateOffset(weekday=MO(3))), Easter, a number of days, and an
+observance that moves the date depending on its day of the week (sunday_to_monday). These steps are
+compiled here into numpy operations on an array of years, so that all the years are evaluated at once.
+
+Rules with other offsets or observances are evaluated by pandas, see rule_dates.
+
+Many calendars share the same rule objects (USNewYearsDay, GoodFriday, Christmas, ...), so the dates of each
+rule are kept in rule_cache, a process-wide LRUCache that holds one span of years per rule. The span covers
+the default span of the calendars, 1885 to 2200, and is widened when a query needs more years, so a rule is
+evaluated once for all of the calendars and all of the date ranges that use it.
+
+Observances defined in this package are made known to the compiler with the weekday_shifts decorator:
+
+    >>> @weekday_shifts((0, 0, 0, 0, 0, -1, 1))
+    ... def nearest_workday(dt): ...
+
+or, when they depend on more than the day of the week, with a numpy version of the function:
+
+    >>> @vectorized_observance(lambda days: easter(years_of(days)) - np.timedelta64(2, "D"))
+    ... def good_friday(dt): ...
+"""
+
+from functools import partial
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from pandas.tseries import holiday as pd_holiday
+from pandas.tseries.holiday import AbstractHolidayCalendar, Holiday
+from pandas.tseries.offsets import DateOffset, Day, Easter, LastWeekOfMonth, WeekOfMonth
+
+from ..calendar_utils import DATE_RANGE_DTYPE, _days_index, _n_days, _to_days
+from ..lru import LRUCache
+
+
+# Observance functions that only depend on the day of the week of the date: the number of days that they
+# move a date on a Monday, Tuesday, ..., Sunday. None drops the date.
+_WEEKDAY_SHIFTS = {
+    pd_holiday.sunday_to_monday: (0, 0, 0, 0, 0, 0, 1),
+    pd_holiday.nearest_workday: (0, 0, 0, 0, 0, -1, 1),
+    pd_holiday.previous_friday: (0, 0, 0, 0, 0, -1, -2),
+    pd_holiday.weekend_to_monday: (0, 0, 0, 0, 0, 2, 1),
+    pd_holiday.next_monday: (0, 0, 0, 0, 0, 2, 1),
+    pd_holiday.next_monday_or_tuesday: (1, 0, 0, 0, 0, 2, 2),
+    pd_holiday.previous_workday: (-3, -1, -1, -1, -1, -1, -2),
+    pd_holiday.next_workday: (1, 1, 1, 1, 3, 2, 1),
+    pd_holiday.before_nearest_workday: (-3, -1, -1, -1, -1, -2, -2),
+    pd_holiday.after_nearest_workday: (1, 1, 1, 1, 3, 2, 2),
+}
+
+_NAT = np.datetime64("NaT", "D")
+
+# (first year, last year, dates) of each rule, shared by all calendars of the process. The rules are
+# compared by identity, the cache holds a reference to them.
+rule_cache = LRUCache(max_entries=4096)
+# Years that are evaluated at least for rules without start or end date: the default span of the calendars,
+# 1885 to 2200, and the year on each side that Holiday._reference_dates adds
+_FIRST_YEAR, _LAST_YEAR = 1884, 2201
+
+
+def weekday_shifts(shifts: Sequence[Optional[int]]):
+    """
+    Decorator for observance functions that only depend on the day of the week of the date, so that rules
+    using them can be compiled.
+
+    :param shifts: number of days that the function moves a date on a Monday, Tuesday, ..., Sunday,
+        None where it returns None
+    :return: decorator that registers the function and returns it unchanged
+    """
+
+    def decorator(func):
+        _WEEKDAY_SHIFTS[func] = tuple(shifts)
+        return func
+
+    return decorator
+
+
+# Observance functions with a numpy version, which takes the np.ndarray of datetime64[D] of the reference dates
+# and returns the observed dates, NaT where they are dropped.
+_VECTORIZED_OBSERVANCES = {}
+
+
+def vectorized_observance(kernel: Callable[..., np.ndarray]):
+    """
+    Decorator for observance functions that have a numpy version, so that rules using them can be compiled.
+    Rules can also use the function with keyword arguments bound by functools.partial, they are passed on
+    to the kernel.
+
+    :param kernel: function that takes an np.ndarray of datetime64[D], and the keyword arguments of the
+        observance function, and returns the np.ndarray of datetime64[D] that the observance function returns
+        for each of them, NaT where it returns None
+    :return: decorator that registers the function and returns it unchanged
+    """
+
+    def decorator(func):
+        _VECTORIZED_OBSERVANCES[func] = kernel
+        return func
+
+    return decorator
+
+
+def weekday_of(days: np.ndarray) -> np.ndarray:
+    """
+    :param days: np.ndarray of datetime64[D]
+    :return: np.ndarray of int with the day of the week of each day, Monday is 0 and Sunday is 6
+    """
+    # 1970-01-01 was a Thursday
+    return (days.astype(np.int64) + 3) % 7
+
+
+def observance_kernel(observance: Callable) -> Optional[Callable[[np.ndarray], np.ndarray]]:
+    """
+    numpy version of an observance function, which is either registered with weekday_shifts or
+    vectorized_observance, or a functools.partial of a function registered with vectorized_observance whose
+    arguments are bound by keyword. Functions given as keyword arguments must have a numpy version too.
+
+    :param observance: observance function
+    :return: function that takes an np.ndarray of datetime64[D] and returns the observed dates, NaT where
+        they are dropped. None if the observance has no numpy version.
+    """
+    if isinstance(observance, partial):
+        if observance.args:
+            return None
+        if not observance.keywords:
+            return observance_kernel(observance.func)
+        kernel = _VECTORIZED_OBSERVANCES.get(observance.func)
+        if kernel is None or any(
+            callable(value) and observance_kernel(value) is None for value in observance.keywords.values()
+        ):
+            return None
+        return partial(kernel, **observance.keywords)
+
+    if observance in _VECTORIZED_OBSERVANCES:
+        return _VECTORIZED_OBSERVANCES[observance]
+    shifts = _WEEKDAY_SHIFTS.get(observance)
+    return None if shifts is None else _shift_by_weekday(shifts)
+
+
+def _shift_by_weekday(shifts) -> Callable[[np.ndarray], np.ndarray]:
+    table = np.array([0 if s is None else s for s in shifts], dtype=np.int64)
+    dropped = np.array([s is None for s in shifts])
+
+    def apply(days):
+        weekday = weekday_of(days)
+        days = days + _n_days(table[weekday])
+        return np.where(dropped[weekday], _NAT, days) if dropped.any() else days
+
+    return apply
+
+
+def easter(years: np.ndarray) -> np.ndarray:
+    """
+    Vectorized dateutil.easter.easter with the Western method, the one used by pandas.
+
+    :param years: np.ndarray of int
+    :return: np.ndarray of datetime64[D] with the date of Easter Sunday of each year
+    """
+    y = np.asarray(years, dtype=np.int64)
+    g = y % 19
+    c = y // 100
+    h = (c - c // 4 - (8 * c + 13) // 25 + 19 * g + 15) % 30
+    i = h - (h // 28) * (1 - (h // 28) * (29 // (h + 1)) * ((21 - g) // 11))
+    j = (y + y // 4 + i + 2 - c + c // 4) % 7
+    p = i - j
+    d = 1 + (p + 27 + (p + 6) // 40) % 31
+    m = 3 + (p + 26) // 30
+    return _ymd(y, m, d)
+
+
+def _ymd(years, months, days) -> np.ndarray:
+    ym = (np.asarray(years, dtype=np.int64) - 1970) * 12 + np.asarray(months, dtype=np.int64) - 1
+    return ym.astype("datetime64[M]").astype("datetime64[D]") + _n_days(np.asarray(days, dtype=np.int64) - 1)
+
+
+def years_of(days: np.ndarray) -> np.ndarray:
+    """
+    :param days: np.ndarray of datetime64[D]
+    :return: np.ndarray of int with the year of each day
+    """
+    return days.astype("datetime64[Y]").astype(np.int64) + 1970
+
+
+def _compile_offset(offset) -> Optional[Callable[[np.ndarray], np.ndarray]]:
+    if getattr(offset, "normalize", False):
+        return None
+
+    if isinstance(offset, Day) or (type(offset) is DateOffset and offset.kwds.keys() == {"days"}):
+        n = offset.n * (offset.kwds["days"] if type(offset) is DateOffset else 1)
+        return lambda days: days + np.timedelta64(n, "D")
+
+    if type(offset) is DateOffset and offset.n == 1 and offset.kwds.keys() == {"weekday"}:
+        # relativedelta(weekday=MO(n)): the nth Monday from the date on (n > 0), or back from the date (n < 0)
+        weekday = offset.kwds["weekday"]
+        target, nth = (weekday, 1) if isinstance(weekday, int) else (weekday.weekday, weekday.n or 1)
+        weeks = (abs(nth) - 1) * 7
+        if nth > 0:
+            return lambda days: days + _n_days(weeks + (target - weekday_of(days)) % 7)
+        return lambda days: days - _n_days(weeks + (weekday_of(days) - target) % 7)
+
+    if type(offset) in (WeekOfMonth, LastWeekOfMonth) and offset.n == 1:
+        # the day in the month of the date, or in the next month when the date is on or after it
+        if type(offset) is WeekOfMonth:
+            week, weekday = offset.week, offset.weekday
+
+            def day_in(months):
+                first = months.astype("datetime64[D]")
+                return first + _n_days((weekday - weekday_of(first)) % 7 + 7 * week)
+
+        else:
+            weekday = offset.weekday
+
+            def day_in(months):
+                last = (months + np.timedelta64(1, "M")).astype("datetime64[D]") - np.timedelta64(1, "D")
+                return last - _n_days((weekday_of(last) - weekday) % 7)
+
+        def apply(days):
+            months = days.astype("datetime64[M]")
+            current = day_in(months)
+            return np.where(days < current, current, day_in(months + np.timedelta64(1, "M")))
+
+        return apply
+
+    if type(offset) is Easter:
+        n = offset.n
+
+        def apply(days):
+            years = years_of(days)
+            current = easter(years)
+            step = np.full(len(days), n, dtype=np.int64)
+            if n >= 0:
+                step[days < current] -= 1
+            else:
+                step[days > current] += 1
+            return easter(years + step)
+
+        return apply
+
+    return None
+
+
+def compile_rule(rule: Holiday) -> Optional[Callable[[np.ndarray], np.ndarray]]:
+    """
+    Compile the offsets or the observance of a Holiday rule.
+
+    :param rule: Holiday
+    :return: function that takes an np.ndarray of years and returns the np.ndarray of datetime64[D] of the
+        holiday in each year (NaT where it is dropped), before the start_date and end_date of the rule are
+        applied. None if the rule can't be compiled.
+    """
+    if type(rule) is not Holiday or rule.year is not None or getattr(rule, "exclude_dates", None) is not None:
+        return None  # subclasses of Holiday can compute their dates differently
+    if not (isinstance(rule.month, int) and isinstance(rule.day, int)) or (rule.month, rule.day) == (2, 29):
+        return None  # pandas moves the reference dates of February 29th to the 28th after the first year
+
+    if rule.observance is not None:
+        kernel = observance_kernel(rule.observance)
+        if kernel is None:
+            return None
+        steps = [kernel]
+    else:
+        offsets = rule.offset if isinstance(rule.offset, list) else [] if rule.offset is None else [rule.offset]
+        steps = [_compile_offset(offset) for offset in offsets]
+        if any(step is None for step in steps):
+            return None
+
+    month, day = rule.month, rule.day
+    days_of_week = None if rule.days_of_week is None else np.array(rule.days_of_week)
+
+    def evaluate(years):
+        days = _ymd(years, month, day)
+        for step in steps:
+            days = step(days)
+        if days_of_week is not None:
+            days = days[np.isin(weekday_of(days), days_of_week)]
+        return days
+
+    return evaluate
+
+
+def rule_dates(rule: Holiday, start_date, end_date) -> pd.DatetimeIndex:
+    """
+    Same as rule.dates(start_date, end_date), but evaluated with numpy when the rule can be compiled and
+    shared through rule_cache.
+
+    :param rule: Holiday
+    :param start_date: first date, inclusive
+    :param end_date: last date, inclusive
+    :return: DatetimeIndex of the holidays between start_date and end_date
+    """
+    days = _rule_days(rule, pd.Timestamp(start_date), pd.Timestamp(end_date))
+    if days is None:
+        return rule.dates(start_date, end_date)
+    return _days_index(days, DATE_RANGE_DTYPE)
+
+
+def _year_days(rule, first: int, last: int) -> np.ndarray:
+    """
+    :return: read-only array of the dates of the rule in the years from first to last, and possibly more
+    """
+    cached = rule_cache.get(rule)
+    if cached is not None:
+        if cached[0] <= first and cached[1] >= last:
+            return cached[2]
+        # evaluate the rule again for the span of both, the callers slice the days they need
+        first, last = min(first, cached[0]), max(last, cached[1])
+
+    evaluate = compile_rule(rule)
+    if evaluate is not None:
+        days = evaluate(np.arange(first, last + 1))
+    else:
+        # pandas evaluates the reference dates of the years before and after the dates given
+        days = rule.dates(pd.Timestamp(first + 1, 1, 1), pd.Timestamp(last - 1, 12, 31))
+        days = days.values.astype("datetime64[D]")
+    days.setflags(write=False)
+    rule_cache.set(rule, (first, last, days))
+    return days
+
+
+def _rule_days(rule, start, end) -> Optional[np.ndarray]:
+    # subclasses of Holiday can compute their dates differently, or depend on what was computed before
+    if type(rule) is not Holiday or start.tz is not None or end.tz is not None:
+        return None
+
+    first_day = start if rule.start_date is None else max(start, rule.start_date)
+    last_day = end if rule.end_date is None else min(end, rule.end_date)
+    # the dates are at midnight, so a start with a time excludes its own day
+    lo = _to_days(first_day)[0] + np.timedelta64(int(first_day != first_day.normalize()), "D")
+    hi = _to_days(last_day)[0]
+    if lo > hi:  # the rule doesn't apply between start and end, it isn't evaluated
+        return np.array([], dtype="datetime64[D]")
+
+    # the same years as Holiday._reference_dates, which start from the dates of the rule when it has them,
+    # widened to the default span so that other date ranges are served by the same days
+    first = min(start.year - 1, _FIRST_YEAR) if rule.start_date is None else rule.start_date.year - 1
+    last = max(end.year + 1, _LAST_YEAR) if rule.end_date is None else rule.end_date.year + 1
+    days = _year_days(rule, first, last)
+    return days[(days >= lo) & (days <= hi)]
+
+
+def calendar_holidays(calendar: AbstractHolidayCalendar, start=None, end=None, *, fallback=True):
+    """
+    Same as calendar.holidays(start, end), with the dates of the rules taken from rule_cache.
+
+    :param calendar: AbstractHolidayCalendar
+    :param start: first date, default is AbstractHolidayCalendar.start_date as in pandas
+    :param end: last date, default is AbstractHolidayCalendar.end_date as in pandas
+    :param fallback: whether rules that can't be shared through rule_cache, like subclasses of Holiday, are
+        evaluated by pandas. If False, None is returned when any of the rules can't be shared.
+    :return: sorted DatetimeIndex of the holidays between start and end, or None
+    """
+    if type(calendar).holidays is not AbstractHolidayCalendar.holidays or calendar.rules is None:
+        return calendar.holidays(start, end) if fallback else None
+
+    start = pd.Timestamp(AbstractHolidayCalendar.start_date if start is None else start)
+    end = pd.Timestamp(AbstractHolidayCalendar.end_date if end is None else end)
+
+    parts = []
+    for rule in calendar.rules:
+        if rule.year is not None and type(rule) is Holiday and isinstance(rule.month, int):
+            # pandas gives the date in that year as it is, without the offsets and the observance
+            parts.append(_ymd([rule.year], rule.month, rule.day))
+            continue
+        days = _rule_days(rule, start, end)
+        if days is None:
+            if not fallback:
+                return None
+            days = rule.dates(start, end).values.astype("datetime64[D]")
+        parts.append(days)
+
+    days = np.sort(np.concatenate(parts)) if parts else np.array([], dtype="datetime64[D]")
+    # AbstractHolidayCalendar.holidays slices the result to start and end again, which drops the single year rules
+    lo = _to_days(start)[0] + np.timedelta64(int(start != start.normalize()), "D")
+    days = days[(days >= lo) & (days <= _to_days(end)[0])]
+    return _days_index(days, DATE_RANGE_DTYPE)
@@ -12,9 +12,13 @@ using pyephem (http://rhodesmill.org/pyephem/quick.html#equinoxes-solstices).
 For a double check, see:  https://aa.usno.navy.mil/data/docs/EarthSeasons.php
 """
 
+import numpy as np
 import pandas as pd
 from pandas.tseries.holiday import sunday_to_monday
 
+from pandas_market_calendars.calendar_utils import _n_days
+from pandas_market_calendars.holidays.compiler import _ymd, vectorized_observance, weekday_of, years_of
+
 
 vernal_year_to_march_mapping = {
     1875: 21,
@@ -473,11 +477,52 @@ autumnal_year_to_september_mapping = {
 }
 
 
+def _day_table(mapping, default):
+    first = min(mapping)
+    days = np.array([mapping.get(year, default) for year in range(first, max(mapping) + 1)])
+
+    def lookup(years):
+        ix = years - first
+        inside = (ix >= 0) & (ix < len(days))
+        return np.where(inside, days[np.where(inside, ix, 0)], default)
+
+    return lookup
+
+
+_vernal_march_day = _day_table(vernal_year_to_march_mapping, 20)
+_autumnal_september_day = _day_table(autumnal_year_to_september_mapping, 23)
+
+
+def vernal_equinox_days(years):
+    """
+    :param years: np.ndarray of int
+    :return: np.ndarray of datetime64[D] with the vernal equinox of each year
+    """
+    years = np.asarray(years, dtype=np.int64)
+    return _ymd(years, 3, _vernal_march_day(years))
+
+
+def autumnal_equinox_days(years):
+    """
+    :param years: np.ndarray of int
+    :return: np.ndarray of datetime64[D] with the autumnal equinox of each year
+    """
+    years = np.asarray(years, dtype=np.int64)
+    return _ymd(years, 9, _autumnal_september_day(years))
+
+
+def _observed(days):
+    # sunday_to_monday from 1973 on
+    sunday = weekday_of(days) == 6
+    return days + _n_days(sunday & (years_of(days) >= 1973))
+
+
 def vernal_equinox_for_year(year):
     day = vernal_year_to_march_mapping.get(year, 20)
     return pd.Timestamp(year, 3, day)
 
 
+@vectorized_observance(lambda days: _observed(vernal_equinox_days(years_of(days))))
 def vernal_equinox(dt):
     year = dt.year
     equinox = vernal_equinox_for_year(year)
@@ -489,6 +534,7 @@ def autumnal_equinox_for_year(year):
     return pd.Timestamp(year, 9, day)
 
 
+@vectorized_observance(lambda days: _observed(autumnal_equinox_days(years_of(days))))
 def autumnal_equinox(dt):
     year = dt.year
     equinox = autumnal_equinox_for_year(year)
@@ -496,10 +542,10 @@ def autumnal_equinox(dt):
 
 
 def autumnal_citizen_dates(start=2003, end=2099):
-    dates = []
-    for year in range(start, end):
-        respect_for_aged = pd.Timestamp(year, 9, 1) + pd.offsets.WeekOfMonth(week=2, weekday=0)
-        equinox = autumnal_equinox_for_year(year)
-        if (equinox - respect_for_aged).days == 2:
-            dates.append(respect_for_aged + pd.offsets.Day())
-    return dates
+    years = np.arange(start, end)
+    september = _ymd(years, 9, 1)
+    # Respect for the Aged Day is the 3rd Monday of September
+    respect_for_aged = september + _n_days((0 - weekday_of(september)) % 7 + 14)
+    equinox = autumnal_equinox_days(years)
+    citizens = respect_for_aged[equinox - respect_for_aged == np.timedelta64(2, "D")] + np.timedelta64(1, "D")
+    return list(pd.DatetimeIndex(citizens))
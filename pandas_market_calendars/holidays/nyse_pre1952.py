@@ -0,0 +1,950 @@
+from dateutil.relativedelta import TH
+from pandas import DateOffset, Timestamp, date_range
+from pandas.tseries.holiday import Easter, Holiday, sunday_to_monday
+from pandas.tseries.offsets import Day
+
+from pandas_market_calendars.holidays.adhoc import adhoc_dates, adhoc_range
+from pandas_market_calendars.market_calendar import (
+    FRIDAY,
+    MONDAY,
+    SATURDAY,
+    THURSDAY,
+    TUESDAY,
+    WEDNESDAY,
+)
+
+
+################################################################################################
+# The NYSE holidays, ad-hoc closings and special times that all lie before Saturday trading ended
+# on Sept. 29, 1952. They are only imported by holidays/nyse.py and NYSEExchangeCalendar when a
+# date before then is requested.
+#
+# main reference:
+#    https://github.com/rsheftel/pandas_market_calendars/files/6827110/Stocks.NYSE-Closings.pdf
+#
+# See nyse.py for details
+#################################################################################################
+
+
+####################################################
+# US New Years Day Jan 1
+#    Closed every year since the stock market opened
+#####################################################
+
+
+USNewYearsDayNYSEpre1952 = Holiday(
+    "New Years Day Before Saturday Trading Ceased",
+    month=1,
+    day=1,
+    end_date=Timestamp("1952-09-28"),
+    observance=sunday_to_monday,
+    days_of_week=(
+        MONDAY,
+        TUESDAY,
+        WEDNESDAY,
+        THURSDAY,
+        FRIDAY,
+        SATURDAY,
+    ),
+)
+
+
+# Not every Saturday before/after Christmas is a holiday
+SatBeforeNewYearsAdhoc = adhoc_dates(["1916-12-30"], tz="UTC")
+
+
+#########################################################################
+# US Presidents Day Feb
+#    Lincoln's birthday closed every year 1896-1953
+#    Washington's birthday closed every year. Observed Mondays since 1971
+#    Grant's birthday was celebrated once in 1897
+##########################################################################
+
+
+USWashingtonsBirthDayBefore1952 = Holiday(
+    "Washingtons Birthday",
+    month=2,
+    day=22,
+    end_date=Timestamp("1952-09-28"),
+    days_of_week=(
+        MONDAY,
+        TUESDAY,
+        WEDNESDAY,
+        THURSDAY,
+        FRIDAY,
+        SATURDAY,
+    ),
+    observance=sunday_to_monday,
+)
+
+
+# Not all Saturdays before Washingtons birthday were holidays (e.g. 1920)
+SatBeforeWashingtonsBirthdayAdhoc = adhoc_dates(
+    [
+        "1903-02-21",
+    ],
+    tz="UTC",
+)
+
+
+# Not all Saturdays after Washington's brithday were holidays (e.g. 1918)
+SatAfterWashingtonsBirthdayAdhoc = adhoc_dates(
+    [
+        "1901-02-23",
+        "1907-02-23",
+        "1929-02-23",
+        "1946-02-23",
+    ],
+    tz="UTC",
+)
+
+
+# Not all Saturdays before/after Lincoln's birthday were holidays
+SatBeforeAfterLincolnsBirthdayAdhoc = adhoc_dates(
+    [
+        "1899-02-11",
+        "1909-02-13",
+    ],
+    tz="UTC",
+)
+
+
+GrantsBirthDayAdhoc = adhoc_dates(["1897-04-27"], tz="UTC")
+
+
+############################################################
+# Good Friday
+#      closed every year except 1898, 1906, and 1907
+############################################################
+
+
+GoodFridayPre1898 = Holiday(
+    "Good Friday Before 1898",
+    start_date=Timestamp("1885-01-01"),
+    end_date=Timestamp("1897-12-31"),
+    month=1,
+    day=1,
+    offset=[Easter(), Day(-2)],
+)
+
+
+GoodFriday1899to1905 = Holiday(
+    "Good Friday 1899 to 1905",
+    start_date=Timestamp("1899-01-01"),
+    end_date=Timestamp("1905-12-31"),
+    month=1,
+    day=1,
+    offset=[Easter(), Day(-2)],
+)
+
+
+# Not every saturday after Good Friday is a holiday (e.g. 1904)
+SatAfterGoodFridayAdhoc = adhoc_dates(
+    [
+        "1900-04-14",
+        "1901-04-06",
+        "1902-03-29",
+        "1903-04-11",
+        "1905-04-22",
+        "1907-03-30",
+        "1908-04-18",
+        "1909-04-10",
+        "1910-03-26",
+        "1911-04-15",
+        "1913-03-22",
+        "1920-04-03",
+        "1929-03-30",
+        "1930-04-19",
+    ],
+    tz="UTC",
+)
+
+
+##################################################
+# US Memorial Day (Decoration Day) May 30
+#    Closed every year since 1873
+#    Observed on Monday since 1971
+##################################################
+
+
+USMemorialDayBefore1952 = Holiday(
+    "Memorial Day",
+    month=5,
+    day=30,
+    end_date=Timestamp("1952-09-28"),
+    observance=sunday_to_monday,
+    days_of_week=(MONDAY, TUESDAY, WEDNESDAY, THURSDAY, FRIDAY, SATURDAY),
+)
+
+
+# Not all Saturdays before/after Decoration Day were observed
+SatBeforeDecorationAdhoc = adhoc_dates(
+    [
+        "1904-05-28",
+        "1909-05-29",
+        "1910-05-28",
+        "1921-05-28",
+        "1926-05-29",
+        "1937-05-29",
+    ],
+    tz="UTC",
+)
+
+
+SatAfterDecorationAdhoc = adhoc_dates(
+    [
+        "1902-05-31",
+        "1913-05-31",
+        "1919-05-31",
+        "1924-05-31",
+        "1930-05-31",
+    ],
+    tz="UTC",
+)
+
+
+#######################################
+# US Independence Day July 4
+#######################################
+
+
+USIndependenceDayPre1952 = Holiday(
+    "July 4th",
+    month=7,
+    day=4,
+    end_date=Timestamp("1952-09-28"),
+    days_of_week=(MONDAY, TUESDAY, WEDNESDAY, THURSDAY, FRIDAY, SATURDAY),
+    observance=sunday_to_monday,
+)
+
+
+MonBeforeIndependenceDayAdhoc = adhoc_dates(
+    [
+        "1899-07-03",
+    ],
+    tz="UTC",
+)
+
+
+# Not all Saturdays before/after Independence day are observed
+SatBeforeIndependenceDayAdhoc = adhoc_dates(
+    [
+        "1887-07-02",
+        "1892-07-02",
+        "1898-07-02",
+        "1904-07-02",
+        "1909-07-03",
+        "1910-07-02",
+        "1920-07-03",
+        "1921-07-02",
+        "1926-07-03",
+        "1932-07-02",
+        "1937-07-03",
+    ],
+    tz="UTC",
+)
+
+
+SatAfterIndependenceDayAdhoc = adhoc_dates(
+    [
+        "1890-07-05",
+        "1902-07-05",
+        "1913-07-05",
+        "1919-07-05",
+        "1930-07-05",
+    ],
+    tz="UTC",
+)
+
+
+# Not every Saturday before Labor Day is observed. 1894 is an example.
+SatBeforeLaborDayAdhoc = adhoc_dates(
+    [
+        "1888-09-01",
+        "1898-09-03",
+        "1900-09-01",
+        "1901-08-31",
+        "1902-08-30",
+        "1903-09-05",
+        "1904-09-03",
+        "1907-08-31",
+        "1908-09-05",
+        "1909-09-04",
+        "1910-09-03",
+        "1911-09-02",
+        "1912-08-31",
+        "1913-08-30",
+        "1917-09-01",
+        "1919-08-30",
+        "1920-09-04",
+        "1921-09-03",
+        "1926-09-04",
+        "1929-08-31",
+        "1930-08-30",
+        "1931-09-05",
+    ],
+    tz="UTC",
+)
+
+
+################################################
+# US Thanksgiving Nov 30
+################################################
+
+
+USThanksgivingDayBefore1939 = Holiday(
+    "Thanksgiving Before 1939",
+    start_date=Timestamp("1864-01-01"),
+    end_date=Timestamp("1938-12-31"),
+    month=11,
+    day=30,
+    offset=DateOffset(weekday=TH(-1)),
+)
+
+
+USThanksgivingDay1939to1941 = Holiday(
+    "Thanksgiving 1939 to 1941",
+    start_date=Timestamp("1939-01-01"),
+    end_date=Timestamp("1941-12-31"),
+    month=11,
+    day=30,
+    offset=DateOffset(weekday=TH(-2)),
+)
+
+
+FridayAfterThanksgivingAdHoc = adhoc_dates(
+    [
+        "1888-11-30",
+    ],
+    tz="UTC",
+)
+
+
+# Not every Saturday before/after Christmas is a holiday
+SatBeforeChristmasAdhoc = adhoc_dates(
+    [
+        "1887-12-24",
+        "1898-12-24",
+        "1904-12-24",
+        "1910-12-24",
+        "1911-12-23",
+        "1922-12-23",
+        "1949-12-24",
+        "1950-12-23",
+    ],
+    tz="UTC",
+)
+
+
+SatAfterChristmasAdhoc = adhoc_dates(
+    [
+        "1891-12-26",
+        "1896-12-26",
+        "1903-12-26",
+        "1908-12-26",
+        "1925-12-26",
+        "1931-12-26",
+        "1936-12-26",
+    ],
+    tz="UTC",
+)
+
+
+#####################################
+# Retired holidays
+#####################################
+SatAfterColumbusDayAdHoc = adhoc_dates(
+    [
+        "1917-10-13",
+        "1945-10-13",
+    ],
+    tz="UTC",
+)
+
+
+##########################
+# Non-recurring holidays
+##########################
+
+# 1885
+UlyssesGrantFuneral1885 = adhoc_dates(["1885-08-08"], tz="UTC")
+
+
+# 1888
+GreatBlizzardOf1888 = adhoc_dates(
+    [
+        "1888-03-12",
+        "1888-03-13",
+    ],
+    tz="UTC",
+)
+
+
+# 1889
+WashingtonInaugurationCentennialCelebration1889 = adhoc_dates(
+    [
+        "1889-04-29",
+        "1889-04-30",
+        "1889-05-01",
+    ],
+    tz="UTC",
+)
+
+
+# 1892
+ColumbianCelebration1892 = adhoc_dates(
+    [
+        "1892-10-12",
+        "1892-10-21",
+        "1892-10-22",
+        "1893-04-27",
+    ],
+    tz="UTC",
+)
+
+
+# 1898
+# NYC's 5 boroughs founded as NYC
+# Not actually celebrated due to Spanish-American war but market was closed
+CharterDay1898 = adhoc_dates(["1898-05-04"], tz="UTC")
+
+
+WelcomeNavalCommander1898 = adhoc_dates(["1898-08-20"], tz="UTC")
+
+
+# 1899
+AdmiralDeweyCelebration1899 = adhoc_dates(
+    [
+        "1899-09-29",
+        "1899-09-30",
+    ],
+    tz="UTC",
+)
+
+
+GarretHobartFuneral1899 = adhoc_dates(["1899-11-25"], tz="UTC")
+
+
+# 1901
+QueenVictoriaFuneral1901 = adhoc_dates(["1901-02-02"], tz="UTC")
+
+
+MovedToProduceExchange1901 = adhoc_dates(["1901-04-27"], tz="UTC")
+
+
+EnlargedProduceExchange1901 = adhoc_dates(["1901-05-11"], tz="UTC")
+
+
+McKinleyDeathAndFuneral1901 = adhoc_dates(
+    [
+        "1901-09-14",
+        "1901-09-19",
+    ],
+    tz="UTC",
+)
+
+
+# 1902
+KingEdwardVIIcoronation1902 = adhoc_dates(["1902-08-09"], tz="UTC")
+
+
+# 1903
+NYSEnewBuildingOpen1903 = adhoc_dates(["1903-04-22"], tz="UTC")
+
+
+# 1908
+GroverClevelandFuneral1pmClose1908 = Holiday(
+    "Funeral of Grover Cleveland 1908 1pm Close",
+    month=6,
+    day=26,
+    start_date=Timestamp("1908-06-26"),
+    end_date=Timestamp("1908-06-26"),
+)
+
+
+# 1909
+# 300th anniversary of Hudson discovering the Hudson river and
+# 100th anniversary of Fulton inventing the paddle steamer
+HudsonFultonCelebration1909 = adhoc_dates(["1909-09-25"], tz="UTC")
+
+
+# 1910
+KingEdwardDeath11amyClose1910 = Holiday(
+    "King Edward VII Death May 7, 1910",
+    month=5,
+    day=7,
+    start_date=Timestamp("1910-05-07"),
+    end_date=Timestamp("1910-05-07"),
+)
+
+
+KingEdwardFuneral12pmOpen1910 = Holiday(
+    "King Edward VII Funeral 12pm late open May 20, 1910",
+    month=5,
+    day=20,
+    start_date=Timestamp("1910-05-20"),
+    end_date=Timestamp("1910-05-20"),
+)
+
+
+# 1912
+JamesShermanFuneral1912 = adhoc_dates(["1912-11-02"], tz="UTC")
+
+
+# 1913
+JPMorganFuneral12pmOpen1913 = Holiday(
+    "JP Morgan Funeral 12pm late open April 14, 1913",
+    month=4,
+    day=14,
+    start_date=Timestamp("1913-04-14"),
+    end_date=Timestamp("1913-04-14"),
+)
+
+
+WilliamGaynorFuneral12pmOpen1913 = Holiday(
+    "Mayor William J. Gaynor Funeral 12pm late open Sept 22, 1913",
+    month=9,
+    day=22,
+    start_date=Timestamp("1913-09-22"),
+    end_date=Timestamp("1913-09-22"),
+)
+
+
+# 1914
+# Reopened for trading bonds (with restrictions) Nov 27, 1914
+# Reopened for trading stocks (with restrictions) Dec 12, 1914
+# Restrictions remained in place until April 1, 1915
+OnsetOfWWI1914 = adhoc_range("1914-07-31", "1914-12-11", weekmask="Mon Tue Wed Thu Fri Sat", tz="UTC")
+
+
+# 1917
+DraftRegistrationDay1917 = adhoc_dates(["1917-06-05"], tz="UTC")
+
+
+WeatherHeatClosing1917 = adhoc_dates(["1917-08-04"], tz="UTC")
+
+
+ParadeOfNationalGuardEarlyClose1917 = Holiday(
+    "Parade of National Guard 12pm Early Close Aug 29, 1917",
+    month=8,
+    day=29,
+    start_date=Timestamp("1917-08-29"),
+    end_date=Timestamp("1917-08-29"),
+)
+
+
+LibertyDay12pmEarlyClose1917 = Holiday(
+    "Liberty Day 12pm Early Close Oct 24, 1917",
+    month=10,
+    day=24,
+    start_date=Timestamp("1917-10-24"),
+    end_date=Timestamp("1917-10-24"),
+)
+
+
+# 1918
+WeatherNoHeatClosing1918 = adhoc_dates(
+    [
+        "1918-01-28",
+        "1918-02-04",
+        "1918-02-11",
+    ],
+    tz="UTC",
+)
+
+
+LibertyDay12pmEarlyClose1918 = Holiday(
+    "Liberty Day 12pm Early Close April 26, 1918",
+    month=4,
+    day=26,
+    start_date=Timestamp("1918-04-26"),
+    end_date=Timestamp("1918-04-26"),
+)
+
+
+DraftRegistrationDay1918 = adhoc_dates(["1918-09-12"], tz="UTC")
+
+
+FalseArmisticeReport1430EarlyClose1918 = Holiday(
+    "False Armistice Report 2:30pm Early Close Nov 7, 1918",
+    month=11,
+    day=7,
+    start_date=Timestamp("1918-11-07"),
+    end_date=Timestamp("1918-11-07"),
+)
+
+
+ArmisticeSigned1918 = adhoc_dates(["1918-11-11"], tz="UTC")
+
+
+# 1919
+RooseveltFuneral1230EarlyClose1919 = Holiday(
+    "Former President Roosevelt funeral 12:30pm Early Close Jan 7, 1919",
+    month=1,
+    day=7,
+    start_date=Timestamp("1919-01-07"),
+    end_date=Timestamp("1919-01-07"),
+)
+
+
+Homecoming27Division1919 = adhoc_dates(["1919-03-25"], tz="UTC")
+
+
+ParadeOf77thDivision1919 = adhoc_dates(["1919-05-06"], tz="UTC")
+
+
+BacklogRelief1919 = adhoc_dates(
+    [
+        "1919-07-19",
+        "1919-08-02",
+        "1919-08-16",
+    ],
+    tz="UTC",
+)
+
+
+GeneralPershingReturn1919 = adhoc_dates(["1919-09-10"], tz="UTC")
+
+
+TrafficBlockLateOpen1919 = Holiday(
+    "Traffic Block 10:30am late open Dec. 30, 1919",
+    month=12,
+    day=30,
+    start_date=Timestamp("1919-12-30"),
+    end_date=Timestamp("1919-12-30"),
+)
+
+
+# 1920
+TrafficBlockLateOpen1920 = Holiday(
+    "Traffic Block 10:30am late open Feb. 6, 1920",
+    month=2,
+    day=6,
+    start_date=Timestamp("1920-02-06"),
+    end_date=Timestamp("1920-02-06"),
+)
+
+
+OfficeLocationChange1920 = adhoc_dates(["1920-05-01"], tz="UTC")
+
+
+WallStreetExplosionEarlyClose1920 = Holiday(
+    "Wall Street Explosion 12:00 Early Close Sept 16, 1920",
+    month=9,
+    day=16,
+    start_date=Timestamp("1920-09-16"),
+    end_date=Timestamp("1920-09-16"),
+)
+
+
+# 1921
+AnnunciatorBoardFire1pmLateOpen1921 = Holiday(
+    "Annunciator Board Fire 1pm late open Aug 8, 1921",
+    month=8,
+    day=2,
+    start_date=Timestamp("1921-08-02"),
+    end_date=Timestamp("1921-08-02"),
+)
+
+
+# 1923
+HardingDeath1923 = adhoc_dates(["1923-08-03"], tz="UTC")
+
+
+HardingFuneral1923 = adhoc_dates(["1923-08-10"], tz="UTC")
+
+
+# 1924
+WoodrowWilsonFuneral1230EarlyClose1924 = Holiday(
+    "Former President Woodrow Wilson Funeral 12:30 Early Close Feb 6, 1924",
+    month=2,
+    day=6,
+    start_date=Timestamp("1924-02-06"),
+    end_date=Timestamp("1924-02-06"),
+)
+
+
+# 1925
+EclipseOfSunLateOpen1925 = Holiday(
+    "Eclipse of Sun 10:45am late open Jan 25, 1925",
+    month=1,
+    day=24,
+    start_date=Timestamp("1925-01-24"),
+    end_date=Timestamp("1925-01-24"),
+)
+
+
+CromwellFuneral1430EarlyClose1925 = Holiday(
+    "Former NYSE President Seymour L. Cromwell Funeral 2:30pm Early Close Sept 18, 1925",
+    month=9,
+    day=18,
+    start_date=Timestamp("1925-09-18"),
+    end_date=Timestamp("1925-09-18"),
+)
+
+
+# 1927
+LindberghParade1927 = adhoc_dates(["1927-06-13"], tz="UTC")
+
+
+# 1928
+BacklogRelief1928 = adhoc_dates(
+    [
+        "1928-04-07",
+        "1928-04-21",
+        "1928-05-05",
+        "1928-05-12",
+        "1928-05-19",
+        "1928-05-26",
+        "1928-11-24",
+    ],
+    tz="UTC",
+)
+
+
+BacklogRelief2pmEarlyClose1928 = adhoc_range("1928-05-21", "1928-05-25", weekmask="Mon Tue Wed Thu Fri Sat", tz="UTC")
+
+
+# 1929
+BacklogRelief1929 = adhoc_dates(
+    [
+        "1929-02-09",
+        "1929-11-01",
+        "1929-11-02",
+        "1929-11-09",
+        "1929-11-16",
+        "1929-11-23",
+        "1929-11-29",
+        "1929-11-30",
+    ],
+    tz="UTC",
+)
+
+
+BacklogRelief1pmEarlyClose1929 = adhoc_dates(
+    [
+        "1929-11-06",
+        "1929-11-07",
+        "1929-11-08",
+        "1929-11-11",
+        "1929-11-12",
+        "1929-11-13",
+        "1929-11-14",
+        "1929-11-15",
+        "1929-11-18",
+        "1929-11-19",
+        "1929-11-20",
+        "1929-11-21",
+        "1929-11-22",
+    ],
+    tz="UTC",
+)
+
+
+BacklogRelief12pmLateOpen1929 = adhoc_dates(
+    [
+        "1929-10-31",
+    ],
+    tz="UTC",
+)
+
+
+# 1930
+TaftFuneral1230EarlyClose1930 = Holiday(
+    "Former President William Howard Taft Funeral 12:30pm Early Close Mar 11, 1930",
+    month=3,
+    day=11,
+    start_date=Timestamp("1930-03-11"),
+    end_date=Timestamp("1930-03-11"),
+)
+
+
+# 1933
+CoolidgeFuneral1933 = adhoc_dates(
+    [
+        "1933-01-07",
+    ],
+    tz="UTC",
+)
+
+
+BankHolidays1933 = adhoc_dates(
+    [
+        "1933-03-04",
+        "1933-03-06",
+        "1933-03-07",
+        "1933-03-08",
+        "1933-03-09",
+        "1933-03-10",
+        "1933-03-11",
+        "1933-03-12",
+        "1933-03-13",
+        "1933-03-14",
+    ],
+    tz="UTC",
+)
+
+
+GasFumesOnTradingFloor1230EarlyClose1933 = Holiday(
+    "Gas Fumes on Trading Floor 12:30pm Early Close Aug 4, 1933",
+    month=8,
+    day=4,
+    start_date=Timestamp("1933-08-04"),
+    end_date=Timestamp("1933-08-04"),
+)
+
+
+HeavyVolume1933 = adhoc_dates(
+    [
+        "1933-07-29",
+        "1933-08-05",
+        "1933-08-12",
+        "1933-08-19",
+        "1933-08-26",
+        "1933-09-02",
+    ],
+    tz="UTC",
+)
+
+
+HeavyVolume12pmLateOpen1933 = adhoc_dates(
+    [
+        "1933-07-24",
+        "1933-07-25",
+    ],
+    tz="UTC",
+)
+
+
+HeavyVolume11amLateOpen1933 = adhoc_dates(
+    [
+        "1933-07-26",
+        "1933-07-27",
+        "1933-07-28",
+    ],
+    tz="UTC",
+)
+
+
+HeavyVolume2pmEarlyClose1933 = adhoc_dates(
+    [
+        "1933-07-26",
+        "1933-07-27",
+        "1933-07-28",
+    ],
+    tz="UTC",
+)
+
+
+NRAdemonstration12pmEarlyClose1933 = Holiday(
+    "NRA Demonstration 12:00 noon Early Close Sept 13, 1933",
+    month=9,
+    day=13,
+    start_date=Timestamp("1933-09-13"),
+    end_date=Timestamp("1933-09-13"),
+)
+
+
+# 1934
+Snow11amLateOpen1934 = Holiday(
+    "Severe Snowstorm 11:00am late open Feb 20, 1934",
+    month=2,
+    day=20,
+    start_date=Timestamp("1934-02-20"),
+    end_date=Timestamp("1934-02-20"),
+)
+
+
+# 1936
+KingGeorgeVFuneral11amLateOpen1936 = Holiday(
+    "King George V of England 11:00am late open Jan 28, 1936",
+    month=1,
+    day=28,
+    start_date=Timestamp("1936-01-28"),
+    end_date=Timestamp("1936-01-28"),
+)
+
+
+# 1944
+SatClosings1944 = adhoc_dates(
+    [
+        "1944-08-19",
+        "1944-08-26",
+        "1944-09-02",
+    ],
+    tz="UTC",
+)
+
+
+# 1945
+RooseveltDayOfMourning1945 = adhoc_dates(
+    [
+        "1945-04-14",
+    ],
+    tz="UTC",
+)
+
+
+# Starting in 1945, no Saturday trading over the summer
+SatClosings1945 = date_range("1945-07-07", "1945-09-01", freq="W-SAT", tz="UTC")
+
+
+VJday1945 = adhoc_dates(
+    [
+        "1945-08-15",
+        "1945-08-16",
+    ],
+    tz="UTC",
+)
+
+
+NavyDay1945 = adhoc_dates(
+    [
+        "1945-10-27",
+    ],
+    tz="UTC",
+)
+
+
+RailroadStrike1946 = adhoc_dates(
+    [
+        "1946-05-25",
+    ],
+    tz="UTC",
+)
+
+
+# 1946
+SatClosings1946 = date_range("1946-06-01", "1946-09-28", freq="W-SAT", tz="UTC")
+
+
+# 1947
+SatClosings1947 = date_range("1947-05-31", "1947-09-27", freq="W-SAT", tz="UTC")
+
+
+# 1948
+SevereWeather1948 = adhoc_dates(
+    [
+        "1948-01-03",
+    ],
+    tz="UTC",
+)
+
+
+SatClosings1948 = date_range("1948-05-29", "1948-09-25", freq="W-SAT", tz="UTC")
+
+
+# 1949
+SatClosings1949 = date_range("1949-05-28", "1949-09-24", freq="W-SAT", tz="UTC")
+
+
+# 1950
+SatClosings1950 = date_range("1950-06-03", "1950-09-30", freq="W-SAT", tz="UTC")
+
+
+# 1951
+SatClosings1951 = date_range("1951-06-02", "1951-09-29", freq="W-SAT", tz="UTC")
+
+
+# 1952
+SatClosings1952 = date_range("1952-05-31", "1952-09-27", freq="W-SAT", tz="UTC")
@@ -0,0 +1,147 @@
+"""
+Bounded least-recently-used cache for the results that calendars keep in memory.
+
+Unlike functools.lru_cache, the budget can be given in bytes, the limits can be changed at runtime
+and the number of evictions is tracked, which makes it possible to keep long-running processes that
+query sliding windows at a flat memory usage.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+def _nbytes(value) -> int:
+    """
+    :return: approximate number of bytes held by value
+    """
+    if hasattr(value, "memory_usage"):  # pandas objects
+        usage = value.memory_usage(index=True, deep=False)
+        return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+    if hasattr(value, "nbytes"):  # numpy arrays and pandas indexes
+        return int(value.nbytes)
+    if isinstance(value, tuple):
+        return sys.getsizeof(value) + sum(_nbytes(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class LRUCache:
+    """
+    Thread-safe mapping that evicts the least recently used entries once it holds more than
+    max_entries entries or more than max_bytes bytes. A limit of None means unbounded.
+    """
+
+    def __init__(self, max_entries: Optional[int] = 128, max_bytes: Optional[int] = None):
+        """
+        :param max_entries: maximum number of entries to keep, None for no limit
+        :param max_bytes: maximum total size of the cached values in bytes, None for no limit
+        """
+        self._data: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __getstate__(self):
+        # locks can't be pickled or copied, and the entries are cheap to recompute
+        return {"_max_entries": self._max_entries, "_max_bytes": self._max_bytes}
+
+    def __setstate__(self, state):
+        self.__init__(state["_max_entries"], state["_max_bytes"])
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(entries={len(self)}/{self._max_entries}, bytes={self.nbytes}/{self._max_bytes}, "
+            f"hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+        )
+
+    @property
+    def max_entries(self) -> Optional[int]:
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, value: Optional[int]):
+        with self._lock:
+            self._max_entries = value
+            self._evict()
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: Optional[int]):
+        with self._lock:
+            self._max_bytes = value
+            self._evict()
+
+    def get(self, key, default=None):
+        """
+        :return: the value stored under key, marking it as most recently used, or default
+        """
+        with self._lock:
+            try:
+                value, _ = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value) -> None:
+        """
+        Store value under key and evict the least recently used entries that exceed the limits.
+        A value that is larger than max_bytes by itself is not stored.
+        """
+        size = _nbytes(value)
+        with self._lock:
+            if key in self._data:
+                self.nbytes -= self._data.pop(key)[1]
+            if self._max_bytes is not None and size > self._max_bytes:
+                self.evictions += 1
+                return
+            self._data[key] = (value, size)
+            self.nbytes += size
+            self._evict()
+
+    def _evict(self) -> None:
+        while self._data and (
+            (self._max_entries is not None and len(self._data) > self._max_entries)
+            or (self._max_bytes is not None and self.nbytes > self._max_bytes)
+        ):
+            _, (_, size) = self._data.popitem(last=False)
+            self.nbytes -= size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Remove all entries. The hit, miss and eviction counts are kept.
+        """
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+
+    def info(self) -> dict:
+        """
+        :return: dict with the current size, the limits and the hit, miss and eviction counts
+        """
+        return {
+            "entries": len(self._data),
+            "nbytes": self.nbytes,
+            "max_entries": self._max_entries,
+            "max_bytes": self._max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -19,11 +19,16 @@ from abc import ABCMeta, abstractmethod
 from datetime import time
 from typing import List, Literal, Union
 
+import numpy as np
 import pandas as pd
+from pandas.tseries.holiday import AbstractHolidayCalendar
 from pandas.tseries.offsets import CustomBusinessDay
 
 from . import calendar_utils as u
 from .class_registry import ProtectedDict, RegisteryMeta
+from .holidays.compiler import calendar_holidays
+from .lru import LRUCache
+from .schedule_cache import get_schedule_cache
 from .sources import Source, get_sources
 
 
@@ -39,13 +44,72 @@ WEEKMASK_ABBR = {
     SUNDAY: "Sun",
 }
 
+# Overwrite the default holiday calendar start_date of 1/1/70, for all calendars. This is done here rather than
+# in the modules of the calendars that need it, so that it doesn't depend on which calendars have been imported.
+AbstractHolidayCalendar.start_date = "1885-01-01"
+
 
 class DEFAULT:
     pass
 
 
+class _ClassCachedProperty:
+    """
+    Read-only property that is evaluated once per calendar class and then shared by all of its instances.
+    A value in the __dict__ of an instance takes precedence. When derived is True, the value derives from
+    the open days, it is evaluated and kept per instance for the instances that customize them.
+    """
+
+    def __init__(self, prop: property, name: str, derived: bool = False):
+        self.fget = prop.fget
+        self.__doc__ = prop.__doc__
+        self.name = name
+        self.derived = derived
+        self._values = {}
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        values = instance.__dict__
+        if self.name in values:
+            return values[self.name]
+        if self.derived and instance._customizes_open_days():
+            value = values[self.name] = self.fget(instance)
+            return value
+        cls = type(instance)
+        try:
+            return self._values[cls]
+        except KeyError:
+            value = self._values[cls] = self.fget(instance)
+            return value
+
+    def __set__(self, instance, value):
+        raise AttributeError("can't set attribute")
+
+
 class MarketCalendarMeta(ABCMeta, RegisteryMeta):
-    pass
+    # The holiday and special time rules, and the open days derived from them, only depend on the class.
+    # Evaluating them once per class also lets the AbstractHolidayCalendars keep their cache of computed dates.
+    _class_cached_properties = (
+        "regular_holidays",
+        "adhoc_holidays",
+        "special_opens",
+        "special_opens_adhoc",
+        "special_closes",
+        "special_closes_adhoc",
+    )
+    # The open days, unless an instance customizes them, see MarketCalendar._open_day_attributes
+    _derived_class_cached_properties = (
+        "_trading_day_blocks",
+        "_trading_day_block_counts",
+    )
+
+    def __init__(cls, name, bases, attr):
+        for prop in cls._class_cached_properties + cls._derived_class_cached_properties:
+            if isinstance(attr.get(prop), property):
+                derived = prop in cls._derived_class_cached_properties
+                setattr(cls, prop, _ClassCachedProperty(attr[prop], prop, derived))
+        super().__init__(name, bases, attr)
 
 
 class MarketCalendar(metaclass=MarketCalendarMeta):
@@ -71,6 +135,23 @@ class MarketCalendar(metaclass=MarketCalendarMeta):
 
     discontinued_market_times: ProtectedDict
 
+    # Span of the open-day bitmap that backs .valid_days and .is_trading_day. It is evaluated in blocks of
+    # _bitmap_block_days days (about 22 years), when a range first reaches them.
+    # Dates outside of it are still supported, they are evaluated on the fly.
+    _bitmap_start = np.datetime64("1885-01-01", "D")
+    _bitmap_end = np.datetime64("2200-12-31", "D")
+    _bitmap_block_days = 8192
+
+    # Attributes that define the open days. An instance that has one of them in its __dict__ evaluates
+    # its own open days instead of sharing those of its class.
+    _open_day_attributes = ("holidays", "regular_holidays", "adhoc_holidays", "_business_day_calendars")
+
+    # Default limits of the cache used by .special_dates, see .special_dates_cache
+    special_dates_cache_entries = 256
+    special_dates_cache_bytes = 64 * 2**20
+    # Number of years of special times that .special_dates evaluates at once
+    _special_dates_block_years = 25
+
     @staticmethod
     def _tdelta(t: Union[time, tuple], day_offset: int = 0) -> pd.Timedelta:
         if isinstance(t, time):
@@ -91,7 +172,7 @@ class MarketCalendar(metaclass=MarketCalendarMeta):
         """All Market Calendar names and aliases that can be used in "factory"
         :return: list(str)
         """
-        return [cal for cal in cls._regmeta_class_registry if cal not in ["MarketCalendar", "TradingCalendar"]]
+        return [cal for cal in cls._regmeta_class_registry.names() if cal not in ["MarketCalendar", "TradingCalendar"]]
 
     @classmethod
     def factory(cls, name, *args, **kwargs):  # Will be set by Meta, keeping it there for tests
@@ -205,6 +286,7 @@ class MarketCalendar(metaclass=MarketCalendarMeta):
         self._regular_market_timedeltas = regular_tds
         self._market_times = sorted(regular.keys(), key=lambda x: regular_tds[x][-1][1])
         self._oc_market_times = list(filter(oc_map.__contains__, self._market_times))
+        self._session_arrays = None  # the regular times may have changed
 
     def _set_time(self, market_time, times, opens):
         if isinstance(times, (tuple, list)):  # passed a tuple
@@ -557,6 +639,12 @@ class MarketCalendar(metaclass=MarketCalendarMeta):
 
         return intr.apply(self._convert).sort_index()
 
+    def _customizes_open_days(self) -> bool:
+        """
+        :return: True if the instance overrides one of the ._open_day_attributes
+        """
+        return any(name in self.__dict__ for name in self._open_day_attributes)
+
     def holidays(self) -> pd.tseries.offsets.CustomBusinessDay:
         """
         Returns the complete CustomBusinessDay object of holidays that can be used in any Pandas function that take
@@ -567,13 +655,115 @@ class MarketCalendar(metaclass=MarketCalendarMeta):
         try:
             return self._holidays
         except AttributeError:
-            self._holidays = CustomBusinessDay(
-                holidays=self.adhoc_holidays,
-                calendar=self.regular_holidays,
-                weekmask=self.weekmask,
-            )
+            self._holidays = self._custom_business_day(self.weekmask)
         return self._holidays
 
+    def _custom_business_day(self, weekmask: str, holidays=DEFAULT, calendar=DEFAULT) -> CustomBusinessDay:
+        """
+        :param weekmask: weekmask of the open days of the week
+        :param holidays: ad-hoc holidays, DEFAULT for the adhoc_holidays
+        :param calendar: AbstractHolidayCalendar of the regular holidays, DEFAULT for the regular_holidays
+        :return: CustomBusinessDay object of the holidays and calendar
+        """
+        if holidays is DEFAULT:
+            holidays = self.adhoc_holidays
+        if calendar is DEFAULT:
+            calendar = self.regular_holidays
+        if isinstance(calendar, AbstractHolidayCalendar):
+            # The same dates that CustomBusinessDay gets from calendar.holidays(), with the rules compiled.
+            # They are passed as a np.busdaycalendar, which saves CustomBusinessDay converting them one by one.
+            if isinstance(holidays, pd.DatetimeIndex):
+                adhoc = holidays.tz_localize(None)
+            else:
+                adhoc = pd.DatetimeIndex([pd.Timestamp(day).tz_localize(None) for day in holidays])
+            days = np.concatenate([adhoc.values, calendar_holidays(calendar).values]).astype("datetime64[D]")
+            days.sort()
+            holidays, calendar = tuple(days), np.busdaycalendar(weekmask=weekmask, holidays=days)
+        return CustomBusinessDay(holidays=holidays, calendar=calendar, weekmask=weekmask)
+
+    def _business_day_calendars(self):
+        """
+        The CustomBusinessDay objects that define the open days of the market, in the same layout
+        as regular_market_times: a tuple of (cut_off, getter) pairs, each one applying from its cut_off
+        date (inclusive) until the next one. The getter returns the CustomBusinessDay, it is only called
+        for the eras that a range reaches. Override this if the weekmask changed over time.
+
+        :return: tuple of (cut_off, getter of the CustomBusinessDay) tuples
+        """
+        return ((None, self.holidays),)
+
+    def _open_day_mask(self, first, last) -> np.ndarray:
+        """
+        Evaluate the open days of the datetime64[D] range [first, last] from the business day calendars.
+
+        :return: np.ndarray of bool, one element per calendar day
+        """
+        days = np.arange(first, last + np.timedelta64(1, "D"), dtype="datetime64[D]")
+        mask = np.zeros(len(days), dtype=bool)
+
+        eras = self._business_day_calendars()
+        cut_offs = self._business_day_cut_offs(eras)
+        for i, (_, cbd) in enumerate(eras):
+            lo = 0 if cut_offs[i] is None else days.searchsorted(cut_offs[i])
+            hi = len(days) if i + 1 == len(eras) else days.searchsorted(cut_offs[i + 1])
+            if lo < hi:
+                mask[lo:hi] = np.is_busday(days[lo:hi], busdaycal=cbd().calendar)
+        return mask
+
+    @staticmethod
+    def _business_day_cut_offs(eras) -> list:
+        return [None if c is None else np.datetime64(pd.Timestamp(c).date(), "D") for c, _ in eras]
+
+    @property
+    def _trading_day_blocks(self) -> dict:
+        """
+        :return: the blocks of the open-day bitmap evaluated so far, by their number from ._bitmap_start
+        """
+        return {}
+
+    def _trading_day_block(self, k: int) -> np.ndarray:
+        """
+        :param k: number of the block, the k-th ._bitmap_block_days days from ._bitmap_start
+        :return: np.ndarray of bool, the open days of the block
+        """
+        blocks = self._trading_day_blocks
+        try:
+            return blocks[k]
+        except KeyError:
+            first = self._bitmap_start + np.timedelta64(k * self._bitmap_block_days, "D")
+            last = min(first + np.timedelta64(self._bitmap_block_days - 1, "D"), self._bitmap_end)
+            mask = blocks[k] = self._open_day_mask(first, last)
+            return mask
+
+    def _bitmap_mask(self, i: int, j: int) -> np.ndarray:
+        """
+        :return: np.ndarray of bool, the open days from the i-th to the j-th day of the bitmap (inclusive)
+        """
+        size = self._bitmap_block_days
+        lo, hi = i // size, j // size
+        if lo == hi:
+            mask = self._trading_day_block(lo)
+        else:
+            mask = np.concatenate([self._trading_day_block(k) for k in range(lo, hi + 1)])
+        return mask[i - lo * size : j - lo * size + 1]
+
+    @property
+    def _trading_day_bitmap(self) -> np.ndarray:
+        """
+        :return: np.ndarray of bool, the open days of the whole bitmap span
+        """
+        return self._bitmap_mask(0, int((self._bitmap_end - self._bitmap_start).astype(np.int64)))
+
+    def _open_day_slice(self, first, last) -> np.ndarray:
+        """
+        Boolean array of open days for the datetime64[D] range [first, last], sliced from the blocks of the
+        bitmap when the range is covered by it. Only the blocks that the range spans are evaluated.
+        """
+        if self._bitmap_start <= first and last <= self._bitmap_end:
+            i = int((first - self._bitmap_start).astype(np.int64))
+            return self._bitmap_mask(i, i + int((last - first).astype(np.int64)))
+        return self._open_day_mask(first, last)
+
     def valid_days(self, start_date, end_date, tz="UTC") -> pd.DatetimeIndex:
         """
         Get a DatetimeIndex of valid open business days.
@@ -583,7 +773,184 @@ class MarketCalendar(metaclass=MarketCalendarMeta):
         :param tz: time zone in either string or pytz.timezone
         :return: DatetimeIndex of valid business days
         """
-        return pd.date_range(start_date, end_date, freq=self.holidays(), normalize=True, tz=tz)
+        first, last = self._day_bounds(start_date, end_date, tz)
+        days = self._open_days(first, last, tz)
+        freq = self._business_day_freq(first, last)
+        # pandas checks the freq against the days, which costs as much as generating them with the CustomBusinessDay
+        return days if freq is None else pd.DatetimeIndex(days, freq=freq)
+
+    def _valid_days(self, start_date, end_date, tz="UTC") -> pd.DatetimeIndex:
+        """
+        valid_days without its freq, for the methods that only need the days.
+        """
+        if type(self).valid_days is not MarketCalendar.valid_days:  # the calendar adjusts its open days
+            return self.valid_days(start_date, end_date, tz=tz)
+        return self._open_days(*self._day_bounds(start_date, end_date, tz), tz)
+
+    def _day_bounds(self, start_date, end_date, tz):
+        """
+        :return: the datetime64[D] days of start_date and end_date, tz-aware dates are taken in tz (UTC if None)
+        """
+        tz = "UTC" if tz is None else tz
+        return u._to_days(start_date, tz)[0], u._to_days(end_date, tz)[0]
+
+    def _open_days(self, first, last, tz) -> pd.DatetimeIndex:
+        if last < first:
+            days = np.array([], dtype="datetime64[D]")
+        else:
+            days = first + u._n_days(np.flatnonzero(self._open_day_slice(first, last)))
+        return u._days_index(days, u.DATE_RANGE_DTYPE).tz_localize(tz)
+
+    def _business_day_freq(self, first, last):
+        """
+        The freq of valid_days for the datetime64[D] range [first, last], as pd.date_range sets it.
+
+        :return: CustomBusinessDay of the era that covers the whole range, None when it spans more than one era
+        """
+        eras = self._business_day_calendars()
+        cut_offs = self._business_day_cut_offs(eras)
+        i = sum(c is None or c <= first for c in cut_offs) - 1
+        if i + 1 < len(eras) and cut_offs[i + 1] <= last:
+            return None
+        return eras[max(i, 0)][1]()
+
+    def is_trading_day(self, dates):
+        """
+        Vectorized check of whether dates are valid open business days. Time and time zone information is ignored.
+
+        :param dates: a single date or an array-like of dates
+        :return: bool for a single date, otherwise np.ndarray of bool
+        """
+        if np.ndim(dates) == 0:
+            return bool(self.is_trading_day([dates])[0])
+
+        days = u._to_days(dates)
+        result = np.zeros(len(days), dtype=bool)
+        known = ~np.isnat(days)
+        if known.any():
+            days = days[known]
+            first = days.min()
+            mask = self._open_day_slice(first, days.max())
+            result[known] = mask[(days - first).astype(np.int64)]
+        return result
+
+    @property
+    def _trading_day_block_counts(self) -> dict:
+        """
+        :return: the ordinals of the blocks of the open-day bitmap evaluated so far, see ._trading_day_block_ordinals
+        """
+        return {}
+
+    def _trading_day_block_ordinals(self, k: int):
+        """
+        :param k: number of the block, the k-th ._bitmap_block_days days from ._bitmap_start
+        :return: (counts, days) of the block. counts[i] is the number of open days of the block up to its i-th day
+            (inclusive), days the datetime64[D] array of its open days.
+        """
+        blocks = self._trading_day_block_counts
+        try:
+            return blocks[k]
+        except KeyError:
+            mask = self._trading_day_block(k)
+            first = self._bitmap_start + np.timedelta64(k * self._bitmap_block_days, "D")
+            ordinals = blocks[k] = (np.cumsum(mask, dtype=np.int64), first + u._n_days(np.flatnonzero(mask)))
+            return ordinals
+
+    @staticmethod
+    def _ordinals(origin, mask):
+        prefix = np.zeros(len(mask) + 1, dtype=np.int64)
+        np.cumsum(mask, out=prefix[1:])
+        return prefix, origin + u._n_days(np.flatnonzero(mask))
+
+    def _trading_day_index(self, first, last):
+        """
+        Map the datetime64[D] range [first, last] to trading day ordinals. When the range is covered by the bitmap,
+        the ordinals are made of those of the blocks that it spans, counting from the first of them.
+
+        :return: (origin, prefix, days). prefix[i] is the number of open days before the i-th day from origin,
+            days the datetime64[D] array of the open days from origin on.
+        """
+        if self._bitmap_start <= first and last <= self._bitmap_end:
+            size = self._bitmap_block_days
+            lo = int((first - self._bitmap_start).astype(np.int64)) // size
+            hi = int((last - self._bitmap_start).astype(np.int64)) // size
+            prefix, days, count = [np.zeros(1, dtype=np.int64)], [], 0
+            for k in range(lo, hi + 1):
+                counts, open_days = self._trading_day_block_ordinals(k)
+                prefix.append(counts + count)
+                days.append(open_days)
+                count += len(open_days)
+            origin = self._bitmap_start + np.timedelta64(lo * size, "D")
+            return origin, np.concatenate(prefix), np.concatenate(days)
+        first, last = min(first, self._bitmap_start), max(last, self._bitmap_end)
+        return (first, *self._ordinals(first, self._open_day_mask(first, last)))
+
+    def trading_day_offset(self, dates, n, roll="raise"):
+        """
+        Vectorized offset of dates by n trading days, the equivalent of adding n * .holidays() to each date.
+        Time and time zone information is ignored.
+
+        :param dates: a single date or an array-like of dates
+        :param n: number of trading days to move, an int or an array-like of ints with the same length as dates
+        :param roll: what to do with dates that are not trading days, as in np.busday_offset
+            "raise": raise a ValueError
+            "forward": start from the next trading day
+            "backward": start from the previous trading day
+        :return: Timestamp for a single date, otherwise DatetimeIndex of dates. NaT stays NaT.
+        """
+        if roll not in ("raise", "forward", "backward"):
+            raise ValueError(f"roll must be 'raise', 'forward' or 'backward', not {roll!r}")
+
+        scalar, days = np.ndim(dates) == 0, u._to_days(dates)
+        n = np.broadcast_to(np.asarray(n, dtype=np.int64), days.shape)
+        result = np.full(len(days), np.datetime64("NaT"), dtype="datetime64[D]")
+        known = ~np.isnat(days)
+        if known.any():
+            days, n = days[known], n[known]
+            # dates as far as n calendar days away can't be more than n trading days away
+            spread = np.timedelta64(int(np.abs(n).max()) * 7 + 366, "D")
+            origin, prefix, trading_days = self._trading_day_index(
+                days.min() - spread if n.min() < 0 else days.min(), days.max() + spread if n.max() > 0 else days.max()
+            )
+            i = (days - origin).astype(np.int64)
+            ordinals = prefix[i]
+            is_open = prefix[i + 1] > ordinals
+            if not is_open.all():
+                if roll == "raise":
+                    raise ValueError(f"Not trading days: {days[~is_open][:5]}")
+                if roll == "backward":
+                    ordinals = ordinals - ~is_open
+
+            ordinals = ordinals + n
+            if ordinals.min() < 0 or ordinals.max() >= len(trading_days):
+                raise ValueError("The offset dates are outside of the dates that can be evaluated")
+            result[known] = trading_days[ordinals]
+
+        result = u._days_index(result, u.DATE_RANGE_DTYPE)
+        return result[0] if scalar else result
+
+    def trading_days_between(self, starts, ends):
+        """
+        Vectorized count of the trading days from starts (inclusive) to ends (exclusive), like np.busday_count.
+        When ends is before starts, the count is minus the count from ends to starts.
+        Time and time zone information is ignored.
+
+        :param starts: a single date or an array-like of dates
+        :param ends: a single date or an array-like of dates
+        :return: int for single dates, otherwise np.ndarray of int64
+        """
+        scalar, scalar_end = np.ndim(starts) == 0, np.ndim(ends) == 0
+        starts, ends = u._to_days(starts), u._to_days(ends)
+        starts, ends = np.broadcast_arrays(starts, ends)
+        if np.isnat(starts).any() or np.isnat(ends).any():
+            raise ValueError("starts and ends can't contain NaT")
+        if not len(starts):
+            return np.zeros(0, dtype=np.int64)
+
+        first, last = min(starts.min(), ends.min()), max(starts.max(), ends.max())
+        origin, prefix, _ = self._trading_day_index(first, last)
+        counts = prefix[(ends - origin).astype(np.int64)] - prefix[(starts - origin).astype(np.int64)]
+        return int(counts[0]) if scalar and scalar_end else counts
 
     def _get_market_times(self, start, end):
         mts = self._market_times
@@ -634,10 +1001,13 @@ class MarketCalendar(metaclass=MarketCalendarMeta):
             if observed_dates:
                 # Non-empty list of single observance dates - filter by date range
                 return pd.DatetimeIndex([date for date in observed_dates if s <= date <= e])
-            else:
-                # Either None (mixed rules) or empty list (no rules, e.g. custom holidays method)
-                # Fall back to the calendar's holidays() method
-                return cal.holidays(s, e)
+            # Otherwise (mixed rules) evaluate the rules with numpy, which is possible when all of them can be compiled
+            holidays = calendar_holidays(cal, s, e, fallback=False)
+            if holidays is None:
+                # Fall back to the calendar's holidays() method. Request at least the default span of the
+                # calendar, which it caches, so that later calls with other dates don't evaluate the rules again.
+                holidays = cal.holidays(min(s, pd.Timestamp(cal.start_date)), max(e, pd.Timestamp(cal.end_date)))
+            return holidays[(holidays >= s) & (holidays <= e)]
         except ValueError:
             return pd.DatetimeIndex([])
 
@@ -661,7 +1031,9 @@ class MarketCalendar(metaclass=MarketCalendarMeta):
 
         if indexes:
             # Optimized: drop_duplicates first (reduces data), then sort
-            dates = pd.concat(indexes, ignore_index=False).drop_duplicates().sort_index()
+            # empty parts can have another resolution, pandas deprecated letting them decide the dtype
+            indexes = [index for index in indexes if len(index)] or indexes[:1]
+            dates = pd.concat(indexes, ignore_index=False).drop_duplicates().sort_index(kind="stable")
             return dates.loc[start : end.replace(hour=23, minute=59, second=59)]
 
         return pd.Series([], dtype="datetime64[ns, UTC]", index=pd.DatetimeIndex([]))
@@ -679,25 +1051,88 @@ class MarketCalendar(metaclass=MarketCalendarMeta):
         """
         start_date, end_date = self.clean_dates(start_date, end_date)
 
-        # Check instance-level cache for special dates
-        if not hasattr(self, "_special_dates_cache"):
-            self._special_dates_cache = {}
-
         cache_key = (market_time, start_date, end_date, filter_holidays)
-        if cache_key in self._special_dates_cache:
-            return self._special_dates_cache[cache_key]
-
-        calendars = self.get_special_times(market_time)
-        ad_hoc = self.get_special_times_adhoc(market_time)
-        special = self._special_dates(calendars, ad_hoc, start_date, end_date)
+        special = self.special_dates_cache.get(cache_key)
+        if special is not None:
+            return special
+
+        # the special times are concatenated from the blocks of years the range spans, later ranges reuse them
+        years = self._special_dates_block_years
+        blocks = [
+            self._special_dates_block(market_time, year)
+            for year in range(start_date.year // years * years, max(start_date, end_date).year + 1, years)
+        ]
+        special = pd.concat([block for block in blocks if len(block)] or blocks[:1])
+        special = special.loc[start_date : end_date.replace(hour=23, minute=59, second=59)]
 
         if filter_holidays:
-            valid = self.valid_days(start_date, end_date, tz=None)
+            valid = self._valid_days(start_date, end_date, tz=None)
             special = special[special.index.isin(valid)]  # some sources of special times don't exclude holidays
 
-        self._special_dates_cache[cache_key] = special
+        self.special_dates_cache.set(cache_key, special)
         return special
 
+    def _special_dates_block(self, market_time, year):
+        """
+        Special times of the market_time in the block of ._special_dates_block_years years starting with year. Only
+        the rules and ad-hoc dates of those years are evaluated, the block is kept in .special_dates_cache.
+
+        :param market_time: market_time reference
+        :param year: first year of the block
+        :return: pd.Series of the special times, indexed by date
+        """
+        cache_key = (market_time, year)
+        special = self.special_dates_cache.get(cache_key)
+        if special is not None:
+            return special
+
+        start = pd.Timestamp(year, 1, 1)
+        end = pd.Timestamp(year + self._special_dates_block_years - 1, 12, 31)
+        calendars, dates_ad_hoc = self._special_times_from(market_time, start)
+        ad_hoc = []
+        for time_, dates in dates_ad_hoc:
+            dates = pd.DatetimeIndex(dates)
+            days = dates.tz_localize(None)
+            ad_hoc.append((time_, dates[(days >= start) & (days <= end)]))
+
+        special = self._special_dates(calendars, ad_hoc, start, end)
+        self.special_dates_cache.set(cache_key, special)
+        return special
+
+    def _special_times_from(self, market_time, start):
+        """
+        The special times of the market_time that can fall on start or later. Override this if some of them are
+        kept apart so that they are not evaluated for later dates.
+
+        :param market_time: market_time reference
+        :param start: pd.Timestamp of the first date
+        :return: (special times, ad-hoc special times), see get_special_times and get_special_times_adhoc
+        """
+        return self.get_special_times(market_time), self.get_special_times_adhoc(market_time)
+
+    @property
+    def special_dates_cache(self) -> LRUCache:
+        """
+        Bounded LRU cache of the results of .special_dates. Its limits can be changed with the max_entries
+        and max_bytes attributes, the defaults are the class attributes special_dates_cache_entries and
+        special_dates_cache_bytes.
+
+        :return: LRUCache
+        """
+        try:
+            return self._special_dates_cache
+        except AttributeError:
+            self._special_dates_cache = LRUCache(self.special_dates_cache_entries, self.special_dates_cache_bytes)
+            return self._special_dates_cache
+
+    def clear_special_dates_cache(self) -> None:
+        """
+        Remove all results of .special_dates that are kept in memory.
+
+        :return: None
+        """
+        self.special_dates_cache.clear()
+
     def schedule(
         self,
         start_date,
@@ -708,6 +1143,7 @@ class MarketCalendar(metaclass=MarketCalendarMeta):
         force_special_times=True,
         market_times=None,
         interruptions=False,
+        engine: Literal["pandas", "numpy"] = "pandas",
     ) -> pd.DataFrame:
         """
         Generates the schedule DataFrame. The resulting DataFrame will have all the valid business days as the index
@@ -719,6 +1155,8 @@ class MarketCalendar(metaclass=MarketCalendarMeta):
         All time zones are set to UTC by default. Setting the tz parameter will convert the columns to the desired
         timezone, such as 'America/New_York'.
 
+        Schedules can be stored on disk and reused across processes with enable_schedule_cache().
+
         :param start_date: first date of the schedule
         :param end_date: last date of the schedule
         :param tz: timezone that the columns of the returned schedule are in, default: "UTC"
@@ -734,24 +1172,35 @@ class MarketCalendar(metaclass=MarketCalendarMeta):
             These will be added as columns to the right of the DataFrame. Any interruption on a day between
             start_date and end_date will be included, regardless of the market_times requested.
             Also, `force_special_times` does not take these into consideration.
+        :param engine: how the schedule is computed, see .schedule_from_days, default: "pandas". Ignored while
+            the schedule cache is enabled, the stored schedules are computed with the default engine.
         :return: schedule DataFrame
         """
+        if engine not in ("pandas", "numpy"):
+            raise ValueError(f"engine must be 'pandas' or 'numpy', not {engine!r}")
+
         start_date, end_date = self.clean_dates(start_date, end_date)
         if not (start_date <= end_date):
             raise ValueError("start_date must be before or equal to end_date.")
 
-        _all_days = self.valid_days(start_date, end_date)
-
         # Setup all valid trading days and the requested market_times
         if market_times is None:
             market_times = self._get_market_times(start, end)
         elif market_times == "all":
             market_times = self._market_times
 
+        cache = get_schedule_cache()
+        if cache is not None and not self._customizes_open_days():  # the cache key doesn't cover the open days
+            return cache.schedule(self, start_date, end_date, tz, market_times, force_special_times, interruptions)
+
+        _all_days = self._valid_days(start_date, end_date)
+
         if not _all_days.size:  # If no valid days return an empty DataFrame
             return pd.DataFrame(columns=market_times, index=pd.DatetimeIndex([], freq="C"))
 
-        return self.schedule_from_days(_all_days, tz, start, end, force_special_times, market_times, interruptions)
+        return self.schedule_from_days(
+            _all_days, tz, start, end, force_special_times, market_times, interruptions, engine=engine
+        )
 
     def schedule_from_days(
         self,
@@ -762,6 +1211,7 @@ class MarketCalendar(metaclass=MarketCalendarMeta):
         force_special_times=True,
         market_times=None,
         interruptions=False,
+        engine: Literal["pandas", "numpy"] = "pandas",
     ) -> pd.DataFrame:
         """
         Generates a schedule DataFrame for the days provided. The days are assumed to be valid trading days.
@@ -790,6 +1240,9 @@ class MarketCalendar(metaclass=MarketCalendarMeta):
             These will be added as columns to the right of the DataFrame. Any interruption on a day between
             start_date and end_date will be included, regardless of the market_times requested.
             Also, `force_special_times` does not take these into consideration.
+        :param engine: how the columns are computed, both return the same schedule, default: "pandas"
+            "pandas": one column after the other, using .days_at_time
+            "numpy": all columns at once in a 2D array, which is only wrapped in a DataFrame at the end
         :return: schedule DataFrame
         """
 
@@ -802,63 +1255,173 @@ class MarketCalendar(metaclass=MarketCalendarMeta):
         elif market_times == "all":
             market_times = self._market_times
 
-        _adj_others = force_special_times is True
-        _adj_col = force_special_times is not None
-        _open_adj = _close_adj = []
+        if engine == "numpy":
+            schedule = self._schedule_from_days_numpy(days, market_times, force_special_times)
+        elif engine == "pandas":
+            _adj_others = force_special_times is True
+            _adj_col = force_special_times is not None
+            _open_adj = _close_adj = []
+
+            schedule = pd.DataFrame()
+            for market_time in market_times:
+                temp = self.days_at_time(days, market_time).copy()  # standard times
+                if _adj_col:
+                    # create an array of special times
+                    special = self.special_dates(market_time, days[0], days[-1], filter_holidays=False)
+                    # overwrite standard times
+                    specialix = special.index[
+                        special.index.isin(temp.index)
+                    ]  # some sources of special times don't exclude holidays
+                    temp.loc[specialix] = special
+
+                    if _adj_others:
+                        if market_time == "market_open":
+                            _open_adj = specialix
+                        elif market_time == "market_close":
+                            _close_adj = specialix
+
+                schedule[market_time] = temp
+
+            if _adj_others and (len(_open_adj) > 0 or len(_close_adj) > 0):
+                self._conform_to_special_times(schedule, _open_adj, _close_adj)
+        else:
+            raise ValueError(f"engine must be 'pandas' or 'numpy', not {engine!r}")
+
+        if interruptions:
+            interrs = self.interruptions_df
+            schedule[interrs.columns] = interrs
+            schedule = schedule.dropna(how="all", axis=1)
+
+        if tz != "UTC":
+            # Vectorized timezone conversion - faster than apply(lambda)
+            for col in schedule.columns:
+                schedule[col] = schedule[col].dt.tz_convert(tz)
+
+        return schedule
+
+    def _wall_times(self, days: np.ndarray, market_time: str) -> np.ndarray:
+        """
+        Vectorized equivalent of .days_at_time for regular market times, used by the numpy schedule engine.
+        Calendars that adjust the regular times in .days_at_time need to do the same here.
+
+        :param days: datetime64 array of dates
+        :param market_time: market_time reference
+        :return: datetime64 array of the market_time on each day, in local wall time and the unit of days
+        """
+        unit = np.datetime_data(days.dtype)[0]
+        timedeltas = self._regular_market_timedeltas[market_time]
+
+        times = days + timedeltas[0][1].to_timedelta64().astype(f"m8[{unit}]")
+        for cut_off, timedelta in timedeltas[1:]:
+            cut_off = pd.Timestamp(cut_off).to_datetime64()
+            times = np.where(days < cut_off, times, days + timedelta.to_timedelta64().astype(f"m8[{unit}]"))
+        return times
+
+    def _schedule_from_days_numpy(self, days: pd.DatetimeIndex, market_times, force_special_times) -> pd.DataFrame:
+        """
+        Numpy engine of .schedule_from_days. The regular times of all market_times are computed as one 2D array
+        (days x market_times) in local wall time and converted to UTC at once. Special times are then scattered
+        into it by position, and the other columns conformed to special opens/closes.
+
+        :return: schedule DataFrame in UTC
+        """
+        unit = np.datetime_data(days.dtype)[0]
+        dates = days.to_numpy()
+
+        # Calendars whose .days_at_time adjusts regular times, without a matching ._wall_times, use .days_at_time
+        dat_owner = next(c for c in type(self).__mro__ if "days_at_time" in vars(c))
+        wall_owner = next(c for c in type(self).__mro__ if "_wall_times" in vars(c))
+        use_days_at_time = dat_owner is not wall_owner and issubclass(dat_owner, wall_owner)
+
+        values = np.empty((len(dates), len(market_times)), dtype=np.int64)
+        local = []
+        for i, market_time in enumerate(market_times):
+            if use_days_at_time:
+                values[:, i] = u._asi8(self.days_at_time(days, market_time), unit)
+            else:
+                values[:, i] = self._wall_times(dates, market_time).view(np.int64)
+                local.append(i)
+
+        if local:  # wall time to UTC, for all columns at once
+            wall = pd.DatetimeIndex(values[:, local].ravel().view(f"M8[{unit}]"))
+            values[:, local] = wall.tz_localize(self.tz).asi8.reshape(len(dates), len(local))
 
-        schedule = pd.DataFrame()
-        for market_time in market_times:
-            temp = self.days_at_time(days, market_time).copy()  # standard times
-            if _adj_col:
-                # create an array of special times
+        open_rows = close_rows = None
+        if force_special_times is not None:
+            for i, market_time in enumerate(market_times):
                 special = self.special_dates(market_time, days[0], days[-1], filter_holidays=False)
-                # overwrite standard times
-                specialix = special.index[
-                    special.index.isin(temp.index)
-                ]  # some sources of special times don't exclude holidays
-                temp.loc[specialix] = special
+                rows = days.get_indexer(special.index)
+                found = rows >= 0  # some sources of special times don't exclude holidays
+                values[rows[found], i] = u._asi8(special, unit)[found]
 
-                if _adj_others:
+                if force_special_times is True:
                     if market_time == "market_open":
-                        _open_adj = specialix
+                        open_rows = np.zeros(len(dates), dtype=bool)
+                        open_rows[rows[found]] = True
                     elif market_time == "market_close":
-                        _close_adj = specialix
-
-            schedule[market_time] = temp
+                        close_rows = np.zeros(len(dates), dtype=bool)
+                        close_rows[rows[found]] = True
+
+        if open_rows is not None or close_rows is not None:
+            self._clip_to_special_times(
+                values,
+                open_rows,
+                close_rows,
+                market_times.index("market_open") if open_rows is not None else None,
+                market_times.index("market_close") if close_rows is not None else None,
+            )
 
-        cols = schedule.columns
-        if _adj_others and len(_open_adj) > 0:
-            mkt_open_ind = cols.get_loc("market_open")
+        dtype = pd.DatetimeTZDtype(unit, "UTC")
+        return pd.DataFrame(
+            {mt: pd.DatetimeIndex(values[:, i].view(f"M8[{unit}]"), dtype=dtype) for i, mt in enumerate(market_times)},
+            index=days,
+        )
 
-            # Can't use Lambdas here since numpy array assignment doesn't return the array.
-            def adjust_opens(x):  # x is an np.Array.
-                x[x <= x[mkt_open_ind]] = x[mkt_open_ind]
-                return x
+    @staticmethod
+    def _clip_to_special_times(values: np.ndarray, open_rows, close_rows, open_ix, close_ix) -> np.ndarray:
+        """
+        Clip the int64 times in values (days x market_times), inplace. On open_rows, times before the column
+        open_ix are moved to it, and on close_rows, times after the column close_ix.
 
-            adjusted = schedule.loc[_open_adj].apply(adjust_opens, axis=1, raw=True)
-            schedule.loc[_open_adj] = adjusted
+        :return: boolean array of the columns that changed
+        """
+        valid = values != np.iinfo(np.int64).min  # NaT stays NaT and is not used to clip other times
+        changed = np.zeros(values.shape[1], dtype=bool)
 
-        if _adj_others and len(_close_adj) > 0:
-            mkt_close_ind = cols.get_loc("market_close")
+        for rows, ix, clip in ((open_rows, open_ix, np.less_equal), (close_rows, close_ix, np.greater_equal)):
+            if ix is None or not np.any(rows):
+                continue
+            sub, ref = values[rows], values[rows, ix : ix + 1]
+            adjust = clip(sub, ref) & (sub != ref) & valid[rows] & valid[rows, ix : ix + 1]
+            values[rows] = np.where(adjust, ref, sub)
+            changed |= adjust.any(axis=0)
 
-            def adjust_closes(x):
-                x[x >= x[mkt_close_ind]] = x[mkt_close_ind]
-                return x
+        return changed
 
-            adjusted = schedule.loc[_close_adj].apply(adjust_closes, axis=1, raw=True)
-            schedule.loc[_close_adj] = adjusted
+    @classmethod
+    def _conform_to_special_times(cls, schedule: pd.DataFrame, open_days, close_days) -> None:
+        """
+        Conform all columns of the schedule to special opens/closes, inplace. On open_days, times before
+        market_open are moved to market_open, and on close_days, times after market_close to market_close.
 
-        if interruptions:
-            interrs = self.interruptions_df
-            schedule[interrs.columns] = interrs
-            schedule = schedule.dropna(how="all", axis=1)
+        All columns are clipped at once, using a 2D array of their int64 values.
+        """
+        units = [u._unit(schedule[col].dtype) for col in schedule.columns]
+        unit = min(units, key=["ns", "us", "ms", "s"].index)
+        values = np.column_stack([u._asi8(schedule[col], unit) for col in schedule.columns])
 
-        if tz != "UTC":
-            # Vectorized timezone conversion - faster than apply(lambda)
-            for col in schedule.columns:
-                schedule[col] = schedule[col].dt.tz_convert(tz)
+        columns = schedule.columns
+        changed = cls._clip_to_special_times(
+            values,
+            schedule.index.isin(open_days),
+            schedule.index.isin(close_days),
+            columns.get_loc("market_open") if "market_open" in columns else None,
+            columns.get_loc("market_close") if "market_close" in columns else None,
+        )
 
-        return schedule
+        for i in np.flatnonzero(changed):
+            times = u._datetime_index(values[:, i], unit, tz="UTC", as_unit=units[i])
+            schedule[columns[i]] = pd.Series(times, index=schedule.index)
 
     def date_range_htf(
         self,
@@ -939,20 +1502,8 @@ class MarketCalendar(metaclass=MarketCalendarMeta):
         with contextlib.suppress(TypeError):
             timestamp = timestamp.tz_localize("UTC")
 
-        cols = schedule.columns
-        interrs = cols.str.startswith("interruption_")
-        if not (cols.isin(self._oc_market_times) | interrs).all():
-            raise ValueError(
-                "You seem to be using a schedule that isn't based on the market_times, "
-                "or includes market_times that are not represented in the open_close_map."
-            )
-
-        if only_rth:
-            lowest, highest = "market_open", "market_close"
-        else:
-            cols = cols[~interrs]
-            ix = cols.map(self._oc_market_times.index)
-            lowest, highest = cols[ix == ix.min()][0], cols[ix == ix.max()][0]
+        interrs = schedule.columns.str.startswith("interruption_")
+        lowest, highest = self._open_close_bounds(schedule.columns, only_rth)
 
         if timestamp < schedule[lowest].iat[0] or timestamp > schedule[highest].iat[-1]:
             raise ValueError("The provided timestamp is not covered by the schedule")
@@ -982,6 +1533,100 @@ class MarketCalendar(metaclass=MarketCalendarMeta):
         else:
             return bool(last_event)
 
+    def _open_close_bounds(self, cols, only_rth):
+        """
+        Validate the columns of a schedule passed to .open_at_time and find the first and last column to consider.
+
+        :return: (lowest, highest) column names
+        """
+        interrs = cols.str.startswith("interruption_")
+        if not (cols.isin(self._oc_market_times) | interrs).all():
+            raise ValueError(
+                "You seem to be using a schedule that isn't based on the market_times, "
+                "or includes market_times that are not represented in the open_close_map."
+            )
+
+        if only_rth:
+            return "market_open", "market_close"
+
+        cols = cols[~interrs]
+        ix = cols.map(self._oc_market_times.index)
+        return cols[ix == ix.min()][0], cols[ix == ix.max()][0]
+
+    def _open_close_transitions(self, schedule, only_rth=False):
+        """
+        Flatten a schedule into the sorted array of the times at which the market opens or closes,
+        following the same rules as .open_at_time.
+
+        Each row is sorted by time and limited to the events between its lowest and highest column.
+        Events of a row that fall after the start of the next row are dropped since .open_at_time would
+        look them up in the next row, which keeps the flattened array sorted.
+
+        :param schedule: schedule DataFrame
+        :param only_rth: whether to ignore columns that are before market_open or after market_close
+        :return: (times, opens, lowest, highest). times is an int64 array of UTC nanoseconds, opens a bool array
+            that is True where the market opens. lowest and highest are the first and last column considered.
+        """
+        cols = schedule.columns
+        lowest, highest = self._open_close_bounds(cols, only_rth)
+
+        # interruptions close the market when they start and open it when they end
+        opens = np.array([self.open_close_map.get(col, col.startswith("interruption_end_")) for col in cols])
+        times = np.column_stack([u._asi8(pd.DatetimeIndex(schedule[col]).tz_convert("UTC")) for col in cols])
+        nat = np.iinfo(np.int64).min
+        # rows that have no lowest time can't be selected by .open_at_time
+        times = times[times[:, cols.get_loc(lowest)] != nat]
+        next_lowest = np.append(times[1:, cols.get_loc(lowest)], np.iinfo(np.int64).max)
+
+        # sort each row by time (stable, so that ties keep the column order) with NaTs at the end
+        order = np.argsort(np.where(times == nat, np.iinfo(np.int64).max, times), axis=1, kind="stable")
+        times = np.take_along_axis(times, order, axis=1)
+        labels = cols.to_numpy()[order]
+        opens = opens[order]
+
+        position = np.arange(len(cols))
+        keep = (
+            (times != nat)
+            & (position >= np.argmax(labels == lowest, axis=1)[:, None])
+            & (position <= np.argmax(labels == highest, axis=1)[:, None])
+        )
+        # When post follows market_close, market_close should not be considered a close
+        opens[:, :-1] |= (labels[:, :-1] == "market_close") & (labels[:, 1:] == "post") & keep[:, 1:]
+        keep &= times <= next_lowest[:, None]
+
+        return times[keep], opens[keep], lowest, highest
+
+    def open_at_times(self, schedule, timestamps, include_close=False, only_rth=False) -> np.ndarray:
+        """
+        Vectorized version of .open_at_time, determines for each timestamp if it is during an open time
+        for the market. If any timestamp is before the first open time or after the last close time of
+        `schedule`, a ValueError will be raised.
+
+        :param schedule: schedule DataFrame
+        :param timestamps: DatetimeIndex, array or list of timestamps to check for. Assumed to be UTC,
+            if they don't include tz information.
+        :param include_close: if False then a timestamp that equals a closing timestamp will be False,
+            if True it will be True. See .open_at_time
+        :param only_rth: whether to ignore columns that are before market_open or after market_close. If true,
+            include_close will be referring to market_close.
+        :return: bool array, True where the timestamp is a valid open date and time
+        """
+        timestamps = self._utc_nanoseconds(timestamps)
+        times, opens, lowest, highest = self._open_close_transitions(schedule, only_rth)
+        if not len(timestamps):
+            return np.zeros(0, dtype=bool)
+
+        first = pd.Timestamp(schedule[lowest].iat[0]).value
+        last = pd.Timestamp(schedule[highest].iat[-1]).value
+        if timestamps.min() < first or timestamps.max() > last:
+            raise ValueError("The provided timestamp is not covered by the schedule")
+
+        ix = np.searchsorted(times, timestamps, side="right") - 1
+        is_open = opens[ix]
+        if include_close:
+            is_open |= times[ix] == timestamps
+        return is_open
+
     # need this to make is_open_now testable
     @staticmethod
     def _get_current_time():
@@ -1003,6 +1648,124 @@ class MarketCalendar(metaclass=MarketCalendarMeta):
         current_time = MarketCalendar._get_current_time()
         return self.open_at_time(schedule, current_time, include_close=include_close, only_rth=only_rth)
 
+    @staticmethod
+    def _utc_nanoseconds(timestamps) -> np.ndarray:
+        """
+        :param timestamps: DatetimeIndex, array or list of timestamps, assumed to be UTC if they don't include tz
+        :return: int64 array of UTC nanoseconds
+        """
+        timestamps = pd.DatetimeIndex(timestamps)
+        if timestamps.tz is None:
+            timestamps = timestamps.tz_localize("UTC")
+        return u._asi8(timestamps)
+
+    def _sessions(self, first_year, last_year) -> dict:
+        """
+        The sessions, market_open and market_close columns of the schedule as sorted int64 arrays, covering at least
+        the whole years from first_year to last_year. Kept until the regular market times of the calendar change,
+        and extended when later calls need more years.
+
+        :return: dict with the int64 arrays "sessions" (dates), "market_open" and "market_close" (UTC nanoseconds)
+        """
+        cached = getattr(self, "_session_arrays", None)
+        if cached is not None:
+            if cached[0] <= first_year and cached[1] >= last_year:
+                return cached[2]
+            first_year, last_year = min(first_year, cached[0]), max(last_year, cached[1])
+
+        schedule = self.schedule(f"{first_year}-01-01", f"{last_year}-12-31")
+        arrays = {"sessions": u._asi8(schedule.index)}
+        for col in ("market_open", "market_close"):
+            arrays[col] = u._asi8(schedule[col]) if len(schedule) else arrays["sessions"]
+
+        self._session_arrays = (first_year, last_year, arrays)
+        return arrays
+
+    def _sessions_at(self, timestamp):
+        """
+        :return: (scalar, timestamps, known, arrays): whether timestamp is a scalar, the timestamps as UTC
+            nanoseconds, a boolean array that is False where they are NaT, and the arrays of ._sessions that cover
+            them with a year to spare on each side
+        """
+        scalar = np.ndim(timestamp) == 0
+        timestamps = self._utc_nanoseconds([timestamp] if scalar else timestamp)
+        known = timestamps != pd.NaT.value
+        if not known.any():
+            empty = timestamps[:0]
+            return scalar, timestamps, known, dict.fromkeys(("sessions", "market_open", "market_close"), empty)
+
+        valid = timestamps[known]
+        years = pd.DatetimeIndex(valid[[valid.argmin(), valid.argmax()]]).year
+        return scalar, timestamps, known, self._sessions(years[0] - 1, years[1] + 1)
+
+    def _session_lookup(self, timestamp, column, side):
+        """
+        Look up the first time in the column after (side="next") or the last time before (side="previous") each
+        timestamp, both excluding times equal to it.
+
+        :return: Timestamp or DatetimeIndex in UTC, NaT where there is none
+        """
+        scalar, timestamps, known, arrays = self._sessions_at(timestamp)
+        values = arrays[column]
+        if side == "next":
+            ix = np.searchsorted(values, timestamps, "right")
+        else:
+            ix = np.searchsorted(values, timestamps, "left") - 1
+
+        found = (ix >= 0) & (ix < len(values)) & known
+        result = np.full(len(timestamps), pd.NaT.value)
+        result[found] = values[ix[found]]
+
+        result = pd.DatetimeIndex(result.view("M8[ns]")).tz_localize("UTC")
+        return result[0] if scalar else result
+
+    def next_open(self, timestamp):
+        """
+        :param timestamp: timestamp or array of timestamps, assumed to be UTC if they don't include tz information
+        :return: the first market_open after timestamp, as Timestamp or DatetimeIndex in UTC
+        """
+        return self._session_lookup(timestamp, "market_open", "next")
+
+    def previous_open(self, timestamp):
+        """
+        :param timestamp: timestamp or array of timestamps, assumed to be UTC if they don't include tz information
+        :return: the last market_open before timestamp, as Timestamp or DatetimeIndex in UTC
+        """
+        return self._session_lookup(timestamp, "market_open", "previous")
+
+    def next_close(self, timestamp):
+        """
+        :param timestamp: timestamp or array of timestamps, assumed to be UTC if they don't include tz information
+        :return: the first market_close after timestamp, as Timestamp or DatetimeIndex in UTC
+        """
+        return self._session_lookup(timestamp, "market_close", "next")
+
+    def previous_close(self, timestamp):
+        """
+        :param timestamp: timestamp or array of timestamps, assumed to be UTC if they don't include tz information
+        :return: the last market_close before timestamp, as Timestamp or DatetimeIndex in UTC
+        """
+        return self._session_lookup(timestamp, "market_close", "previous")
+
+    def session_containing(self, timestamp):
+        """
+        Find the trading day during whose regular trading hours timestamp falls, the market_open is included
+        and the market_close is not. Breaks are considered part of the session.
+
+        :param timestamp: timestamp or array of timestamps, assumed to be UTC if they don't include tz information
+        :return: the session date as Timestamp or DatetimeIndex, NaT where the market is closed
+        """
+        scalar, timestamps, known, arrays = self._sessions_at(timestamp)
+        ix = np.searchsorted(arrays["market_open"], timestamps, "right") - 1
+
+        found = (ix >= 0) & known
+        found[found] = timestamps[found] < arrays["market_close"][ix[found]]
+        result = np.full(len(timestamps), pd.NaT.value)
+        result[found] = arrays["sessions"][ix[found]]
+
+        result = pd.DatetimeIndex(result.view("M8[ns]"))
+        return result[0] if scalar else result
+
     def clean_dates(self, start_date, end_date):
         """
         Strips the inputs of time and time zone information
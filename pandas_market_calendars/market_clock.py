@@ -0,0 +1,189 @@
+"""
+Stateful clock that answers "is the market open now?" without scanning a schedule on every call.
+
+    >>> import pandas_market_calendars as mcal
+    >>> clock = mcal.MarketClock(mcal.get_calendar("NYSE"))
+    >>> clock.is_open()
+    >>> clock.next_close()
+
+The open/close transitions of a window of the schedule are flattened into sorted arrays once. A cursor
+points at the next transition, so polling with a time that moves forward only compares two integers.
+When the time leaves the window, the next window is computed with MarketCalendar.schedule().
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .market_calendar import MarketCalendar
+
+
+class MarketClock:
+    """
+    Answers .is_open(), .next_open(), .next_close() and .seconds_until_change() for a calendar,
+    following the same rules as MarketCalendar.open_at_time.
+    """
+
+    def __init__(
+        self,
+        calendar,
+        schedule: Optional[pd.DataFrame] = None,
+        include_close=False,
+        only_rth=False,
+        market_times=None,
+        interruptions=False,
+        days=30,
+    ):
+        """
+        :param calendar: MarketCalendar to follow
+        :param schedule: optional schedule DataFrame to start from. Its columns replace market_times and interruptions
+            when windows are computed later on.
+        :param include_close: whether the closing timestamps are considered open, see MarketCalendar.open_at_time
+        :param only_rth: whether to ignore columns that are before market_open or after market_close
+        :param market_times: market_times of the schedules computed by the clock, see MarketCalendar.schedule
+        :param interruptions: whether the schedules computed by the clock include interruptions
+        :param days: number of days after the current date that each window covers
+        """
+        self.calendar = calendar
+        self.include_close = include_close
+        self.only_rth = only_rth
+        self.days = days
+
+        if schedule is not None:
+            interrs = schedule.columns.str.startswith("interruption_")
+            market_times = list(schedule.columns[~interrs])
+            interruptions = bool(interrs.any())
+        self.market_times = market_times
+        self.interruptions = interruptions
+
+        self._times = self._opens = None
+        if schedule is not None and not schedule.empty:
+            self._set_window(schedule)
+
+    def _set_window(self, schedule: pd.DataFrame) -> None:
+        times, opens, lowest, _ = self.calendar._open_close_transitions(schedule, self.only_rth)
+        # whether the market really closes at the end of the window is only known from the day after,
+        # so the transitions from the start of the last day on are left to the next window
+        end = pd.Timestamp(schedule[lowest].iat[-1]).value
+        self._times, self._opens = times[times < end], opens[times < end]
+        times, opens = self._times, self._opens
+        self._cursor = 0
+
+        # the changes of state: the last transition at each time, when it differs from the one before
+        last = np.append(times[1:] != times[:-1], True)
+        times, opens = times[last], opens[last]
+        change = np.append(True, opens[1:] != opens[:-1])
+        self._change_times, self._change_opens = times[change], opens[change]
+        # position of the next change for each cursor position
+        self._change_cursor = np.append(0, np.searchsorted(self._change_times, self._times, "right"))
+
+        # position of the next opening/closing change at or after each change position
+        n = len(self._change_times)
+        positions = np.arange(n + 1)
+        is_open = np.append(self._change_opens, False)
+        is_close = np.append(~self._change_opens, False)
+        self._next_open = np.minimum.accumulate(np.where(is_open, positions, n)[::-1])[::-1]
+        self._next_close = np.minimum.accumulate(np.where(is_close, positions, n)[::-1])[::-1]
+
+    def _load(self, now: int, days: int) -> None:
+        now = pd.Timestamp(now, tz="UTC")
+        today = now.tz_convert(self.calendar.tz).tz_localize(None).normalize()
+        # the window starts with the session before now, which can be further back than usual during long closures
+        start = today - pd.Timedelta(days=14)
+        previous = self.calendar.previous_open(now)
+        if previous is not pd.NaT:
+            start = min(start, previous.tz_convert(self.calendar.tz).tz_localize(None).normalize())
+
+        schedule = self.calendar.schedule(
+            start,
+            today + pd.Timedelta(days=days),
+            market_times=self.market_times,
+            interruptions=self.interruptions,
+        )
+        if schedule.empty:
+            raise ValueError(f"{self.calendar.name} has no trading days around {today.date()}")
+        self._set_window(schedule)
+
+    @staticmethod
+    def _now(now) -> int:
+        if now is None:
+            now = MarketCalendar._get_current_time()
+        now = pd.Timestamp(now)
+        if now.tz is None:
+            now = now.tz_localize("UTC")
+        return now.value
+
+    def _seek(self, now: int) -> int:
+        """
+        Move the cursor to the number of transitions at or before now, computing a new window when now
+        is not covered by the current one.
+
+        :return: the new cursor position
+        """
+        times = self._times
+        if times is None or not len(times) or now < times[0] or now >= times[-1]:
+            self._load(now, self.days)
+            times = self._times
+            if not len(times) or now < times[0] or now >= times[-1]:
+                raise ValueError("The provided timestamp is not covered by the schedule")
+
+        i = self._cursor
+        if not (0 < i < len(times) and times[i - 1] <= now < times[i]):
+            if i < len(times) - 1 and times[i] <= now < times[i + 1]:
+                i += 1
+            else:
+                i = int(np.searchsorted(times, now, "right"))
+            self._cursor = i
+        return i
+
+    def is_open(self, now=None) -> bool:
+        """
+        :param now: timestamp to check, assumed to be UTC if it doesn't include tz information.
+            Default is the current time.
+        :return: True if the market is open at now
+        """
+        now = self._now(now)
+        i = self._seek(now)
+        if self._opens[i - 1]:
+            return True
+        return bool(self.include_close and self._times[i - 1] == now)
+
+    def _next_change(self, now: int, lookup) -> Optional[pd.Timestamp]:
+        days = self.days
+        for _ in range(3):
+            i = self._seek(now)  # may compute a new window
+            j = self._change_cursor[i]
+            if lookup is not None:
+                j = getattr(self, lookup)[j]
+            if j < len(self._change_times):
+                return pd.Timestamp(self._change_times[j], tz="UTC")
+            # no change left in the window, look further ahead
+            days *= 4
+            self._load(now, days)
+        return None
+
+    def next_open(self, now=None) -> Optional[pd.Timestamp]:
+        """
+        :param now: timestamp after which to look, default is the current time
+        :return: UTC timestamp of the next time the market opens, None if there is none in the foreseeable future
+        """
+        return self._next_change(self._now(now), "_next_open")
+
+    def next_close(self, now=None) -> Optional[pd.Timestamp]:
+        """
+        :param now: timestamp after which to look, default is the current time
+        :return: UTC timestamp of the next time the market closes, None if there is none in the foreseeable future
+        """
+        return self._next_change(self._now(now), "_next_close")
+
+    def seconds_until_change(self, now=None) -> Optional[float]:
+        """
+        :param now: timestamp from which to count, default is the current time
+        :return: seconds until the market next opens or closes, None if it never does in the foreseeable future
+        """
+        now = self._now(now)  # once, the change is measured from the same instant it was found after
+        change = self._next_change(now, None)
+        if change is None:
+            return None
+        return (change.value - now) / 1e9
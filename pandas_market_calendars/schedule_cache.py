@@ -0,0 +1,210 @@
+"""
+Opt-in persistent cache for MarketCalendar.schedule()
+
+Schedules are stored as .npy files holding a structured datetime64 array, one row per trading day and one
+field per column (in UTC). Later processes load them with np.load(mmap_mode="r") and only slice the rows
+they need, instead of evaluating the holiday and special time rules again.
+
+    >>> import pandas_market_calendars as mcal
+    >>> mcal.enable_schedule_cache("~/.cache/pandas_market_calendars")
+    >>> mcal.get_calendar("NYSE").schedule("1950-01-01", "2050-12-31")  # computed and stored once
+
+The cache key is made of the calendar, the package version (and that of exchange_calendars for the calendars
+mirrored from it), any customizations made with change_time/add_time
+(including the open_close_map) and the schedule parameters. The stored schedules are computed with the default
+engine, the engine argument of schedule() has no effect while the cache is enabled. When developing the rules
+themselves, clear the cache since the version may not change between edits.
+"""
+
+import functools
+import hashlib
+import os
+import re
+import tempfile
+from importlib import metadata
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+INDEX_FIELD = "__index__"
+
+_active_cache: Optional["ScheduleCache"] = None
+
+
+@functools.lru_cache
+def _package_version() -> str:
+    try:
+        return metadata.version("pandas_market_calendars")
+    except metadata.PackageNotFoundError:
+        return "development"
+
+
+def _versions(calendar) -> str:
+    """
+    :return: the versions that the schedules of calendar depend on, the schedules of the calendars mirrored
+        from exchange_calendars also depend on the version of exchange_calendars
+    """
+    if hasattr(calendar, "_ec_class"):
+        import exchange_calendars
+
+        return f"{_package_version()}-ec{exchange_calendars.__version__}"
+    return _package_version()
+
+
+class ScheduleCache:
+    """
+    A directory of schedules, each stored as an .npy file that spans whole calendar years.
+    A request that is not covered by the stored years extends the file, all others are served by slicing it.
+    """
+
+    def __init__(self, directory):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, calendar, market_times, force_special_times, interruptions) -> str:
+        """
+        :return: file name (without extension) of the schedule with these parameters
+        """
+        custom = tuple((mt, calendar.regular_market_times[mt]) for mt in sorted(calendar._customized_market_times))
+        parts = (
+            type(calendar).__name__,
+            calendar.name,
+            _versions(calendar),
+            custom,
+            tuple(sorted(calendar.open_close_map.items())),
+            tuple(market_times),
+            force_special_times,
+            interruptions,
+        )
+        digest = hashlib.sha1(repr(parts).encode()).hexdigest()[:16]
+        return re.sub(r"[^\w.-]", "_", f"{calendar.name}-{_versions(calendar)}-{digest}")
+
+    def _path(self, key) -> str:
+        return os.path.join(self.directory, key + ".npy")
+
+    def load(self, key) -> Optional[np.ndarray]:
+        """
+        :return: the memory-mapped structured array stored under key, None if there is none
+        """
+        try:
+            return np.load(self._path(key), mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key, schedule: pd.DataFrame) -> None:
+        """
+        Write the schedule under key. The file is replaced atomically so concurrent readers never see a partial file.
+        """
+        fields = {INDEX_FIELD: schedule.index.to_numpy()}
+        for col in schedule.columns:
+            fields[col] = schedule[col].dt.tz_convert("UTC").dt.tz_localize(None).to_numpy()
+
+        arr = np.empty(len(schedule), dtype=[(name, values.dtype) for name, values in fields.items()])
+        for name, values in fields.items():
+            arr[name] = values
+
+        fd, tmp = tempfile.mkstemp(suffix=".npy", dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, arr)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+    def clear(self) -> None:
+        """
+        Delete all stored schedules.
+        """
+        for file in os.listdir(self.directory):
+            if file.endswith(".npy"):
+                os.remove(os.path.join(self.directory, file))
+
+    @staticmethod
+    def _covers(arr, start_date, end_date) -> bool:
+        if arr is None or len(arr) == 0:
+            return False
+        index = arr[INDEX_FIELD]
+        return pd.Timestamp(index[0]).year <= start_date.year and pd.Timestamp(index[-1]).year >= end_date.year
+
+    def schedule(self, calendar, start_date, end_date, tz, market_times, force_special_times, interruptions):
+        """
+        Same as calendar.schedule(), served from the stored schedule. start_date and end_date need to be cleaned.
+        """
+        key = self.key(calendar, market_times, force_special_times, interruptions)
+        arr = self.load(key)
+
+        if not self._covers(arr, start_date, end_date):
+            first, last = start_date.year, end_date.year
+            if arr is not None and len(arr) > 0:
+                first = min(first, pd.Timestamp(arr[INDEX_FIELD][0]).year)
+                last = max(last, pd.Timestamp(arr[INDEX_FIELD][-1]).year)
+            # Unmap the stored file before store() replaces it, Windows doesn't allow replacing a mapped file
+            arr = None
+
+            days = calendar._valid_days(f"{first}-01-01", f"{last}-12-31")
+            if not days.size:
+                return pd.DataFrame(columns=market_times, index=pd.DatetimeIndex([], freq="C"))
+            self.store(
+                key,
+                calendar.schedule_from_days(
+                    days,
+                    market_times=market_times,
+                    force_special_times=force_special_times,
+                    interruptions=interruptions,
+                ),
+            )
+            arr = self.load(key)
+
+        index = arr[INDEX_FIELD]
+        first = index.searchsorted(start_date.to_datetime64())
+        rows = arr[first : index.searchsorted(end_date.to_datetime64(), "right")]
+        if not len(rows):
+            return pd.DataFrame(columns=market_times, index=pd.DatetimeIndex([], freq="C"))
+
+        columns = [name for name in arr.dtype.names if name != INDEX_FIELD]
+        schedule = pd.DataFrame(
+            {col: pd.DatetimeIndex(np.array(rows[col])).tz_localize("UTC") for col in columns},
+            index=pd.DatetimeIndex(np.array(rows[INDEX_FIELD])),
+        )
+        if interruptions:
+            schedule = schedule.dropna(how="all", axis=1)
+
+        if tz != "UTC":
+            for col in schedule.columns:
+                schedule[col] = schedule[col].dt.tz_convert(tz)
+
+        return schedule
+
+
+def enable_schedule_cache(directory=None) -> ScheduleCache:
+    """
+    Store the results of MarketCalendar.schedule() in directory and serve later calls, also from other
+    processes, from there.
+
+    :param directory: cache directory. If None, the environment variable PANDAS_MARKET_CALENDARS_CACHE is used,
+        falling back to ~/.cache/pandas_market_calendars
+    :return: the ScheduleCache that is now in use
+    """
+    global _active_cache
+    if directory is None:
+        directory = os.environ.get("PANDAS_MARKET_CALENDARS_CACHE", "~/.cache/pandas_market_calendars")
+    _active_cache = ScheduleCache(directory)
+    return _active_cache
+
+
+def disable_schedule_cache() -> None:
+    """
+    Compute every schedule from the rules again. The files in the cache directory are left alone.
+    """
+    global _active_cache
+    _active_cache = None
+
+
+def get_schedule_cache() -> Optional[ScheduleCache]:
+    """
+    :return: the ScheduleCache in use, None if caching is disabled
+    """
+    return _active_cache
@@ -0,0 +1,145 @@
+"""
+Open days of many calendars side by side, as a dates x calendars matrix of bools.
+
+    >>> import pandas_market_calendars as mcal
+    >>> matrix = mcal.trading_day_matrix(["NYSE", "LSE", "XHKG"], "2024-01-01", "2024-12-31")
+    >>> matrix.all_open()
+    >>> matrix.next_common_open("2024-12-24", ["NYSE", "LSE"])
+
+Each column is sliced from the open-day bitmap of its calendar, which is computed once per calendar class
+and shared by all of its instances, so building a matrix doesn't evaluate any holiday rules again.
+"""
+
+from typing import Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .calendar_registry import get_calendar
+from .calendar_utils import DATE_RANGE_DTYPE, _days_index, _to_days
+from .market_calendar import MarketCalendar
+
+
+class TradingDayMatrix:
+    """
+    Dates x calendars matrix of bools, True where the calendar is open on the date.
+    """
+
+    def __init__(self, dates: pd.DatetimeIndex, names: List[str], values: np.ndarray):
+        """
+        :param dates: DatetimeIndex of the days, the rows of the matrix
+        :param names: names of the calendars (their .name), the columns of the matrix
+        :param values: np.ndarray of bool with shape (len(dates), len(names))
+        """
+        self.dates = dates
+        self.names = names
+        self.values = values
+
+    def __repr__(self):
+        first, last = (f"{d.date()}" for d in self.dates[[0, -1]]) if len(self.dates) else ("", "")
+        return f"{type(self).__name__}({first} to {last}, {len(self.dates)} days x {len(self.names)} calendars)"
+
+    def _column_name(self, name) -> str:
+        if isinstance(name, MarketCalendar):
+            return name.name
+        if name in self.names:
+            return name
+        try:  # an alias, like "stock" for NYSE
+            return get_calendar(name).name
+        except RuntimeError:
+            return name
+
+    def _columns(self, names) -> Union[slice, List[int]]:
+        if names is None:
+            return slice(None)
+        if isinstance(names, (str, MarketCalendar)):
+            names = [names]
+        lookup = {name: i for i, name in enumerate(self.names)}
+        try:
+            return [lookup[self._column_name(name)] for name in names]
+        except KeyError as e:
+            raise KeyError(f"{e.args[0]} is not one of the calendars of the matrix: {self.names}") from None
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        :return: DataFrame of bools with the dates as index and the calendar names as columns
+        """
+        return pd.DataFrame(self.values, index=self.dates, columns=self.names)
+
+    def packbits(self) -> np.ndarray:
+        """
+        :return: np.ndarray of uint8 with shape (len(dates), ceil(len(names) / 8)), the bit i % 8 (least significant
+            first) of byte i // 8 in a row is set when calendar i is open on that date
+        """
+        return np.packbits(self.values, axis=1, bitorder="little")
+
+    def all_open(self, names: Optional[Iterable[str]] = None) -> np.ndarray:
+        """
+        :param names: subset of the calendars to consider, default is all of them
+        :return: np.ndarray of bool, one element per date, True where all of the calendars are open
+        """
+        return self.values[:, self._columns(names)].all(axis=1)
+
+    def any_open(self, names: Optional[Iterable[str]] = None) -> np.ndarray:
+        """
+        :param names: subset of the calendars to consider, default is all of them
+        :return: np.ndarray of bool, one element per date, True where at least one of the calendars is open
+        """
+        return self.values[:, self._columns(names)].any(axis=1)
+
+    def count_open(self, names: Optional[Iterable[str]] = None) -> np.ndarray:
+        """
+        :param names: subset of the calendars to consider, default is all of them
+        :return: np.ndarray of int, one element per date, the number of the calendars that are open
+        """
+        return self.values[:, self._columns(names)].sum(axis=1)
+
+    def next_common_open(self, dates, names: Optional[Iterable[str]] = None):
+        """
+        First date on or after each date on which all of the calendars are open. Time and time zone
+        information is ignored.
+
+        :param dates: a single date or an array-like of dates
+        :param names: subset of the calendars to consider, default is all of them
+        :return: Timestamp for a single date, otherwise DatetimeIndex of dates. NaT where there is no such date
+            until the end of the matrix.
+        """
+        scalar, days = np.ndim(dates) == 0, _to_days(dates)
+        common = self.dates.values.astype("datetime64[D]")[self.all_open(names)]
+        ix = np.searchsorted(common, days)
+        found = (ix < len(common)) & ~np.isnat(days)
+        result = np.full(len(days), np.datetime64("NaT", "D"))
+        result[found] = common[ix[found]]
+        result = _days_index(result, self.dates.dtype)
+        return result[0] if scalar else result
+
+
+def trading_day_matrix(calendars: Iterable[Union[str, MarketCalendar]], start_date, end_date) -> TradingDayMatrix:
+    """
+    Open days of several calendars for every calendar day from start_date to end_date, both inclusive.
+
+    :param calendars: names of calendars, as in get_calendar, or MarketCalendar instances. The columns are named
+        after the .name of the calendars, aliases like "stock" become "NYSE".
+    :param start_date: first date of the matrix
+    :param end_date: last date of the matrix
+    :return: TradingDayMatrix
+    """
+    calendars = [get_calendar(cal) if isinstance(cal, str) else cal for cal in calendars]
+    names = [cal.name for cal in calendars]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"The calendars are given more than once: {duplicates}")
+    first, last = _to_days(start_date)[0], _to_days(end_date)[0]
+    days = np.arange(first, max(last + np.timedelta64(1, "D"), first), dtype="datetime64[D]")
+
+    values = np.zeros((len(days), len(calendars)), dtype=bool)
+    for i, cal in enumerate(calendars):
+        if not len(days):
+            break
+        if type(cal).valid_days is MarketCalendar.valid_days and type(cal)._day_bounds is MarketCalendar._day_bounds:
+            values[:, i] = cal._open_day_slice(first, last)
+        else:  # the calendar adjusts its open days
+            open_days = cal.valid_days(start_date, end_date, tz=None).values.astype("datetime64[D]")
+            values[(open_days - first).astype(np.int64), i] = True
+
+    return TradingDayMatrix(_days_index(days, DATE_RANGE_DTYPE), names, values)
@@ -4,7 +4,7 @@ from pprint import pformat
 
 import pytest
 
-from pandas_market_calendars.class_registry import ProtectedDict, RegisteryMeta
+from pandas_market_calendars.class_registry import ClassRegistry, ProtectedDict, RegisteryMeta
 
 
 def test_inheritance():
@@ -172,6 +172,63 @@ def test_metamixing():
     assert Base.factory("Class2").test() == "test"
 
 
+def test_loaders():
+    class Base(metaclass=RegisteryMeta):
+        regular_market_times = {}
+        open_close_map = {}
+        special_opens = special_closes = special_opens_adhoc = special_closes_adhoc = []
+
+        @classmethod
+        def _prepare_regular_market_times(cls):
+            return
+
+    created = []
+
+    def loader(name):
+        created.append(name)
+        type(name, (Base,), {"aliases": [name]})
+
+    registry = Base._regmeta_class_registry
+    assert isinstance(registry, ClassRegistry)
+    registry.add_loader("lazy", loader)
+
+    assert "lazy" not in registry
+    assert registry.names() == ["Base", "lazy"]
+    assert not created
+
+    assert type(Base.factory("lazy")).__name__ == "lazy"
+    assert type(Base.factory("lazy")) is registry["lazy"]
+    assert created == ["lazy"]
+    assert registry.names() == ["Base", "lazy"]
+
+    with pytest.raises(RuntimeError):
+        Base.factory("error")  # doesn't exist
+
+    # a loader that fails is kept, so that later lookups raise its error again
+    def failing(name):
+        raise ImportError("no module")
+
+    registry.add_loader("failing", failing)
+    for _ in range(2):
+        with pytest.raises(ImportError, match="no module"):
+            registry["failing"]
+    assert "failing" in registry.names()
+
+    # a finder adds loaders once, when an unknown name is looked up or the names are listed
+    finds = []
+
+    def finder():
+        finds.append(True)
+        registry.add_loader("found", loader)
+
+    registry.add_finder(finder)
+    assert type(Base.factory("found")).__name__ == "found"
+    assert "found" in registry.names()
+    with pytest.raises(RuntimeError):
+        Base.factory("error")
+    assert finds == [True]
+
+
 def test_protected_dict():
     dct = ProtectedDict({"a": 1, "b": 2})
 
@@ -12,6 +12,7 @@ from pandas_market_calendars.calendar_utils import (
     OverlappingSessionWarning,
     _make_session_list,
     date_range_htf,
+    date_range_iter,
     filter_date_range_warnings,
     parse_insufficient_schedule_warning,
     parse_missing_session_warning,
@@ -1395,6 +1396,58 @@ def test_date_range_closed():
     )
 
 
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"frequency": "7min"},
+        {"frequency": "1h", "closed": "left", "force_close": False, "session": {"RTH", "ETH"}, "merge_adjacent": False},
+        {"frequency": "2h", "closed": "both", "force_close": None, "session": "closed_masked"},
+        {"frequency": "30min", "start": "2020-01-07 12:00", "end": "2020-01-22"},
+        {"frequency": "30min", "start": "2020-01-07", "periods": 100},
+        {"frequency": "30min", "end": "2020-01-22", "periods": 100},
+    ],
+)
+def test_date_range_iter(kwargs):
+    nyse = mcal.get_calendar("NYSE")
+    schedule = nyse.schedule("2020-01-01", "2020-01-31", market_times="all", tz=nyse.tz)
+    expected = mcal.date_range(schedule, **kwargs)
+
+    chunks = list(date_range_iter(schedule, **kwargs))
+    assert_index_equal(chunks[0].append(chunks[1:]), expected)
+    # one chunk per trading day
+    assert len(chunks) == len(set(expected.normalize().tz_localize(None)) & set(schedule.index))
+
+    chunks = list(date_range_iter(schedule, chunk="7D", **kwargs))
+    assert_index_equal(chunks[0].append(chunks[1:]), expected)
+    assert len(chunks) <= 5
+
+    chunks = list(date_range_iter(schedule, rows=64, **kwargs))
+    assert_index_equal(chunks[0].append(chunks[1:]), expected)
+    assert all(len(c) == 64 for c in chunks[:-1]) and 0 < len(chunks[-1]) <= 64
+
+
+def test_date_range_iter_breaks():
+    cal = FakeBreakCalendar()
+    schedule = cal.schedule("2016-12-01", "2017-01-31")
+    for closed in ("left", "right", "both"):
+        expected = mcal.date_range(schedule, "17min", closed=closed, session={"RTH", "break"}, merge_adjacent=False)
+        chunks = list(date_range_iter(schedule, "17min", closed=closed, session={"RTH", "break"}, merge_adjacent=False))
+        assert_index_equal(chunks[0].append(chunks[1:]), expected)
+
+    # the iterator is lazy
+    chunks = date_range_iter(schedule, "1min")
+    assert len(next(chunks)) == len(mcal.date_range(schedule.iloc[:1], "1min"))
+
+    # the parameters are checked when it is called, before the first chunk is requested
+    with pytest.raises(ValueError):
+        date_range_iter(schedule, "1min", rows=0)
+    with pytest.raises(ValueError):
+        date_range_iter(schedule, "1min", chunk="0D")
+    with pytest.raises(ValueError):
+        date_range_iter(schedule, "1min", closed="middle")
+    assert list(date_range_iter(schedule, "1min", session=[])) == []
+
+
 # endregion
 
 # region ---- ---- ---- Date Range HTF ---- ---- ----
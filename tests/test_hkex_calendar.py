@@ -1,9 +1,12 @@
 import datetime
 
+import numpy as np
 import pandas as pd
+from pandas.testing import assert_index_equal
 from zoneinfo import ZoneInfo
 
 from pandas_market_calendars.calendars.hkex import HKEXExchangeCalendar
+from pandas_market_calendars.holidays.compiler import compile_rule, observance_kernel, rule_dates
 
 
 def test_time_zone():
@@ -55,3 +58,16 @@ def test_hkex_closes_at_lunch():
         schedule=schedule,
         timestamp=datetime.datetime(2015, 1, 14, 12, 10, tzinfo=ZoneInfo("Asia/Shanghai")),
     )
+
+
+def test_hkex_compiled_holidays():
+    rules = HKEXExchangeCalendar().regular_holidays.rules
+    days = np.arange(np.datetime64("1950-01-01"), np.datetime64("2100-01-01"), np.timedelta64(5, "D"))
+
+    for rule in rules:
+        assert compile_rule(rule) is not None, rule
+        assert_index_equal(rule_dates(rule, "1950-01-01", "2099-12-31"), rule.dates("1950-01-01", "2099-12-31"))
+        if rule.observance is not None:
+            # every day, not only the reference date of each year
+            expected = [rule.observance(pd.Timestamp(day)) for day in days]
+            np.testing.assert_array_equal(observance_kernel(rule.observance)(days), pd.DatetimeIndex(expected).values)
@@ -0,0 +1,170 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+from dateutil.easter import easter as dateutil_easter
+from dateutil.relativedelta import MO, TU
+from pandas.errors import OutOfBoundsDatetime
+from pandas.testing import assert_index_equal
+from pandas.tseries.holiday import AbstractHolidayCalendar, Holiday, nearest_workday
+from pandas.tseries.offsets import DateOffset, Day, Easter
+
+import pandas_market_calendars as mcal
+from pandas_market_calendars.holidays import cme, nyse
+from pandas_market_calendars.holidays.compiler import (
+    calendar_holidays,
+    compile_rule,
+    easter,
+    rule_cache,
+    rule_dates,
+    vectorized_observance,
+    weekday_shifts,
+)
+
+
+def test_easter():
+    years = np.arange(1583, 4100)
+    expected = np.array([dateutil_easter(y) for y in years], dtype="datetime64[D]")
+    np.testing.assert_array_equal(easter(years), expected)
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        nyse.USNewYearsDayNYSEpost1952,
+        nyse.USMartinLutherKingJrAfter1998,
+        nyse.USPresidentsDay,
+        nyse.GoodFriday,
+        nyse.USMemorialDay,
+        nyse.USIndependenceDay,
+        nyse.USThanksgivingDay,
+        nyse.ChristmasNYSE,
+        cme.USThanksgivingFriday,
+        Holiday("Fri after 4th Thu of May 10th", month=5, day=10, observance=cme.fri_after_4th_thu),
+        cme.GoodFridayBefore2021NotEarlyClose,
+        cme.USMartinLutherKingJrAfter2015,
+        Holiday("Easter Monday", month=1, day=1, offset=[Easter(), Day(1)]),
+        Holiday("Before Easter", month=4, day=20, offset=Easter(-1)),
+        Holiday("Last Monday", month=6, day=1, offset=DateOffset(weekday=MO(-1))),
+        Holiday("2nd Tuesday back", month=6, day=1, offset=[DateOffset(weekday=TU(-2))]),
+        Holiday("Weekdays", month=7, day=4, observance=nearest_workday, days_of_week=(0, 1, 2, 3)),
+    ],
+    ids=lambda rule: rule.name,
+)
+@pytest.mark.parametrize("start, end", [("1885-01-01", "2200-12-31"), ("2000-07-04 10:00", "2001-07-04")])
+def test_rule_dates(rule, start, end):
+    assert compile_rule(rule) is not None
+    assert_index_equal(rule_dates(rule, start, end), rule.dates(start, end))
+
+
+def test_rule_dates_out_of_bounds():
+    rule = nyse.USNewYearsDayNYSEpost1952
+    if np.datetime_data(pd.date_range("2000-01-01", periods=1).dtype)[0] == "ns":
+        # before pandas 3, the dates after 2262-04-11 can't be represented, like in Holiday.dates
+        with pytest.raises(OutOfBoundsDatetime):
+            rule_dates(rule, "2250-01-01", "2300-12-31")
+    else:
+        assert_index_equal(rule_dates(rule, "2250-01-01", "2300-12-31"), rule.dates("2250-01-01", "2300-12-31"))
+
+
+def test_rule_dates_fallback():
+    def custom(dt):
+        return dt + pd.Timedelta(days=dt.month)
+
+    rule = Holiday("Custom", month=3, day=1, observance=custom)
+    assert compile_rule(rule) is None
+    assert_index_equal(rule_dates(rule, "2000-01-01", "2010-12-31"), rule.dates("2000-01-01", "2010-12-31"))
+
+    # registered observances are compiled
+    registered = weekday_shifts((0, 0, 0, 0, 0, None, None))(lambda dt: dt)
+    rule = Holiday("Registered", month=3, day=1, observance=registered)
+    days = rule_dates(rule, "2000-01-01", "2010-12-31")
+    assert compile_rule(rule) is not None
+    assert days.tolist() == [d for d in pd.to_datetime([f"{y}-03-01" for y in range(2000, 2011)]) if d.weekday() < 5]
+
+    rule = Holiday(
+        "Vectorized",
+        month=3,
+        day=1,
+        observance=vectorized_observance(lambda days: days + np.timedelta64(1, "D"))(lambda dt: dt),
+    )
+    assert compile_rule(rule) is not None
+    assert rule_dates(rule, "2000-01-01", "2000-12-31").tolist() == [pd.Timestamp("2000-03-02")]
+
+
+@pytest.mark.parametrize("name", ["NYSE", "CME_Equity", "LSE", "JPX", "XKRX", "SIFMAUS"])
+def test_calendar_holidays(name):
+    calendar = mcal.get_calendar(name).regular_holidays
+    if not isinstance(calendar, AbstractHolidayCalendar):
+        pytest.skip("no holiday rules")
+
+    for start, end in [(None, None), ("2000-01-01", "2030-12-31")]:
+        assert_index_equal(calendar_holidays(calendar, start, end), calendar.holidays(start, end))
+
+    cal = mcal.get_calendar(name)
+    expected = pd.tseries.offsets.CustomBusinessDay(
+        holidays=cal.adhoc_holidays, calendar=cal.regular_holidays, weekmask=cal.weekmask
+    )
+    assert cal.holidays() == expected
+
+
+def test_rule_cache():
+    rule_cache.clear()
+    mcal.get_calendar("CFE").holidays()
+    entries, hits = len(rule_cache), rule_cache.hits
+    assert entries == len(mcal.get_calendar("CFE").regular_holidays.rules)
+
+    # CBOE_Index_Options has the same rules as CFE, they are not evaluated again
+    mcal.get_calendar("CBOE_Index_Options").holidays()
+    assert len(rule_cache) == entries
+    assert rule_cache.hits - hits == entries
+
+    rule = nyse.USMemorialDay
+    days = rule_dates(rule, "1970-01-01", "2200-12-31")
+    first, last, cached = rule_cache.get(rule)
+    assert (first, last) == (1970, 2201) and not cached.flags.writeable
+    assert_index_equal(days, rule.dates("1970-01-01", "2200-12-31"))
+
+    # rolling windows are sliced from the same days, wider ones widen them
+    rule, entries = nyse.USThanksgivingDay, len(rule_cache)
+    for year in range(2000, 2020):
+        start, end = f"{year}-03-01", f"{year + 5}-03-01"
+        assert_index_equal(rule_dates(rule, start, end), rule.dates(start, end))
+    assert len(rule_cache) == entries + 1
+    assert rule_cache.get(rule)[:2] == (1941, 2201)
+    # the end stays within the nanosecond range of pandas < 3
+    assert_index_equal(rule_dates(rule, "2000-01-01", "2260-12-31"), rule.dates("2000-01-01", "2260-12-31"))
+    assert rule_cache.get(rule)[:2] == (1941, 2261)
+
+
+def test_rule_cache_threads():
+    rule_cache.clear()
+    rules = [nyse.GoodFriday, nyse.USThanksgivingDay, nyse.ChristmasNYSE, cme.USThanksgivingFriday]
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda i: rule_dates(rules[i % 4], "1900-01-01", "2100-12-31"), range(64)))
+
+    for i, days in enumerate(results):
+        assert_index_equal(days, rules[i % 4].dates("1900-01-01", "2100-12-31"))
+    assert len(rule_cache) == len(rules)
+
+
+def test_calendar_holidays_single_year():
+    class Calendar(AbstractHolidayCalendar):
+        rules = [
+            Holiday("Once", year=1917, month=10, day=24, observance=nearest_workday),
+            nyse.USThanksgivingDayBefore1939,
+            nyse.ChristmasNYSE,
+        ]
+
+    calendar = Calendar()
+    for start, end in [("1900-01-01", "2030-12-31"), ("1917-10-24", "1917-10-24"), ("2015-01-01", "2025-12-31")]:
+        assert_index_equal(calendar_holidays(calendar, start, end), calendar.holidays(start, end))
+
+
+def test_rule_dates_out_of_range():
+    # the rules of other eras are not evaluated
+    rule_cache.clear()
+    rule = nyse.USThanksgivingDayBefore1939
+    assert len(rule_dates(rule, "2015-01-01", "2025-12-31")) == 0
+    assert len(rule_cache) == 0
@@ -1,11 +1,15 @@
 import datetime
 import os
 
+import numpy as np
 import pandas as pd
 from pandas.testing import assert_index_equal
 from zoneinfo import ZoneInfo
 
 from pandas_market_calendars.calendars.jpx import JPXExchangeCalendar
+from pandas_market_calendars.holidays import jpx_equinox as equinox
+from pandas_market_calendars.holidays.compiler import compile_rule, rule_dates
+from pandas_market_calendars.holidays.jp import JapanAutumnalEquinox, JapanVernalEquinox
 
 
 def test_time_zone():
@@ -222,6 +226,30 @@ def test_jpx_correctly_counts_jpx_vernal_equinox():
     assert pd.Timestamp("2019-03-20") in jpx_schedule.index
 
 
+def test_jpx_vectorized_equinox():
+    years = np.arange(1870, 2110)
+    vernal = [equinox.vernal_equinox(pd.Timestamp(year, 1, 1)) for year in years]
+    autumnal = [equinox.autumnal_equinox(pd.Timestamp(year, 1, 1)) for year in years]
+
+    for rule, expected in [(JapanVernalEquinox, vernal), (JapanAutumnalEquinox, autumnal)]:
+        assert compile_rule(rule) is not None
+        actual = rule_dates(rule, "1870-01-01", "2109-12-31")
+        assert_index_equal(actual, pd.DatetimeIndex(expected).astype(actual.dtype))
+
+    # Citizen's Day falls between Respect for the Aged Day (3rd Monday of September) and the equinox
+    citizen = pd.DatetimeIndex(equinox.autumnal_citizen_dates(1900, 2100))
+    respect_for_aged = pd.DatetimeIndex(
+        [pd.Timestamp(year, 9, 1) + pd.offsets.WeekOfMonth(week=2, weekday=0) for year in range(1900, 2100)]
+    )
+    expected = [
+        day + pd.Timedelta(days=1)
+        for day in respect_for_aged
+        if equinox.autumnal_equinox_for_year(day.year) - day == pd.Timedelta(days=2)
+    ]
+    assert citizen.tolist() == expected
+    assert pd.Timestamp("2026-09-22") in citizen
+
+
 def test_jpx_trading_days_since_1949(request):
     """
     Perform a full comparison of all known weekday trading days from 1949-05-16 to 2019-05-31 and
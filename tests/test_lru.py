@@ -0,0 +1,80 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from pandas_market_calendars.lru import LRUCache
+
+
+def test_max_entries():
+    cache = LRUCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.get("b") is None
+    assert cache.get("b", "default") == "default"
+    assert cache.info() == {
+        "entries": 2,
+        "nbytes": cache.nbytes,
+        "max_entries": 2,
+        "max_bytes": None,
+        "hits": 3,
+        "misses": 2,
+        "evictions": 1,
+    }
+
+    cache.max_entries = 1
+    assert len(cache) == 1 and "c" in cache
+    assert cache.evictions == 2
+
+
+def test_max_bytes():
+    array = np.zeros(100, dtype="int64")
+    series = pd.Series(array, index=pd.date_range("2020-01-01", periods=100))
+
+    cache = LRUCache(max_entries=None, max_bytes=3000)
+    cache.set("array", array)
+    assert cache.nbytes == 800
+    cache.set("series", series)  # values and index
+    assert cache.nbytes == 2400
+
+    # replacing an entry doesn't count it twice
+    cache.set("array", array)
+    assert cache.nbytes == 2400 and cache.evictions == 0
+
+    cache.set("other", array)
+    assert "series" not in cache and cache.nbytes == 1600
+    assert cache.evictions == 1
+
+    # values that don't fit at all are not stored
+    cache.set("big", np.zeros(1000))
+    assert "big" not in cache and cache.nbytes == 1600
+
+    cache.max_bytes = 1000
+    assert len(cache) == 1 and "other" in cache
+
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
+    assert cache.evictions == 3
+
+
+def test_threads():
+    cache = LRUCache(max_entries=10)
+
+    def work(offset):
+        for i in range(1000):
+            cache.set(offset + i, i)
+            cache.get(offset + i - 5)
+
+    threads = [threading.Thread(target=work, args=(n * 1000,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(cache) == 10
+    assert cache.evictions == 3990
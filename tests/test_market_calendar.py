@@ -20,13 +20,16 @@ import exchange_calendars as ecal
 import numpy as np
 import pandas as pd
 import pytest
+from pandas.errors import OutOfBoundsDatetime
 from pandas.testing import assert_frame_equal, assert_index_equal, assert_series_equal
 from pandas.tseries.holiday import AbstractHolidayCalendar
 from zoneinfo import ZoneInfo
 
 from pandas_market_calendars import get_calendar, get_calendar_names
+from pandas_market_calendars.calendar_utils import DATE_RANGE_DTYPE
 from pandas_market_calendars.calendars.mirror import TradingCalendar
 from pandas_market_calendars.calendars.nyse import NYSEExchangeCalendar
+from pandas_market_calendars.holidays.adhoc import adhoc_dates
 from pandas_market_calendars.holidays.nyse import Sept11Anniversary12pmLateOpen2002
 from pandas_market_calendars.holidays.us import (
     Christmas,
@@ -286,6 +289,51 @@ def test_special_dates():
     ]
 
 
+def test_special_dates_cache():
+    cal = FakeCalendar()
+    cal.special_dates_cache.max_entries = 5
+
+    for start in pd.date_range("2016-01-01", periods=50, freq="7D"):
+        cal.schedule(start, start + pd.Timedelta(days=30))
+    assert len(cal.special_dates_cache) == 5
+    assert cal.special_dates_cache.evictions > 0
+
+    special = cal.special_dates("market_open", "2016-12-10", "2016-12-31")
+    assert cal.special_dates("market_open", "2016-12-10", "2016-12-31") is special
+    assert cal.special_dates_cache.hits > 0
+
+    cal.special_dates_cache.max_bytes = special.memory_usage(index=True) * 2
+    assert cal.special_dates_cache.nbytes <= cal.special_dates_cache.max_bytes
+
+    cal.clear_special_dates_cache()
+    assert len(cal.special_dates_cache) == 0 and cal.special_dates_cache.nbytes == 0
+    assert cal.special_dates("market_open", "2016-12-10", "2016-12-31").equals(special)
+
+    # each instance has its own cache, with the limits of the class
+    other = FakeCalendar()
+    assert other.special_dates_cache is not cal.special_dates_cache
+    assert other.special_dates_cache.max_entries == FakeCalendar.special_dates_cache_entries
+
+    # the cached results are not pickled, the limits are
+    unpickled = pickle.loads(pickle.dumps(cal))
+    assert len(unpickled.special_dates_cache) == 0
+    assert unpickled.special_dates_cache.max_bytes == cal.special_dates_cache.max_bytes
+
+
+def test_special_dates_blocks():
+    cal = NYSEExchangeCalendar()
+    special = cal.special_dates("market_close", "2015-01-01", "2025-12-31")
+
+    # only the blocks of years spanned by the range are evaluated
+    assert ("market_close", 2000) in cal.special_dates_cache and ("market_close", 2025) in cal.special_dates_cache
+    assert ("market_close", 1925) not in cal.special_dates_cache
+
+    everything = cal.special_dates("market_close", "1885-01-01", "2200-12-31")
+    assert_series_equal(special, everything.loc["2015-01-01":"2025-12-31"])
+    assert everything.index.is_monotonic_increasing
+    assert everything.loc["1917-10-24"] == pd.Timestamp("1917-10-24 12:00", tz="America/New_York")
+
+
 def test_change_add_remove_time():
     cal = FakeCalendar()
 
@@ -629,6 +677,157 @@ def test_valid_dates():
     assert_index_equal(actual, expected)
 
 
+def test_class_cached_rules():
+    cal, other = FakeCalendar(), FakeCalendar()
+    assert cal.regular_holidays is other.regular_holidays
+    assert cal.special_closes is other.special_closes
+    assert cal._trading_day_blocks is other._trading_day_blocks
+
+    # subclasses evaluate their own rules
+    nyse, iex = get_calendar("NYSE"), get_calendar("IEX")
+    assert nyse.regular_holidays is not iex.regular_holidays
+    assert nyse._trading_day_blocks is not iex._trading_day_blocks
+    assert nyse._trading_day_bitmap.sum() != iex._trading_day_bitmap.sum()
+
+    with pytest.raises(AttributeError):
+        cal.regular_holidays = None
+
+    # holidays outside the span the holiday calendar caches are still found
+    holidays = cal._tryholidays(cal.regular_holidays, pd.Timestamp("2016-12-01"), pd.Timestamp("2017-01-31"))
+    assert holidays.tolist() == [pd.Timestamp("2016-12-26"), pd.Timestamp("2017-01-02")]
+
+
+def test_instance_holidays():
+    cal, other = FakeCalendar(), FakeCalendar()
+    other.valid_days("2016-12-01", "2017-01-31")
+
+    # an instance with its own holidays evaluates its own open days
+    holidays = pd.offsets.CustomBusinessDay(holidays=["2016-12-28"], weekmask=cal.weekmask)
+    cal.holidays = lambda: holidays
+    assert cal._trading_day_blocks is not other._trading_day_blocks
+    valid = cal.valid_days("2016-12-23", "2017-01-03", tz=None)
+    assert pd.Timestamp("2016-12-28") not in valid and pd.Timestamp("2016-12-26") in valid
+    assert not cal.is_trading_day("2016-12-28") and cal.is_trading_day("2016-12-26")
+    assert cal.trading_day_offset("2016-12-27", 1) == pd.Timestamp("2016-12-29")
+
+    # the other instances keep the open days of the class
+    assert other.is_trading_day("2016-12-28") and not other.is_trading_day("2016-12-26")
+    assert other.trading_day_offset("2016-12-27", 1) == pd.Timestamp("2016-12-28")
+    assert FakeCalendar()._trading_day_blocks is other._trading_day_blocks
+
+    # and so do the ad-hoc holidays set on an instance
+    adhoc = FakeCalendar()
+    vars(adhoc)["adhoc_holidays"] = [pd.Timestamp("2016-12-28")]
+    assert adhoc.adhoc_holidays == [pd.Timestamp("2016-12-28")]
+    assert not adhoc.is_trading_day("2016-12-28") and not adhoc.is_trading_day("2016-12-26")
+    assert other.is_trading_day("2016-12-28")
+
+
+def test_trading_day_blocks(monkeypatch):
+    nyse = NYSEExchangeCalendar()
+    expected = nyse.valid_days("2015-01-01", "2025-12-31")
+    offset = nyse.trading_day_offset(expected, 5)
+    between = nyse.trading_days_between(expected[:-5], expected[5:])
+    everything = nyse._trading_day_bitmap
+
+    # a fresh bitmap, only the blocks spanned by the range are evaluated, the pre 1952 calendar is not built
+    blocks, counts = {}, {}
+    monkeypatch.setattr(NYSEExchangeCalendar, "_trading_day_blocks", property(lambda self: blocks))
+    monkeypatch.setattr(NYSEExchangeCalendar, "_trading_day_block_counts", property(lambda self: counts))
+    monkeypatch.setattr(NYSEExchangeCalendar, "holidays_pre_1952", None)
+    assert_index_equal(nyse.valid_days("2015-01-01", "2025-12-31"), expected)
+    days = (np.array(["2015-01-01", "2025-12-31"], dtype="datetime64[D]") - nyse._bitmap_start).astype(np.int64)
+    spanned = list(range(days[0] // nyse._bitmap_block_days, days[1] // nyse._bitmap_block_days + 1))
+    assert sorted(blocks) == spanned
+
+    # and so are the trading day ordinals
+    assert_index_equal(nyse.trading_day_offset(expected, 5), offset)
+    np.testing.assert_array_equal(nyse.trading_days_between(expected[:-5], expected[5:]), between)
+    assert sorted(blocks) == sorted(counts) == spanned
+
+    # ranges across blocks are the same as slicing the whole bitmap
+    monkeypatch.undo()
+    first, last = np.datetime64("1900-03-01"), np.datetime64("2160-10-31")
+    i = int((first - nyse._bitmap_start).astype(np.int64))
+    np.testing.assert_array_equal(
+        nyse._open_day_slice(first, last), everything[i : i + int((last - first).astype(np.int64)) + 1]
+    )
+    assert len(everything) == int((nyse._bitmap_end - nyse._bitmap_start).astype(np.int64)) + 1
+
+
+def test_is_trading_day():
+    cal = FakeCalendar()
+
+    dates = pd.date_range("2016-12-23", "2017-01-03")
+    expected = dates.isin(cal.valid_days("2016-12-23", "2017-01-03", tz=None))
+    np.testing.assert_array_equal(cal.is_trading_day(dates), expected)
+    np.testing.assert_array_equal(cal.is_trading_day(dates[::-1]), expected[::-1])
+
+    # time and timezone information is ignored
+    assert cal.is_trading_day(pd.Timestamp("2016-12-23 23:00", tz="Asia/Ulaanbaatar"))
+    assert not cal.is_trading_day("2016-12-25")
+    np.testing.assert_array_equal(cal.is_trading_day([pd.NaT, "2016-12-27"]), [False, True])
+    assert cal.is_trading_day([]).shape == (0,)
+
+    # dates outside the precomputed bitmap are evaluated on the fly
+    assert cal.is_trading_day("1700-01-01") and not cal.is_trading_day("1700-01-02")
+    if np.datetime_data(DATE_RANGE_DTYPE)[0] == "ns":
+        # before pandas 3, the dates after 2262-04-11 can't be represented
+        for start, end in [("2300-01-01", "2300-01-07"), ("2262-04-01", "2262-04-20")]:
+            with pytest.raises(OutOfBoundsDatetime):
+                cal.valid_days(start, end, tz=None)
+        with pytest.raises(OutOfBoundsDatetime):
+            cal.trading_day_offset("2262-04-08", 5)
+    else:
+        assert_index_equal(
+            cal.valid_days("2300-01-01", "2300-01-07", tz=None), pd.bdate_range("2300-01-01", "2300-01-07")
+        )
+
+
+def test_trading_day_offset():
+    cal = FakeCalendar()
+    # 2016-12-26 and 2017-01-02 are holidays
+    assert cal.trading_day_offset("2016-12-23", 1) == pd.Timestamp("2016-12-27")
+    assert cal.trading_day_offset(pd.Timestamp("2016-12-27 23:00", tz="Asia/Ulaanbaatar"), -1) == pd.Timestamp(
+        "2016-12-23"
+    )
+    assert cal.trading_day_offset("2016-12-30", 0) == pd.Timestamp("2016-12-30")
+
+    with pytest.raises(ValueError):
+        cal.trading_day_offset("2016-12-26", 1)
+    assert cal.trading_day_offset("2016-12-26", 1, roll="forward") == pd.Timestamp("2016-12-28")
+    assert cal.trading_day_offset("2016-12-26", 1, roll="backward") == pd.Timestamp("2016-12-27")
+    assert cal.trading_day_offset("2016-12-26", 0, roll="backward") == pd.Timestamp("2016-12-23")
+
+    # arrays with one n per date, or the same for all, match CustomBusinessDay arithmetic
+    dates = cal.valid_days("2000-01-01", "2020-12-31", tz=None)[::97]
+    n = np.arange(len(dates)) % 41 - 20
+    assert_index_equal(
+        cal.trading_day_offset(dates, n), pd.DatetimeIndex([d + k * cal.holidays() for d, k in zip(dates, n)])
+    )
+    assert_index_equal(cal.trading_day_offset(dates, 3), pd.DatetimeIndex([d + 3 * cal.holidays() for d in dates]))
+    assert_index_equal(cal.trading_day_offset(["2016-12-23", pd.NaT], 1), pd.DatetimeIndex(["2016-12-27", pd.NaT]))
+
+    # dates outside the precomputed bitmap
+    assert cal.trading_day_offset("1700-01-01", 1) == pd.Timestamp("1700-01-04")
+    assert cal.trading_day_offset("2200-12-30", 5) == pd.Timestamp("2201-01-06")
+
+
+def test_trading_days_between():
+    cal = FakeCalendar()
+    assert cal.trading_days_between("2016-12-23", "2016-12-30") == 4
+    assert cal.trading_days_between("2016-12-30", "2016-12-23") == -4
+    assert cal.trading_days_between("2016-12-26", "2016-12-26") == 0
+
+    starts = cal.valid_days("2000-01-01", "2020-12-31", tz=None)[::97]
+    ends = starts + pd.to_timedelta(np.arange(len(starts)) % 60, "D")
+    np.testing.assert_array_equal(
+        cal.trading_days_between(starts, ends),
+        np.busday_count(starts.values.astype("M8[D]"), ends.values.astype("M8[D]"), busdaycal=cal.holidays().calendar),
+    )
+    np.testing.assert_array_equal(cal.trading_days_between(starts[:3], "2020-01-01"), [5175, 5078, 4981])
+
+
 def test_schedule():
     cal = FakeCalendar()
     assert cal.open_time == time(11, 13)
@@ -837,6 +1036,70 @@ def test_custom_schedule():
     ]
 
 
+def test_conform_to_special_times():
+    index = pd.DatetimeIndex(["2016-12-29", "2016-12-30", "2017-01-03"])
+    times = {
+        "pre": ["2016-12-29 14:00", None, "2017-01-03 14:00"],
+        "market_open": ["2016-12-29 15:20", "2016-12-30 14:30", "2017-01-03 14:30"],
+        "market_close": ["2016-12-29 17:00", "2016-12-30 15:40", "2017-01-03 17:00"],
+        "post": ["2016-12-29 18:00", "2016-12-30 18:00", "2017-01-03 18:00"],
+    }
+    schedule = pd.DataFrame({col: pd.to_datetime(t, utc=True) for col, t in times.items()}, index=index)
+    if hasattr(schedule["post"].dt, "as_unit"):
+        # a column with another resolution, which only exists since pandas 2
+        schedule["post"] = schedule["post"].dt.as_unit("s")
+
+    MarketCalendar._conform_to_special_times(
+        schedule, pd.DatetimeIndex(["2016-12-29", "2016-12-30"]), pd.DatetimeIndex(["2016-12-30"])
+    )
+    assert schedule.loc["2016-12-29"].astype(str).tolist() == [
+        "2016-12-29 15:20:00+00:00",
+        "2016-12-29 15:20:00+00:00",
+        "2016-12-29 17:00:00+00:00",
+        "2016-12-29 18:00:00+00:00",
+    ]
+    # NaT is left alone, and the dtypes are kept
+    assert pd.isna(schedule.loc["2016-12-30", "pre"])
+    assert schedule.loc["2016-12-30"].iloc[1:].astype(str).tolist() == [
+        "2016-12-30 14:30:00+00:00",
+        "2016-12-30 15:40:00+00:00",
+        "2016-12-30 15:40:00+00:00",
+    ]
+    assert schedule.loc["2017-01-03", "pre"] == pd.Timestamp("2017-01-03 14:00", tz="UTC")
+    assert schedule["post"].dt.unit == "s"
+
+
+@pytest.mark.parametrize(
+    "cal, start, end",
+    [
+        (FakeCalendar(), "2000-01-01", "2020-12-31"),
+        (FakeETHCalendar(), "2016-12-01", "2017-01-31"),
+        (FakeBreakCalendar(), "2016-12-01", "2017-01-31"),
+        (NYSEExchangeCalendar(), "1950-01-01", "1953-12-31"),  # saturday closes
+        (get_calendar("XHKG"), "2010-01-01", "2011-12-31"),
+    ],
+)
+def test_schedule_numpy_engine(cal, start, end):
+    for kwargs in (
+        {},
+        {"market_times": "all"},
+        {"market_times": "all", "force_special_times": False},
+        {"market_times": "all", "force_special_times": None, "tz": cal.tz},
+        {"start": "market_open", "end": "market_close", "interruptions": True},
+    ):
+        expected = cal.schedule(start, end, **kwargs)
+        assert_frame_equal(cal.schedule(start, end, engine="numpy", **kwargs), expected)
+
+    days = cal.valid_days(start, end)
+    assert_frame_equal(
+        cal.schedule_from_days(days[::7], market_times="all", engine="numpy"),
+        cal.schedule_from_days(days[::7], market_times="all"),
+    )
+
+    with pytest.raises(ValueError):
+        cal.schedule(start, end, engine="polars")
+
+
 def test_schedule_w_breaks():
     cal = FakeBreakCalendar()
     assert cal.open_time == time(9, 30)
@@ -1058,6 +1321,19 @@ def test_adhoc_holidays():
     assert pd.Timestamp("2012-10-31") in days
 
 
+def test_adhoc_holidays_index():
+    class IndexCalendar(FakeCalendar):
+        @property
+        def adhoc_holidays(self):
+            return adhoc_dates([day.strftime("%Y-%m-%d") for day in super().adhoc_holidays], tz="UTC")
+
+    cal, index_cal = FakeCalendar(), IndexCalendar()
+    assert isinstance(index_cal.adhoc_holidays, pd.DatetimeIndex)
+    assert index_cal.holidays() == cal.holidays()
+    assert index_cal.holidays().holidays == cal.holidays().holidays
+    assert_frame_equal(index_cal.schedule("2012-10-15", "2012-11-15"), cal.schedule("2012-10-15", "2012-11-15"))
+
+
 def test_special_opens():
     cal = FakeCalendar()
     results = cal.schedule("2012-07-01", "2012-07-06")
@@ -1367,6 +1643,38 @@ def test_open_at_time_interruptions():
     assert cal.open_at_time(sched, "2010-01-13 17:05:00", only_rth=True) is False
 
 
+def test_open_at_times():
+    cal = FakeBreakCalendar()
+    cal.add_time("pre", time(8))
+    cal.add_time("post", time(13))
+    sched = cal.schedule("2010-01-08", "2010-01-14", market_times="all", interruptions=True, tz=cal.tz)
+    sched.iloc[2, [-4, -3]] = pd.to_datetime(["2010-01-12 08:05:00", "2010-01-12 08:07:00"]).tz_localize(cal.tz)
+
+    # every minute and every time in the schedule agree with open_at_time
+    timestamps = pd.date_range("2010-01-08 13:00", "2010-01-14 18:00", freq="17min", tz="UTC").append(
+        pd.DatetimeIndex(sched.stack().dt.tz_convert("UTC"))
+    )
+    for include_close in (False, True):
+        for only_rth in (False, True):
+            bounds = cal._open_close_bounds(sched.columns, only_rth)
+            ts = timestamps[(timestamps >= sched[bounds[0]].iat[0]) & (timestamps <= sched[bounds[1]].iat[-1])]
+            expected = [cal.open_at_time(sched, t, include_close, only_rth) for t in ts]
+            np.testing.assert_array_equal(cal.open_at_times(sched, ts, include_close, only_rth), expected)
+
+    # naive timestamps are assumed to be UTC, numpy arrays and lists work too
+    assert cal.open_at_times(sched, np.array(["2010-01-12 13:01", "2010-01-12 13:06"], dtype="M8[s]")).tolist() == [
+        True,
+        False,
+    ]
+    assert cal.open_at_times(sched, ["2010-01-12 16:55"], include_close=True).tolist() == [True]
+    assert cal.open_at_times(sched, []).shape == (0,)
+
+    with pytest.raises(ValueError):
+        cal.open_at_times(sched, ["2010-01-12 13:01", "2010-01-15 13:01"])
+    with pytest.raises(ValueError):
+        cal.open_at_times(sched.rename(columns={"pre": "other"}), ["2010-01-12 13:01"])
+
+
 def test_is_open_now(patch_get_current_time):
     cal = FakeCalendar()
 
@@ -1375,6 +1683,58 @@ def test_is_open_now(patch_get_current_time):
     assert cal.is_open_now(schedule) is True
 
 
+def test_next_previous_open_close():
+    cal = FakeCalendar()
+    # 2016-12-23 is a regular day (11:13 - 11:49 in Ulaanbaatar), 2016-12-26 a holiday
+    t = pd.Timestamp("2016-12-23 03:30", tz="UTC")
+    assert cal.next_open(t) == pd.Timestamp("2016-12-27 03:13", tz="UTC")
+    assert cal.previous_open(t) == pd.Timestamp("2016-12-23 03:13", tz="UTC")
+    assert cal.next_close(t) == pd.Timestamp("2016-12-23 03:49", tz="UTC")
+    assert cal.previous_close(t) == pd.Timestamp("2016-12-22 03:49", tz="UTC")
+
+    # equal times are excluded, naive timestamps are UTC
+    assert cal.next_open("2016-12-23 03:13") == pd.Timestamp("2016-12-27 03:13", tz="UTC")
+    assert cal.previous_close("2016-12-23 03:49") == pd.Timestamp("2016-12-22 03:49", tz="UTC")
+
+    # arrays across years
+    schedule = cal.schedule("2000-01-01", "2020-12-31")
+    opens = pd.DatetimeIndex(schedule.market_open).rename(None)
+    closes = pd.DatetimeIndex(schedule.market_close).rename(None)
+    timestamps = closes[::50] - pd.Timedelta("1min")
+    assert_index_equal(cal.next_close(timestamps), closes[::50])
+    assert_index_equal(cal.previous_open(timestamps), opens[::50])
+    assert_index_equal(cal.next_open(timestamps), opens[1::50])
+    assert len(cal.next_open([])) == 0
+
+    # NaT stays NaT
+    timestamps = pd.DatetimeIndex(["2016-12-23 03:30", None], tz="UTC")
+    assert_index_equal(cal.next_open(timestamps), pd.DatetimeIndex(["2016-12-27 03:13", None], tz="UTC"))
+    assert_index_equal(cal.previous_close(timestamps), pd.DatetimeIndex(["2016-12-22 03:49", None], tz="UTC"))
+    assert cal.next_close(pd.NaT) is pd.NaT
+    assert cal.session_containing([None, "2016-12-23 03:30"]).tolist() == [pd.NaT, pd.Timestamp("2016-12-23")]
+
+    # changing the regular times resets the arrays
+    cal.change_time("market_open", time(11, 30))
+    assert cal.next_open(t) == pd.Timestamp("2016-12-27 03:30", tz="UTC")
+
+
+def test_session_containing():
+    cal = FakeBreakCalendar()
+    assert cal.session_containing(pd.Timestamp("2016-12-28 09:30", tz="America/New_York")) == pd.Timestamp("2016-12-28")
+    # during the break, at the close and on a holiday
+    assert cal.session_containing(pd.Timestamp("2016-12-28 10:30", tz="America/New_York")) == pd.Timestamp("2016-12-28")
+    assert cal.session_containing(pd.Timestamp("2016-12-28 12:00", tz="America/New_York")) is pd.NaT
+    assert cal.session_containing(pd.Timestamp("2016-12-26 10:00", tz="America/New_York")) is pd.NaT
+
+    # late open on 2016-12-29
+    sessions = cal.session_containing(["2016-12-27 15:00", "2016-12-27 22:00", "2016-12-29 15:00", "2016-12-29 15:30"])
+    assert_index_equal(sessions, pd.DatetimeIndex(["2016-12-27", pd.NaT, pd.NaT, "2016-12-29"]))
+
+    # sessions that start on the previous day
+    cal = get_calendar("CME_Equity")
+    assert cal.session_containing("2020-03-02 23:30") == pd.Timestamp("2020-03-03")
+
+
 def test_bad_dates():
     cal = FakeCalendar()
 
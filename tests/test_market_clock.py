@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import pandas_market_calendars as mcal
+from pandas_market_calendars.market_calendar import MarketCalendar
+from tests.test_market_calendar import FakeBreakCalendar
+
+
+@pytest.mark.parametrize(
+    "cal, kwargs",
+    [
+        (mcal.get_calendar("NYSE"), {"market_times": "all"}),
+        (mcal.get_calendar("NYSE"), {"market_times": "all", "only_rth": True, "include_close": True}),
+        (mcal.get_calendar("CME_Equity"), {}),
+        (FakeBreakCalendar(), {"interruptions": True}),
+    ],
+)
+def test_is_open(cal, kwargs):
+    only_rth, include_close = kwargs.pop("only_rth", False), kwargs.pop("include_close", False)
+    schedule = cal.schedule("2009-11-01", "2010-03-31", **kwargs)
+    timestamps = pd.date_range("2009-12-01", "2010-02-28", freq="17min", tz="UTC").append(
+        pd.DatetimeIndex(schedule.stack().dt.tz_convert("UTC"))
+    )
+    timestamps = timestamps[(timestamps >= "2009-12-01") & (timestamps < "2010-02-28")].sort_values()
+
+    # a short window makes the clock move on to new windows a few times
+    clock = mcal.MarketClock(cal, include_close=include_close, only_rth=only_rth, days=5, **kwargs)
+    expected = cal.open_at_times(schedule, timestamps, include_close=include_close, only_rth=only_rth)
+    np.testing.assert_array_equal([clock.is_open(t) for t in timestamps], expected)
+
+    # going back in time
+    np.testing.assert_array_equal([clock.is_open(t) for t in timestamps[::-50]], expected[::-50])
+
+
+def test_next_open_close():
+    nyse = mcal.get_calendar("NYSE")
+    clock = mcal.MarketClock(nyse)
+
+    # Friday afternoon before the July 4th weekend
+    now = pd.Timestamp("2024-07-03 15:00", tz="UTC")
+    assert clock.is_open(now) is True
+    assert clock.next_close(now) == pd.Timestamp("2024-07-03 17:00", tz="UTC")  # early close
+    assert clock.next_open(now) == pd.Timestamp("2024-07-05 13:30", tz="UTC")
+    assert clock.seconds_until_change(now) == 2 * 3600
+
+    # at the close
+    now = pd.Timestamp("2024-07-03 17:00", tz="UTC")
+    assert clock.is_open(now) is False
+    assert clock.next_close(now) == pd.Timestamp("2024-07-05 20:00", tz="UTC")
+    assert clock.seconds_until_change(now) == pd.Timedelta("1D20h30min").total_seconds()
+
+    # breaks and pre/post sessions
+    cal = FakeBreakCalendar()
+    clock = mcal.MarketClock(cal, market_times="all")
+    now = pd.Timestamp("2016-12-28 09:50", tz="America/New_York")
+    assert clock.next_close(now) == pd.Timestamp("2016-12-28 10:00", tz="America/New_York")
+    assert clock.next_open(now) == pd.Timestamp("2016-12-28 11:00", tz="America/New_York")
+
+    # a market that never closes
+    clock = mcal.MarketClock(mcal.get_calendar("24/7"))
+    assert clock.is_open("2024-01-01 12:00") is True
+    assert clock.next_close("2024-01-01 12:00") is None
+    assert clock.seconds_until_change("2024-01-01 12:00") is None
+
+
+def test_long_closure():
+    # the 1996 Spring Festival closure of the SSE lasted from February 17th to March 3rd
+    sse = mcal.get_calendar("SSE")
+    clock = mcal.MarketClock(sse)
+    assert clock.is_open("1996-03-02 03:00") is False
+    assert clock.next_open("1996-03-02 03:00") == pd.Timestamp("1996-03-04 01:30", tz="UTC")
+    assert clock.next_close("1996-03-02 03:00") == pd.Timestamp("1996-03-04 03:30", tz="UTC")
+
+
+def test_seconds_until_change_now(monkeypatch):
+    # the current time is read once, even when it moves on while the change is looked up
+    times = iter(pd.date_range("2024-07-03 15:00", periods=3, freq="1h", tz="UTC"))
+    monkeypatch.setattr(MarketCalendar, "_get_current_time", lambda: next(times))
+    assert mcal.MarketClock(mcal.get_calendar("NYSE")).seconds_until_change() == 2 * 3600
+
+
+def test_from_schedule(monkeypatch):
+    nyse = mcal.get_calendar("NYSE")
+    schedule = nyse.schedule("2024-01-02", "2024-01-05", market_times="all")
+    clock = mcal.MarketClock(nyse, schedule)
+    assert clock.market_times == ["pre", "market_open", "market_close", "post"]
+
+    monkeypatch.setattr(MarketCalendar, "_get_current_time", lambda: pd.Timestamp("2024-01-03 22:00", tz="UTC"))
+    assert clock.is_open() is True  # post market
+    assert clock.next_close() == pd.Timestamp("2024-01-04 01:00", tz="UTC")
+
+    # runs past the schedule
+    assert clock.is_open("2024-02-05 10:00") is True
+    assert clock.next_open("2024-02-05 10:00") == pd.Timestamp("2024-02-06 09:00", tz="UTC")
+
+    with pytest.raises(ValueError):
+        mcal.MarketClock(nyse, schedule.rename(columns={"pre": "other"}))
@@ -1,5 +1,7 @@
 import datetime as dt
 import os
+import subprocess
+import sys
 
 import pandas as pd
 import pytest
@@ -7,6 +9,7 @@ from pandas.testing import assert_index_equal, assert_series_equal
 from zoneinfo import ZoneInfo
 
 from pandas_market_calendars.calendars.nyse import NYSEExchangeCalendar
+from pandas_market_calendars.holidays import nyse as nyse_holidays
 
 
 def test_custom_open_close():
@@ -141,6 +144,66 @@ def test_valid_days_tz_aware():
     assert_index_equal(actual, expected)
 
 
+def test_valid_days_saturdays():
+    cal = NYSEExchangeCalendar()
+
+    # Saturday trading ended Sept 27th, 1952
+    valid = cal.valid_days("1952-05-01", "1952-10-10", tz=None)
+    assert pd.Timestamp("1952-05-24") in valid
+    assert pd.Timestamp("1952-10-04") not in valid
+    assert_index_equal(valid, valid[(valid < "1952-09-29") | (valid.weekday < 5)])
+
+    # a range that spans the change matches the ranges on either side of it
+    pre = cal.valid_days("1952-05-01", "1952-09-28", tz=None)
+    post = cal.valid_days("1952-09-29", "1952-10-10", tz=None)
+    assert_index_equal(valid, pre.append(post))
+    assert cal.is_trading_day(valid).all()
+    assert not cal.is_trading_day(["1952-10-04", "2024-12-25"]).any()
+
+
+def test_valid_days_freq():
+    cal = NYSEExchangeCalendar()
+
+    # the open days carry the CustomBusinessDay of the calendar, like pd.date_range
+    valid = cal.valid_days("2000-01-01", "2001-01-01")
+    expected = pd.date_range("2000-01-01", "2001-01-01", freq=cal.holidays(), normalize=True, tz="UTC")
+    assert_index_equal(valid, expected)
+    assert valid.freq == expected.freq
+    assert cal.valid_days("1952-05-01", "1952-09-27").freq.weekmask == "Mon Tue Wed Thu Fri Sat"
+
+    # no single freq for a range across the end of Saturday trading
+    assert cal.valid_days("1952-05-01", "1952-10-10").freq is None
+
+
+def test_valid_days_tz_none():
+    cal = NYSEExchangeCalendar()
+
+    # tz-aware dates are converted to UTC and the days are naive
+    start, end = pd.Timestamp("2024-01-02 20:00", tz="America/New_York"), pd.Timestamp("2024-01-05", tz="Asia/Tokyo")
+    valid = cal.valid_days(start, end, tz=None)
+    assert valid.tz is None
+    assert_index_equal(valid, pd.DatetimeIndex(["2024-01-03", "2024-01-04"], dtype=valid.dtype, freq=cal.holidays()))
+
+
+def test_adhoc_dates():
+    # the ad-hoc lists are stored as DatetimeIndexes in UTC, the calendar still gives a list of their Timestamps
+    assert isinstance(nyse_holidays.SatAfterGoodFridayAdhoc, pd.DatetimeIndex)
+    assert str(nyse_holidays.SatAfterGoodFridayAdhoc.tz) == "UTC"
+    assert nyse_holidays.SatBeforeNewYearsAdhoc.tolist() == [pd.Timestamp("1916-12-30", tz="UTC")]
+    assert nyse_holidays.NewYearsEve1pmCloseAdhoc.empty
+
+    adhoc = NYSEExchangeCalendar().adhoc_holidays
+    assert pd.Timestamp("2012-10-29", tz="UTC") in adhoc and pd.Timestamp("1900-04-14", tz="UTC") in adhoc
+
+    # the runs of business days are the same dates as with a CustomBusinessDay
+    for days, weekmask in [
+        (nyse_holidays.OnsetOfWWI1914, "Mon Tue Wed Thu Fri Sat"),
+        (nyse_holidays.PaperworkCrisis3pmEarlyCloses1969to1970, "Mon Tue Wed Thu Fri"),
+    ]:
+        expected = pd.date_range(days[0], days[-1], freq=pd.offsets.CustomBusinessDay(weekmask=weekmask))
+        assert days.tolist() == expected.tolist()
+
+
 def test_time_zone():
     assert NYSEExchangeCalendar().tz == ZoneInfo("America/New_York")
     assert NYSEExchangeCalendar().name == "NYSE"
@@ -433,6 +496,29 @@ def test_juneteenth():
     assert pd.Timestamp("6/19/2023", tz="UTC") not in good_dates
 
 
+def test_pre_1952_catalog_is_lazy():
+    # the holidays and special times that all lie before Sept. 29, 1952 are only loaded for earlier dates
+    code = (
+        "import sys; import pandas_market_calendars as mcal; "
+        "nyse = mcal.get_calendar('NYSE'); "
+        "nyse.schedule('2015-01-01', '2025-12-31'); "
+        "nyse.trading_day_offset('2015-01-02', 250); "
+        "assert 'pandas_market_calendars.holidays.nyse_pre1952' not in sys.modules; "
+        "nyse.schedule('1952-01-02', '1952-12-31'); "
+        "assert 'pandas_market_calendars.holidays.nyse_pre1952' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+    # they remain attributes of holidays.nyse
+    from pandas.tseries.holiday import Holiday
+
+    from pandas_market_calendars.holidays import nyse_pre1952
+
+    defined = {name for name, obj in vars(nyse_pre1952).items() if isinstance(obj, (Holiday, pd.DatetimeIndex))}
+    assert defined == nyse_holidays._PRE_1952
+    assert nyse_holidays.SatClosings1952 is nyse_pre1952.SatClosings1952
+
+
 if __name__ == "__main__":
     print("runing open")
     test_days_at_time_open()
@@ -26,6 +26,13 @@ def test_weekmask():
     assert nyse.holidays_pre_1952().weekmask == "Mon Tue Wed Thu Fri Sat"
 
 
+def test_holidays_pre_1952():
+    expected = CustomBusinessDay(
+        holidays=nyse.adhoc_holidays, calendar=nyse.regular_holidays, weekmask=nyse.weekmask_pre_1952
+    )
+    assert nyse.holidays_pre_1952() == expected
+
+
 def _test_holidays(holidays, start, end):
     df = pd.DataFrame(nyse.holidays().holidays, columns=["holidays"])
     mask = (df["holidays"] >= start) & (df["holidays"] <= end)
@@ -0,0 +1,137 @@
+import os
+from datetime import time
+
+import numpy as np
+import pytest
+from pandas.testing import assert_frame_equal
+
+import pandas_market_calendars as mcal
+from pandas_market_calendars.calendars.nyse import NYSEExchangeCalendar
+from pandas_market_calendars.schedule_cache import ScheduleCache, get_schedule_cache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    yield mcal.enable_schedule_cache(tmp_path)
+    mcal.disable_schedule_cache()
+
+
+def test_enable_disable(tmp_path):
+    assert get_schedule_cache() is None
+    cache = mcal.enable_schedule_cache(tmp_path / "cache")
+    assert get_schedule_cache() is cache
+    assert os.path.isdir(cache.directory)
+
+    mcal.disable_schedule_cache()
+    assert get_schedule_cache() is None
+
+
+def test_cached_schedule_matches(cache):
+    nyse = mcal.get_calendar("NYSE")
+    cached = nyse.schedule("1950-01-01", "1960-12-31", market_times="all")
+    assert len(os.listdir(cache.directory)) == 1
+
+    mcal.disable_schedule_cache()
+    expected = nyse.schedule("1950-01-01", "1960-12-31", market_times="all")
+    assert_frame_equal(cached, expected)
+
+    # slices of the stored years and extensions of them are served from the same file
+    mcal.enable_schedule_cache(cache.directory)
+    for start, end, tz in [
+        ("1952-09-20", "1952-10-10", "UTC"),
+        ("1940-06-01", "1951-01-01", "America/New_York"),
+        ("1955-01-01", "1970-12-31", "UTC"),
+    ]:
+        cached = nyse.schedule(start, end, tz=tz)
+        mcal.disable_schedule_cache()
+        assert_frame_equal(cached, nyse.schedule(start, end, tz=tz))
+        mcal.enable_schedule_cache(cache.directory)
+
+    assert len(os.listdir(cache.directory)) == 2  # all market times & market_open/market_close
+    stored = np.load(os.path.join(cache.directory, os.listdir(cache.directory)[0]), mmap_mode="r")
+    assert isinstance(stored, np.memmap)
+
+
+def test_cached_schedule_empty(cache):
+    nyse = mcal.get_calendar("NYSE")
+    assert nyse.schedule("2024-12-25", "2024-12-25").empty
+    assert nyse.schedule("2024-12-21", "2024-12-22").empty
+
+
+class InterruptedCalendar(NYSEExchangeCalendar):
+    aliases = ["CacheTestInterrupted"]
+
+    @property
+    def interruptions(self):
+        return [
+            ("2010-01-11", time(11), time(11, 1)),
+            ("2012-01-13", time(9, 59), time(10), time(10, 29), time(10, 30)),
+        ]
+
+
+def test_cached_schedule_interruptions(cache):
+    cal = InterruptedCalendar()
+    cached = cal.schedule("2010-01-01", "2012-12-31", interruptions=True)
+    assert "interruption_start_2" in cached.columns
+
+    # interruption columns that are empty in the requested range are dropped
+    sliced = cal.schedule("2010-01-01", "2010-12-31", interruptions=True)
+    assert "interruption_start_2" not in sliced.columns
+
+    mcal.disable_schedule_cache()
+    assert_frame_equal(cached, cal.schedule("2010-01-01", "2012-12-31", interruptions=True))
+    assert_frame_equal(sliced, cal.schedule("2010-01-01", "2010-12-31", interruptions=True))
+
+
+def test_cache_key(cache):
+    nyse = mcal.get_calendar("NYSE")
+    default = cache.key(nyse, ["market_open", "market_close"], True, False)
+    assert default.startswith("NYSE-")
+    assert default == cache.key(mcal.get_calendar("NYSE"), ["market_open", "market_close"], True, False)
+
+    assert default != cache.key(nyse, ["market_open", "market_close"], False, False)
+    assert default != cache.key(nyse, ["pre", "market_open", "market_close"], True, False)
+
+    nyse.change_time("market_open", time(10))
+    assert default != cache.key(nyse, ["market_open", "market_close"], True, False)
+
+    # same times, different open_close_map
+    changed, ignored = mcal.get_calendar("NYSE"), mcal.get_calendar("NYSE")
+    changed.change_time("market_close", changed.regular_market_times["market_close"])
+    ignored.change_time("market_close", ignored.regular_market_times["market_close"], opens=None)
+    assert cache.key(changed, ["market_open", "market_close"], True, False) != cache.key(
+        ignored, ["market_open", "market_close"], True, False
+    )
+
+    custom = nyse.schedule("2020-01-01", "2020-01-31")
+    assert (custom.market_open.dt.tz_convert(nyse.tz).dt.hour == 10).all()
+    assert (mcal.get_calendar("NYSE").schedule("2020-01-01", "2020-01-31").market_open.dt.minute == 30).all()
+
+
+def test_cache_key_exchange_calendars_version(cache, monkeypatch):
+    import exchange_calendars
+
+    xlon = mcal.get_calendar("XLON")
+    cached = xlon.schedule("2020-01-01", "2020-12-31")
+    (stored,) = os.listdir(cache.directory)
+    assert f"-ec{exchange_calendars.__version__}-" in stored
+
+    # the stored schedule is not served after an upgrade of exchange_calendars
+    monkeypatch.setattr(exchange_calendars, "__version__", "0.0.0")
+    assert_frame_equal(xlon.schedule("2020-01-01", "2020-12-31"), cached)
+    assert len(os.listdir(cache.directory)) == 2
+    assert any("-ec0.0.0-" in file for file in os.listdir(cache.directory))
+
+    # the calendars of this package don't depend on it
+    nyse = mcal.get_calendar("NYSE")
+    assert "0.0.0" not in cache.key(nyse, ["market_open", "market_close"], True, False)
+
+
+def test_clear(tmp_path):
+    cache = ScheduleCache(tmp_path)
+    nyse = mcal.get_calendar("NYSE")
+    cache.schedule(nyse, *nyse.clean_dates("2020-01-01", "2020-12-31"), "UTC", ["market_open"], True, False)
+    assert len(os.listdir(tmp_path)) == 1
+
+    cache.clear()
+    assert len(os.listdir(tmp_path)) == 0
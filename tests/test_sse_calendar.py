@@ -1,10 +1,13 @@
 import datetime
 
+import numpy as np
 import pandas as pd
+from pandas.testing import assert_index_equal
 from zoneinfo import ZoneInfo
 
 from pandas_market_calendars.calendars.sse import SSEExchangeCalendar
 from pandas_market_calendars.holidays.cn import all_holidays
+from pandas_market_calendars.holidays.compiler import compile_rule, observance_kernel, rule_dates
 
 
 all_holidays = pd.DatetimeIndex(all_holidays)
@@ -47,3 +50,15 @@ def test_sse_closes_at_lunch():
         schedule=sse_schedule,
         timestamp=datetime.datetime(2015, 1, 14, 12, 0, tzinfo=ZoneInfo("Asia/Shanghai")),
     )
+
+
+def test_sse_compiled_holidays():
+    rules = SSEExchangeCalendar().regular_holidays.rules
+    days = np.arange(np.datetime64("2000-01-01"), np.datetime64("2100-01-01"), np.timedelta64(5, "D"))
+
+    for rule in rules:
+        assert compile_rule(rule) is not None, rule
+        assert_index_equal(rule_dates(rule, "2020-01-01", "2099-12-31"), rule.dates("2020-01-01", "2099-12-31"))
+        if rule.observance is not None:
+            expected = [rule.observance(pd.Timestamp(day)) for day in days]
+            np.testing.assert_array_equal(observance_kernel(rule.observance)(days), pd.DatetimeIndex(expected).values)
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import pandas_market_calendars as mcal
+from tests.test_market_calendar import FakeCalendar
+
+
+def test_trading_day_matrix():
+    names = ["NYSE", "LSE", "XHKG", "IEX", "24/7"]
+    fake = FakeCalendar()
+    matrix = mcal.trading_day_matrix([*names, fake], "2013-08-01", "2017-01-31")
+    assert matrix.names == [*names, fake.name]
+    assert len(matrix.dates) == len(pd.date_range("2013-08-01", "2017-01-31"))
+
+    # each column holds the valid days of its calendar
+    for name, column in zip(matrix.names, matrix.values.T):
+        cal = fake if name == fake.name else mcal.get_calendar(name)
+        expected = cal.valid_days("2013-08-01", "2017-01-31", tz=None)
+        pd.testing.assert_index_equal(matrix.dates[column], expected)
+
+    frame = matrix.to_frame()
+    assert list(frame.columns) == matrix.names
+    assert frame.loc["2016-07-04"].tolist() == [False, True, True, False, True, True]
+
+    packed = matrix.packbits()
+    assert packed.shape == (len(matrix.dates), 1)
+    np.testing.assert_array_equal(np.unpackbits(packed, axis=1, bitorder="little")[:, :6], matrix.values)
+
+    assert mcal.trading_day_matrix(names, "2017-01-31", "2017-01-01").values.shape == (0, 5)
+
+
+def test_trading_day_matrix_reducers():
+    matrix = mcal.trading_day_matrix(["NYSE", "LSE", "XHKG"], "2016-12-01", "2017-01-31")
+    frame = matrix.to_frame()
+
+    np.testing.assert_array_equal(matrix.all_open(), frame.all(axis=1))
+    np.testing.assert_array_equal(matrix.any_open(["NYSE", "LSE"]), frame[["NYSE", "LSE"]].any(axis=1))
+    np.testing.assert_array_equal(matrix.count_open(), frame.sum(axis=1))
+    np.testing.assert_array_equal(matrix.all_open("NYSE"), frame["NYSE"])
+
+    # NYSE is closed on Dec 26th and Jan 2nd, LSE on Dec 26th, Dec 27th and Jan 2nd
+    assert matrix.next_common_open("2016-12-23 15:00", ["NYSE", "LSE"]) == pd.Timestamp("2016-12-23")
+    assert matrix.next_common_open("2016-12-24", ["NYSE", "LSE"]) == pd.Timestamp("2016-12-28")
+    pd.testing.assert_index_equal(
+        matrix.next_common_open(["2016-12-31", "2017-01-31", "2017-02-01", None], ["NYSE", "LSE"]),
+        pd.DatetimeIndex(["2017-01-03", "2017-01-31", None, None], dtype=matrix.dates.dtype),
+    )
+    assert matrix.next_common_open("2016-12-24") == pd.Timestamp("2016-12-28")
+
+    with pytest.raises(KeyError):
+        matrix.all_open(["CME_Equity"])
+
+
+def test_trading_day_matrix_names():
+    # aliases are named after the calendar, and can be looked up by any of their names
+    matrix = mcal.trading_day_matrix(["stock", mcal.get_calendar("LSE")], "2016-12-01", "2017-01-31")
+    assert matrix.names == ["NYSE", "LSE"]
+    expected = matrix.to_frame()["NYSE"].to_numpy()
+    for name in ["NYSE", "stock", "NASDAQ", mcal.get_calendar("NYSE")]:
+        np.testing.assert_array_equal(matrix.all_open([name]), expected)
+
+    with pytest.raises(ValueError, match="NYSE"):
+        mcal.trading_day_matrix(["NYSE", "stock"], "2016-12-01", "2017-01-31")
+    with pytest.raises(KeyError):
+        matrix.all_open(["XHKG"])
+    with pytest.raises(KeyError):
+        matrix.all_open(["unknown"])
@@ -1,11 +1,16 @@
 import datetime
+import itertools
+import subprocess
+import sys
 
+import numpy as np
 import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal, assert_series_equal
 from zoneinfo import ZoneInfo
 
 import pandas_market_calendars as mcal
+from pandas_market_calendars import calendar_utils as u
 from pandas_market_calendars.calendars.nyse import NYSEExchangeCalendar
 from tests.test_market_calendar import FakeBreakCalendar, FakeCalendar, FakeETHCalendar
 
@@ -25,6 +30,93 @@ def test_get_calendar_names():
     assert "ASX" in mcal.get_calendar_names()
 
 
+def test_lazy_calendar_registry():
+    # only the module of the requested calendar is imported
+    code = (
+        "import sys; import pandas_market_calendars as mcal; "
+        "assert not [m for m in sys.modules if m.startswith(('exchange_calendars', 'pandas_market_calendars.calendars.'))]; "
+        "mcal.get_calendar('NYSE'); "
+        "assert 'pandas_market_calendars.calendars.nyse' in sys.modules; "
+        "assert 'pandas_market_calendars.calendars.cme' not in sys.modules; "
+        "assert 'exchange_calendars' not in sys.modules; "
+        "mcal.get_calendar('XNYS'); "
+        "assert 'exchange_calendars' in sys.modules; "
+        # of the mirrored calendars, only the classes that are requested are created
+        "from pandas_market_calendars.calendars import mirror; "
+        "assert 'XNYSExchangeCalendar' in vars(mirror) and 'XLONExchangeCalendar' not in vars(mirror); "
+        "assert 'XLON' in mcal.MarketCalendar.calendar_names()"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+    # looking up classes by name imports only their module, listing the names imports exchange_calendars
+    code = (
+        "import sys; import pandas_market_calendars as mcal; "
+        "from pandas_market_calendars import calendar_registry; "
+        "assert not hasattr(calendar_registry, 'pd') and not hasattr(calendar_registry, 'Holiday'); "
+        "assert not [m for m in sys.modules if m.startswith(('exchange_calendars', 'pandas_market_calendars.calendars.'))]; "
+        "assert mcal.MarketCalendar.factory('NYSE').__module__ == 'pandas_market_calendars.calendars.nyse'; "
+        "assert calendar_registry.CMEEquityExchangeCalendar.__module__ == 'pandas_market_calendars.calendars.cme'; "
+        "assert 'pandas_market_calendars.calendars.sse' not in sys.modules; "
+        "assert 'exchange_calendars' not in sys.modules; "
+        "names = mcal.get_calendar_names(); "
+        "import exchange_calendars; "
+        "assert 'NYSE' in names and 'XLON' in names; "
+        "assert set(names) == set(mcal.MarketCalendar.calendar_names()); "
+        "assert set(exchange_calendars.get_calendar_names(include_aliases=False)) <= set(names)"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+    # a name of exchange_calendars is found without listing the names first
+    code = (
+        "import pandas_market_calendars as mcal; "
+        "assert mcal.MarketCalendar.factory('XLON').name == 'XLON'; "
+        "from pandas_market_calendars import calendar_registry; "
+        "assert calendar_registry.XHKGExchangeCalendar().name == 'XHKG'"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+    # the module attributes create the mirrored classes through the registry, once even when requested concurrently
+    code = (
+        "from concurrent.futures import ThreadPoolExecutor; "
+        "import pandas_market_calendars as mcal; "
+        "from pandas_market_calendars.calendars import mirror; "
+        "classes = list(ThreadPoolExecutor(8).map(lambda _: mirror.XLONExchangeCalendar, range(16))); "
+        "registry = mcal.MarketCalendar._regmeta_class_registry; "
+        "assert all(cal is registry['XLON'] for cal in classes); "
+        "assert 'XLON' not in registry.loaders"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+    # the table of names matches what the calendar modules register
+    from pandas_market_calendars import calendar_registry
+
+    for module in calendar_registry._CALENDAR_MODULES:
+        calendar_registry._import_calendars(module)
+    registry = mcal.MarketCalendar._regmeta_class_registry
+    for name, module in calendar_registry._CALENDAR_NAMES.items():
+        assert registry[name].__module__ == f"pandas_market_calendars.calendars.{module}", name
+    assert set(mcal.MarketCalendar.calendar_names()) == set(mcal.get_calendar_names())
+
+    # the names of the installed exchange_calendars outside the table are mirrored as f"{name}ExchangeCalendar"
+    import exchange_calendars
+
+    mirror = calendar_registry._import_calendars("mirror")
+    others = set(exchange_calendars.get_calendar_names(include_aliases=False)) - set(calendar_registry._CALENDAR_NAMES)
+    assert others <= set(mcal.get_calendar_names())
+    for name in others:
+        assert registry[name] is getattr(mirror, f"{name}ExchangeCalendar"), name
+
+    # and the table of classes matches the modules that define them
+    for name, module in calendar_registry._CALENDAR_CLASSES.items():
+        assert getattr(calendar_registry, name) is getattr(calendar_registry._import_calendars(module), name), name
+
+    from pandas_market_calendars.calendar_registry import NYSEExchangeCalendar as Imported
+
+    assert Imported is NYSEExchangeCalendar
+    with pytest.raises(AttributeError):
+        calendar_registry.NotACalendar
+
+
 def test_merge_schedules():
     cal1 = FakeCalendar()
     cal2 = NYSEExchangeCalendar()
@@ -105,6 +197,100 @@ def test_merge_schedules_w_break():
     assert "break_end" not in result.columns
 
 
+def test_merge_sessions():
+    sch1 = FakeCalendar().schedule("2016-07-01", "2016-07-06")
+    sch2 = NYSEExchangeCalendar().schedule("2016-07-01", "2016-07-06")
+
+    # the two markets are open one after the other, the gap in between is the break
+    expected = pd.DataFrame(
+        {
+            "market_open": pd.DatetimeIndex(
+                ["2016-07-01 02:13", "2016-07-04 02:13", "2016-07-05 02:13", "2016-07-06 02:13"], tz="UTC"
+            ),
+            "break_start": pd.DatetimeIndex(
+                ["2016-07-01 02:49", None, "2016-07-05 02:49", "2016-07-06 02:49"], tz="UTC"
+            ),
+            "break_end": pd.DatetimeIndex(["2016-07-01 13:30", None, "2016-07-05 13:30", "2016-07-06 13:30"], tz="UTC"),
+            "market_close": pd.DatetimeIndex(
+                ["2016-07-01 20:00", "2016-07-04 02:49", "2016-07-05 20:00", "2016-07-06 20:00"], tz="UTC"
+            ),
+        },
+        index=pd.DatetimeIndex(["2016-07-01", "2016-07-04", "2016-07-05", "2016-07-06"]),
+    )
+    actual, intervals = mcal.merge_sessions([sch1, sch2], how="union")
+    assert_frame_equal(actual, expected)
+    assert intervals.shape == (7, 2)
+    assert intervals[1].tolist() == [pd.Timestamp("2016-07-01 13:30").value, pd.Timestamp("2016-07-01 20:00").value]
+
+    actual, intervals = mcal.merge_sessions([sch1, sch2], how="intersection")
+    assert actual.empty
+    assert intervals.shape == (0, 2)
+
+    actual, _ = mcal.merge_sessions([sch1, sch2], how="difference")
+    assert_frame_equal(actual, sch1)
+
+    with pytest.raises(ValueError):
+        mcal.merge_sessions([sch1, sch2], how="outer")
+
+
+def test_merge_sessions_other_times():
+    nyse, lse = mcal.get_calendar("NYSE"), mcal.get_calendar("LSE")
+    nyse.add_time("auction", datetime.time(15, 50))
+    lse.add_time("auction", datetime.time(16, 30))
+    sch1 = nyse.schedule("2024-12-20", "2024-12-31", market_times=["market_open", "market_close", "auction"])
+    sch2 = lse.schedule("2024-12-20", "2024-12-31", market_times=["market_open", "market_close", "auction"])
+
+    # the latest of the times after market_open for union, the earliest for intersection
+    union, _ = mcal.merge_sessions([sch1, sch2], how="union")
+    assert list(union.columns) == ["market_open", "break_start", "break_end", "market_close", "auction"]
+    assert_series_equal(union["auction"], sch1["auction"].dt.tz_convert("UTC"), check_names=False, check_freq=False)
+
+    intersection, _ = mcal.merge_sessions([sch1, sch2], how="intersection")
+    assert intersection.loc["2024-12-20", "auction"] == pd.Timestamp("2024-12-20 16:30", tz="UTC")
+
+    # the times of the first schedule for difference, NaT where it has no session
+    difference, _ = mcal.merge_sessions([sch2, sch1], how="difference")
+    assert difference["auction"].tolist() == sch2["auction"].reindex(difference.index).tolist()
+
+
+@pytest.mark.parametrize(
+    "how, calendars",
+    [
+        ("union", ["CME_Equity", "XHKG", "LSE"]),
+        ("intersection", ["CME_Equity", "LSE"]),
+        ("difference", ["XHKG", "LSE"]),
+    ],
+)
+def test_merge_sessions_open_at_times(how, calendars):
+    schedules = [NYSEExchangeCalendar().schedule("2016-12-01", "2017-01-31", market_times="all")]
+    schedules.append(FakeBreakCalendar().schedule("2016-12-01", "2017-01-31"))
+    schedules += [mcal.get_calendar(name).schedule("2016-12-01", "2017-01-31") for name in calendars]
+    timestamps = pd.date_range("2016-12-05", "2017-01-25", freq="7min", tz="UTC")
+    for sch in schedules:
+        timestamps = timestamps.append(pd.DatetimeIndex(sch.stack()).tz_convert("UTC"))
+    timestamps = timestamps[(timestamps >= "2016-12-05") & (timestamps < "2017-01-25")].sort_values()
+
+    # open_at_times of the merged schedule agrees with the open_at_times of the schedules that were merged
+    xhkg = mcal.get_calendar("XHKG")  # its market times include breaks, pre and post are dropped first
+    is_open = [xhkg.open_at_times(sch.drop(columns=["pre", "post"], errors="ignore"), timestamps) for sch in schedules]
+    expected = {
+        "union": np.logical_or.reduce(is_open),
+        "intersection": np.logical_and.reduce(is_open),
+        "difference": is_open[0] & ~np.logical_or.reduce(is_open[1:]),
+    }[how]
+    actual, intervals = mcal.merge_sessions(schedules, how=how)
+    assert not actual.empty
+    np.testing.assert_array_equal(xhkg.open_at_times(actual.drop(columns=["pre", "post"]), timestamps), expected)
+
+    times = u._asi8(timestamps)
+    ix = np.searchsorted(intervals[:, 0].view("int64"), times, "right") - 1
+    np.testing.assert_array_equal((ix >= 0) & (times < intervals[ix, 1].view("int64")), expected)
+
+    # pre and post hold the extent of the merge with the pre and post sessions
+    assert {"pre", "post"}.issubset(actual.columns)
+    assert (actual["pre"] <= actual["market_open"]).all() and (actual["post"] >= actual["market_close"]).all()
+
+
 def test_mark_session():
     cal = FakeETHCalendar()
     sched = cal.schedule("2020-01-01", "2020-02-01", market_times="all", tz=cal.tz)
@@ -291,3 +477,131 @@ def test_mark_session_edge_case():
         ),
         mcal.mark_session(sched, dt, closed="left"),
     )
+
+
+@pytest.mark.parametrize(
+    "cal, kwargs",
+    [
+        (FakeETHCalendar(), {"market_times": "all"}),
+        (FakeBreakCalendar(), {"market_times": "all"}),
+        (mcal.get_calendar("NYSE"), {"market_times": "all", "tz": "UTC"}),
+        (mcal.get_calendar("CME_Equity"), {}),
+    ],
+)
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize("label_map", [None, {"closed": -1}, {"pre": 1, "rth": 0, "post": 2, "closed": -1}])
+def test_mark_session_numpy_engine(cal, kwargs, closed, label_map):
+    sched = cal.schedule("2020-01-01", "2020-02-01", **kwargs)
+    dt = pd.date_range(sched.iloc[0, 0], sched.iloc[-1, -1], freq="7min").append(
+        pd.DatetimeIndex(sched.stack()).tz_convert("UTC")
+    )
+    dt = dt.sort_values().tz_convert(cal.tz)
+
+    expected = mcal.mark_session(sched, dt, label_map, closed=closed)
+    assert_series_equal(mcal.mark_session(sched, dt, label_map, closed=closed, engine="numpy"), expected)
+
+    codes, labels = mcal.mark_session_codes(sched, dt, label_map, closed=closed)
+    assert codes.dtype == "int8"
+    assert (codes >= 0).all()
+    assert (labels[codes] == expected.to_numpy()).all()
+
+
+def test_mark_session_codes():
+    NYSE = mcal.get_calendar("NYSE")
+    sched = NYSE.schedule("2015-12-25", "2016-01-05", market_times="all", tz="UTC")
+    dt = pd.date_range("2015-12-31T23:00", "2016-01-01T02:00", freq="30min", tz="UTC")
+
+    codes, labels = mcal.mark_session_codes(sched, dt, closed="left")
+    assert list(labels) == ["closed", "post", "pre", "rth"]
+    assert codes.tolist() == [1, 1, 1, 1, 0, 0, 0]
+
+    # like the NaN of mark_session, -1 marks a timestamp that is on the very first edge of the schedule
+    sched = mcal.get_calendar("24/7").schedule("2020-01-01", "2020-01-03")
+    dt = pd.DatetimeIndex(["2020-01-01 00:00", "2020-01-01 12:00"], tz="UTC")
+    codes, labels = mcal.mark_session_codes(sched, dt)
+    assert codes.tolist() == [-1, 1]
+    assert mcal.mark_session(sched, dt, engine="numpy").isna().tolist() == [True, False]
+
+    with pytest.raises(ValueError):
+        mcal.mark_session(sched, dt, engine="other")
+
+
+@pytest.mark.parametrize(
+    "cal, market_times",
+    [
+        (FakeETHCalendar(), "all"),
+        (FakeBreakCalendar(), "all"),
+        (mcal.get_calendar("NYSE"), "all"),
+        (mcal.get_calendar("CME_Equity"), None),
+    ],
+)
+@pytest.mark.parametrize("closed", ["left", "right"])
+def test_session_marker(cal, market_times, closed):
+    sched = cal.schedule("2019-12-01", "2020-03-01", market_times=market_times)
+    dt = pd.date_range("2020-01-01", "2020-02-01", freq="7min", tz="UTC").append(
+        pd.DatetimeIndex(sched.stack()).tz_convert("UTC")
+    )
+    dt = dt[(dt >= "2020-01-01") & (dt < "2020-02-01")].sort_values().tz_convert(cal.tz)
+    expected = mcal.mark_session(sched, dt, {"closed": -1}, closed=closed)
+
+    # a short window makes the marker move on to new windows a few times
+    marker = mcal.SessionMarker(cal, label_map={"closed": -1}, closed=closed, market_times=market_times, days=5)
+    batches, i = [], 0
+    for size in itertools.cycle([1, 7, 300]):
+        if i >= len(dt):
+            break
+        batches.append(marker.mark(dt[i : i + size]))
+        i += size
+    assert_series_equal(pd.concat(batches), expected)
+
+    # going back in time
+    for i in range(len(dt) - 1, 0, -500):
+        assert marker.mark(dt[i : i + 3]).tolist() == expected.iloc[i : i + 3].tolist()
+
+
+def test_session_marker_codes():
+    NYSE = mcal.get_calendar("NYSE")
+    sched = NYSE.schedule("2015-12-25", "2016-01-05", market_times="all")
+    marker = mcal.SessionMarker(NYSE, sched, closed="left")
+    assert marker.market_times == ["pre", "market_open", "market_close", "post"]
+    assert list(marker.labels) == ["closed", "post", "pre", "rth"]
+
+    dt = pd.date_range("2015-12-31T23:00", "2016-01-01T02:00", freq="30min", tz="UTC")
+    assert marker.mark_codes(dt).tolist() == [1, 1, 1, 1, 0, 0, 0]
+    assert marker.mark_codes(dt[:0]).tolist() == []
+
+    # runs past the schedule
+    dt = pd.DatetimeIndex(["2016-02-01 08:00", "2016-02-01 15:00", "2016-02-01 21:30"], tz="UTC")
+    assert marker.mark(dt).tolist() == ["closed", "rth", "post"]
+
+
+def test_session_marker_long_closure():
+    # the 1996 Spring Festival closure of the SSE lasted from February 17th to March 3rd
+    sse = mcal.get_calendar("SSE")
+    dt = pd.date_range("1996-02-24", "1996-03-04 04:00", freq="6h", tz="UTC")
+    expected = mcal.mark_session(sse.schedule("1996-02-01", "1996-03-31"), dt)
+    assert expected.iloc[:-1].eq("closed").all()
+    assert_series_equal(mcal.SessionMarker(sse).mark(dt), expected)
+
+
+def test_int64_conversions():
+    # without the .unit/.as_unit API of pandas 2
+    index = pd.DatetimeIndex(["2024-01-02 14:30", None], tz="America/New_York")
+    values = u._asi8(index)
+    assert values[0] == pd.Timestamp("2024-01-02 19:30", tz="UTC").value
+    assert values[1] == np.iinfo(np.int64).min
+    assert u._unit(index.dtype) == u._unit(pd.Series(index).dtype)
+
+    back = u._datetime_index(values, tz="America/New_York", as_unit=u._unit(index.dtype))
+    pd.testing.assert_index_equal(back, index)
+    assert u._asi8(index, "s")[0] == values[0] // 10**9
+
+
+def test_days_index_out_of_bounds():
+    days = np.array(["1677-09-22", "2262-04-11", "NaT"], dtype="datetime64[D]")
+    pd.testing.assert_index_equal(
+        u._days_index(days, "datetime64[ns]"), pd.DatetimeIndex(days.astype("datetime64[ns]"))
+    )
+    for day in ("1677-09-21", "2262-04-12", "9999-12-31"):
+        with pytest.raises(pd.errors.OutOfBoundsDatetime):
+            u._days_index(np.array([day], dtype="datetime64[D]"), "datetime64[ns]")
@@ -51,3 +51,28 @@ def test_xtae_sunday_close():
     )
 
     assert_series_equal(actual["market_close"], expected)
+
+
+def test_xtae_weekmask_transition():
+    cal = mcal.get_calendar("XTAE")
+
+    actual = cal.valid_days("2025-12-25", "2026-01-10", tz=None)
+    expected = pd.DatetimeIndex(
+        [
+            "2025-12-25",
+            "2025-12-28",
+            "2025-12-29",
+            "2025-12-30",
+            "2025-12-31",
+            "2026-01-01",
+            "2026-01-04",  # last Sunday session
+            "2026-01-05",
+            "2026-01-06",
+            "2026-01-07",
+            "2026-01-08",
+            "2026-01-09",  # first Friday session
+        ]
+    )
+    assert_index_equal(actual, expected)
+    assert cal.is_trading_day("2026-01-04")
+    assert not cal.is_trading_day("2026-01-11")